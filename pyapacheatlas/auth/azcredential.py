@@ -1,6 +1,7 @@
 from datetime import datetime
 
 from .base import AtlasAuthBase
+from .tokens import FileTokenCache, TokenManager
 
 
 class AzCredentialWrapper(AtlasAuthBase):
@@ -8,29 +9,87 @@ class AzCredentialWrapper(AtlasAuthBase):
     Thin wrapper around azure.core.credentials.TokenCredential
     """
 
-    def __init__(self, credential):
+    def __init__(self, credential, refresh_margin=300, background_refresh=True,
+                 token_cache=None, tenant_id=None, client_id=None):
         """
         :param azure.core.credentials.TokenCredential credential:
             The azure-identity credential you've provided. You most
             likely want to provide the DefaultAzureCredential().
+        :param int refresh_margin:
+            The seconds before a token expires that it is refreshed.
+            Defaults to 300.
+        :param bool background_refresh:
+            Whether to refresh the tokens that are in use on a background
+            thread before they expire. Defaults to True. Call `close` or use
+            the authentication as a context manager to stop the thread.
+        :param token_cache:
+            An optional cache to share tokens with other processes using the
+            same identity. Requires the client_id.
+        :type token_cache: :class:`~pyapacheatlas.auth.tokens.FileTokenCache`
+        :param str tenant_id: The tenant of the identity used in the cache key.
+        :param str client_id:
+            The client id of the identity used in the cache key. A credential
+            does not expose which identity it uses, so this must be provided
+            to use a token_cache.
         """
         super().__init__()
+        if token_cache is not None and client_id is None:
+            raise ValueError(
+                "A client_id is required to use a token_cache with an Azure credential.")
 
         self._resource_scope = "73c2949e-da2d-457a-9607-fcc665198967/.default"
+        self._graph_scope = "https://graph.microsoft.com/.default"
         self._credential = credential
-        self.access_token = None
-        self.expiration = datetime.now()
-        self.graph_access_token = None
-        self.graph_expiration = datetime.now()
+        # The catalog and graph tokens share one manager
+        self.token_manager = TokenManager(
+            self._fetch_token, refresh_margin=refresh_margin,
+            background_refresh=background_refresh, token_cache=token_cache,
+            cache_key=lambda scope: FileTokenCache.make_key(
+                tenant_id, client_id, scope))
+
+    def _fetch_token(self, scope):
+        """
+        Request an access token for the given scope from the credential.
+
+        :param str scope: The scope of the token.
+        :return: The access token and the epoch seconds it expires on.
+        :rtype: tuple(str, int)
+        """
+        token_req = self._credential.get_token(scope)
+        return token_req.token, token_req.expires_on
+
+    def close(self):
+        """
+        Stop refreshing the tokens on a background thread. Tokens are still
+        fetched when a request needs them.
+        """
+        self.token_manager.close()
+
+    def _cached(self, scope):
+        token = self.token_manager.cached_token(scope)
+        return (token.token, datetime.fromtimestamp(token.expires_on)) if token else (None, datetime.now())
+
+    @property
+    def access_token(self):
+        return self._cached(self._resource_scope)[0]
+
+    @property
+    def expiration(self):
+        return self._cached(self._resource_scope)[1]
+
+    @property
+    def graph_access_token(self):
+        return self._cached(self._graph_scope)[0]
+
+    @property
+    def graph_expiration(self):
+        return self._cached(self._graph_scope)[1]
 
     def _set_access_token(self):
         """
         Sets the access token for your session.
         """
-
-        token_req = self._credential.get_token(self._resource_scope)
-        self.access_token = token_req.token
-        self.expiration = datetime.fromtimestamp(token_req.expires_on)
+        self.token_manager.refresh(self._resource_scope)
 
     def get_authentication_headers(self):
         """
@@ -39,11 +98,10 @@ class AzCredentialWrapper(AtlasAuthBase):
         :return: The authorization headers.
         :rtype: dict(str, str)
         """
-        if self.expiration <= datetime.now():
-            self._set_access_token()
+        token = self.token_manager.get_token(self._resource_scope)
 
         return {
-            "Authorization": "Bearer " + self.access_token,
+            "Authorization": "Bearer " + token.token,
             "Content-Type": "application/json"
         }
 
@@ -51,10 +109,7 @@ class AzCredentialWrapper(AtlasAuthBase):
         """
         Sets the microsoft graph access token for your session.
         """
-        token_req = self._credential.get_token(
-            "https://graph.microsoft.com/.default")
-        self.graph_access_token = token_req.token
-        self.graph_expiration = datetime.fromtimestamp(token_req.expires_on)
+        self.token_manager.refresh(self._graph_scope)
 
     def get_graph_authentication_headers(self):
         """
@@ -63,10 +118,9 @@ class AzCredentialWrapper(AtlasAuthBase):
         :return: The authorization headers.
         :rtype: dict(str, str)
         """
-        if self.graph_expiration <= datetime.now():
-            self._set_graph_access_token()
+        token = self.token_manager.get_token(self._graph_scope)
 
         return {
-            "Authorization": "Bearer " + self.graph_access_token,
+            "Authorization": "Bearer " + token.token,
             "Content-Type": "application/json"
         }
@@ -5,11 +5,27 @@ from abc import abstractmethod
 class AtlasAuthBase(ABC):
     """
     The base class for authentication to your Apache Atlas server.
+
+    An authentication can be used as a context manager to close it when
+    you are done with it.
     """
 
     def __init__(self):
         super().__init__()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Release the resources held by the authentication, such as a thread
+        that refreshes its tokens. It can still be used afterwards.
+        """
+        pass
+
     @abstractmethod
     def get_authentication_headers(self, **kwargs):
         """
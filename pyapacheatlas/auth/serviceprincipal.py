@@ -3,6 +3,7 @@ import json
 import requests
 
 from .base import AtlasAuthBase
+from .tokens import FileTokenCache, TokenManager
 
 
 class ServicePrincipalAuthentication(AtlasAuthBase):
@@ -10,13 +11,24 @@ class ServicePrincipalAuthentication(AtlasAuthBase):
     Authenticates to the Azure OAuth provider using a service principal.
     """
 
-    def __init__(self, tenant_id, client_id, client_secret):
+    def __init__(self, tenant_id, client_id, client_secret, refresh_margin=300, background_refresh=True, token_cache=None):
         """
         :param str tenant_id: The tenant id of your Azure subscription.
         :param str client_id: The client id or application id of your
             service principal.
         :param str client_secret: The client secret or application secret
             of your service principal.
+        :param int refresh_margin:
+            The seconds before a token expires that it is refreshed.
+            Defaults to 300.
+        :param bool background_refresh:
+            Whether to refresh the tokens that are in use on a background
+            thread before they expire. Defaults to True. Call `close` or use
+            the authentication as a context manager to stop the thread.
+        :param token_cache:
+            An optional cache to share tokens with other processes using the
+            same tenant and client id.
+        :type token_cache: :class:`~pyapacheatlas.auth.tokens.FileTokenCache`
         """
         super().__init__()
 
@@ -38,23 +50,62 @@ class ServicePrincipalAuthentication(AtlasAuthBase):
             "grant_type": "client_credentials",
             "client_secret": client_secret
         }
-        self.access_token = None
-        self.expiration = datetime.now()
-        self.graph_access_token = None
-        self.graph_expiration = datetime.now()
+        # The catalog and graph tokens share one manager
+        self.token_manager = TokenManager(
+            self._fetch_token, refresh_margin=refresh_margin,
+            background_refresh=background_refresh, token_cache=token_cache,
+            cache_key=lambda resource: FileTokenCache.make_key(
+                tenant_id, client_id, resource))
 
-    def _set_access_token(self):
+    def _fetch_token(self, resource):
         """
-        Sets the access token for your session.
+        Request an access token for the given resource.
+
+        :param str resource: The resource id of the token.
+        :return: The access token and the epoch seconds it expires on.
+        :rtype: tuple(str, int)
         """
-        authResponse = requests.post(self.ouath_url, data=self.data)
+        authResponse = requests.post(
+            self.ouath_url, data=dict(self.data, resource=resource))
         if authResponse.status_code != 200:
             authResponse.raise_for_status()
 
         authJson = json.loads(authResponse.text)
 
-        self.access_token = authJson["access_token"]
-        self.expiration = datetime.fromtimestamp(int(authJson["expires_on"]))
+        return authJson["access_token"], int(authJson["expires_on"])
+
+    def close(self):
+        """
+        Stop refreshing the tokens on a background thread. Tokens are still
+        fetched when a request needs them.
+        """
+        self.token_manager.close()
+
+    def _cached(self, resource):
+        token = self.token_manager.cached_token(resource)
+        return (token.token, datetime.fromtimestamp(token.expires_on)) if token else (None, datetime.now())
+
+    @property
+    def access_token(self):
+        return self._cached(self.data["resource"])[0]
+
+    @property
+    def expiration(self):
+        return self._cached(self.data["resource"])[1]
+
+    @property
+    def graph_access_token(self):
+        return self._cached(self._graph_data["resource"])[0]
+
+    @property
+    def graph_expiration(self):
+        return self._cached(self._graph_data["resource"])[1]
+
+    def _set_access_token(self):
+        """
+        Sets the access token for your session.
+        """
+        self.token_manager.refresh(self.data["resource"])
 
     def get_authentication_headers(self):
         """
@@ -63,11 +114,10 @@ class ServicePrincipalAuthentication(AtlasAuthBase):
         :return: The authorization headers.
         :rtype: dict(str, str)
         """
-        if self.expiration <= datetime.now():
-            self._set_access_token()
+        token = self.token_manager.get_token(self.data["resource"])
 
         return {
-            "Authorization": "Bearer " + self.access_token,
+            "Authorization": "Bearer " + token.token,
             "Content-Type": "application/json"
         }
 
@@ -75,15 +125,7 @@ class ServicePrincipalAuthentication(AtlasAuthBase):
         """
         Sets the microsoft graph access token for your session.
         """
-        authResponse = requests.post(self.ouath_url, data=self._graph_data)
-        if authResponse.status_code != 200:
-            authResponse.raise_for_status()
-
-        authJson = json.loads(authResponse.text)
-
-        self.graph_access_token = authJson["access_token"]
-        self.graph_expiration = datetime.fromtimestamp(
-            int(authJson["expires_on"]))
+        self.token_manager.refresh(self._graph_data["resource"])
 
     def get_graph_authentication_headers(self):
         """
@@ -92,10 +134,9 @@ class ServicePrincipalAuthentication(AtlasAuthBase):
         :return: The authorization headers.
         :rtype: dict(str, str)
         """
-        if self.graph_expiration <= datetime.now():
-            self._set_graph_access_token()
+        token = self.token_manager.get_token(self._graph_data["resource"])
 
         return {
-            "Authorization": "Bearer " + self.graph_access_token,
+            "Authorization": "Bearer " + token.token,
             "Content-Type": "application/json"
         }
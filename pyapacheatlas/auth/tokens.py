@@ -0,0 +1,340 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Windows does not have fcntl but does have msvcrt
+    fcntl = None
+    import msvcrt
+
+
+AccessToken = namedtuple("AccessToken", ["token", "expires_on"])
+AccessToken.__doc__ = """
+An access token and the epoch seconds that it expires on.
+"""
+
+
+class TokenManager():
+    """
+    Keep the access tokens for one or more resources (audiences such as the
+    data catalog and MS Graph) fresh and share them between threads.
+
+    A token is refreshed on the request path when it is within
+    `refresh_margin` seconds of expiring, and only one thread fetches it
+    while the others wait for the result. When `background_refresh` is
+    True, a daemon thread refreshes each token once it is within twice the
+    margin of expiring so that requests rarely wait on the token endpoint.
+    Only tokens that were requested since they were last fetched are
+    refreshed in the background and the thread stops once no token is in
+    use, so an idle manager does not call the token endpoint. Call `close`
+    to stop the thread right away.
+
+    :param function fetch_token:
+        A function that takes a resource and returns a tuple of
+        (access token, expires on epoch seconds).
+    :param int refresh_margin:
+        The seconds before expiry that a token is considered stale.
+        Defaults to 300.
+    :param bool background_refresh:
+        Whether to refresh tokens on a background thread. Defaults to True.
+    :param token_cache:
+        An optional cache shared with other processes. Before fetching, a
+        token that another process stored in the cache is used if it is
+        valid for longer than the refresh margin.
+    :type token_cache: :class:`~pyapacheatlas.auth.tokens.FileTokenCache`
+    :param function cache_key:
+        A function that takes a resource and returns the key of its token
+        in the token_cache. Required when token_cache is provided.
+    """
+
+    RETRY_INTERVAL = 30
+
+    def __init__(self, fetch_token, refresh_margin=300, background_refresh=True,
+                 token_cache=None, cache_key=None):
+        super().__init__()
+        if token_cache is not None and cache_key is None:
+            raise ValueError("A cache_key is required to use a token_cache.")
+        self._fetch_token = fetch_token
+        self.token_cache = token_cache
+        self._cache_key = cache_key
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+        # {resource: AccessToken}
+        self._tokens = {}
+        # {resource: epoch seconds to refresh in the background}
+        self._refresh_at = {}
+        # The resources requested since their token was fetched
+        self._requested = set()
+        self._lock = threading.Lock()
+        self._resource_locks = {}
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+
+    def _lock_for(self, resource):
+        with self._lock:
+            return self._resource_locks.setdefault(resource, threading.Lock())
+
+    def _fetch(self, resource, use_cache=True):
+        """
+        Fetch and store a new token. Must be called with the resource lock.
+        """
+        token = None
+        current = self._tokens.get(resource)
+        if self.token_cache is not None and use_cache:
+            cached = self.token_cache.get(self._cache_key(resource))
+            # Only use a cached token that is newer than the one held here
+            # and will not immediately need to be refreshed again.
+            if (cached is not None and
+                    cached.expires_on - self.refresh_margin > time.time() and
+                    (current is None or cached.expires_on > current.expires_on)):
+                token = cached
+
+        if token is None:
+            token = AccessToken(*self._fetch_token(resource))
+            if self.token_cache is not None:
+                self.token_cache.set(self._cache_key(resource), token)
+
+        now = time.time()
+        with self._lock:
+            self._tokens[resource] = token
+            self._requested.discard(resource)
+            # Refresh within twice the margin of expiring, or halfway through
+            # the lifetime of tokens that are shorter than that.
+            self._refresh_at[resource] = max(
+                token.expires_on - 2 * self.refresh_margin,
+                now + (token.expires_on - now) / 2,
+                now + 1
+            )
+        self._start_background_refresh()
+        with self._condition:
+            self._condition.notify_all()
+        return token
+
+    def _ensure(self, resource, threshold):
+        """
+        Return the token for the resource, fetching a new one if it expires
+        within threshold seconds. Concurrent callers share a single fetch.
+        """
+        token = self._tokens.get(resource)
+        if token is not None and token.expires_on - threshold > time.time():
+            return token
+
+        with self._lock_for(resource):
+            token = self._tokens.get(resource)
+            if token is None or token.expires_on - threshold <= time.time():
+                token = self._fetch(
+                    resource, use_cache=threshold != float("inf"))
+        return token
+
+    def _refresh_if_current(self, resource, token):
+        """
+        Fetch a new token unless another thread already replaced `token`.
+        """
+        with self._lock_for(resource):
+            if self._tokens.get(resource) is token:
+                self._fetch(resource)
+
+    def get_token(self, resource):
+        """
+        Get an access token for the resource that is valid for at least the
+        refresh margin.
+
+        :param str resource: The resource or scope of the token.
+        :return: The access token.
+        :rtype: :class:`~pyapacheatlas.auth.tokens.AccessToken`
+        """
+        with self._lock:
+            self._requested.add(resource)
+        return self._ensure(resource, self.refresh_margin)
+
+    def cached_token(self, resource):
+        """
+        Get the access token held for the resource without refreshing it.
+
+        :param str resource: The resource or scope of the token.
+        :return: The access token or None if one has not been fetched.
+        :rtype: :class:`~pyapacheatlas.auth.tokens.AccessToken`
+        """
+        return self._tokens.get(resource)
+
+    def refresh(self, resource):
+        """
+        Fetch a new access token for the resource regardless of when the
+        current token expires.
+
+        :param str resource: The resource or scope of the token.
+        :return: The new access token.
+        :rtype: :class:`~pyapacheatlas.auth.tokens.AccessToken`
+        """
+        return self._ensure(resource, float("inf"))
+
+    def _start_background_refresh(self):
+        with self._lock:
+            if not self.background_refresh or self._thread is not None or self._closed:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="pyapacheatlas-token-refresh", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            now = time.time()
+            with self._lock:
+                due = []
+                for resource, at in list(self._refresh_at.items()):
+                    if at > now:
+                        continue
+                    if resource in self._requested:
+                        due.append((resource, self._tokens[resource]))
+                    else:
+                        # Idle tokens are fetched on the request path if
+                        # they are needed again
+                        del self._refresh_at[resource]
+
+            failed = False
+            for resource, token in due:
+                try:
+                    self._refresh_if_current(resource, token)
+                except Exception:
+                    # The request path raises the error if the token is
+                    # still stale when it is needed.
+                    failed = True
+
+            with self._condition:
+                if self._closed:
+                    break
+                with self._lock:
+                    next_refresh = min(self._refresh_at.values(), default=None)
+                    if next_refresh is None:
+                        # No token is in use. The next fetch starts a new thread.
+                        self._thread = None
+                        return
+                timeout = self.RETRY_INTERVAL if failed else \
+                    max(0, next_refresh - time.time())
+                self._condition.wait(timeout)
+
+    def close(self):
+        """
+        Stop the background refresh thread.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+
+
+@contextmanager
+def _file_lock(lock_path):
+    """
+    Hold an exclusive lock on the lock_path across processes.
+    """
+    with open(lock_path, "a+") as fp:
+        if fcntl is not None:
+            fcntl.flock(fp.fileno(), fcntl.LOCK_EX)
+        else:
+            fp.seek(0)
+            msvcrt.locking(fp.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fp.fileno(), fcntl.LOCK_UN)
+            else:
+                fp.seek(0)
+                msvcrt.locking(fp.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class FileTokenCache():
+    """
+    A json file of access tokens shared by every process on a machine.
+    Tokens are keyed by tenant, client, and resource so that processes
+    started within a token's lifetime can reuse it without calling the
+    token endpoint. Reads and writes hold a file lock and the file is only
+    readable by the current user.
+
+    .. code-block:: python
+
+        auth = ServicePrincipalAuthentication(
+            tenant_id, client_id, client_secret,
+            token_cache=FileTokenCache()
+        )
+
+    :param str path:
+        The json file to store tokens in. Defaults to
+        `~/.pyapacheatlas/token_cache.json`.
+    """
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path or os.path.join(
+            os.path.expanduser("~"), ".pyapacheatlas", "token_cache.json")
+        self._lock_path = self.path + ".lock"
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(tenant_id, client_id, resource):
+        """
+        Create the key of a token in the cache.
+
+        :param str tenant_id: The tenant that issued the token.
+        :param str client_id: The client (application) the token is for.
+        :param str resource: The resource or scope of the token.
+        :return: The key of the token.
+        :rtype: str
+        """
+        return "|".join([str(tenant_id), str(client_id), str(resource)])
+
+    def _read(self):
+        try:
+            with open(self.path, "r") as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            # A missing or corrupt cache is treated as empty
+            return {}
+
+    def _write(self, tokens):
+        temp_path = self.path + ".tmp"
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as fp:
+            json.dump(tokens, fp)
+        os.replace(temp_path, self.path)
+
+    def get(self, key):
+        """
+        Get an unexpired token from the cache.
+
+        :param str key: The key from `make_key`.
+        :return: The cached token or None.
+        :rtype: :class:`~pyapacheatlas.auth.tokens.AccessToken`
+        """
+        with _file_lock(self._lock_path):
+            entry = self._read().get(key)
+        if entry is None or entry["expires_on"] <= time.time():
+            return None
+        return AccessToken(entry["token"], entry["expires_on"])
+
+    def set(self, key, token):
+        """
+        Store a token in the cache and drop any expired tokens.
+
+        :param str key: The key from `make_key`.
+        :param token: The token to store.
+        :type token: :class:`~pyapacheatlas.auth.tokens.AccessToken`
+        """
+        with _file_lock(self._lock_path):
+            now = time.time()
+            tokens = {k: v for k, v in self._read().items()
+                      if v["expires_on"] > now}
+            tokens[key] = {"token": token.token,
+                           "expires_on": token.expires_on}
+            self._write(tokens)
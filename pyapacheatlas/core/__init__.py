@@ -1,5 +1,10 @@
 from .client import AtlasClient, PurviewClient
-from .entity import AtlasClassification, AtlasEntity, AtlasProcess
+from .entity import (
+    AtlasClassification,
+    AtlasEntity,
+    AtlasProcess,
+    RawAtlasEntity
+)
 from .typedef import (
     AtlasAttributeDef,
     ClassificationTypeDef,
@@ -1,16 +1,22 @@
-from .util import AtlasBaseClient, batch_dependent_entities, PurviewLimitation, PurviewOnly
+from .util import AtlasBaseClient, AtlasException, batch_dependent_entities, PurviewLimitation, PurviewOnly, _chunks, _is_not_found, _with_retries
 from .collections.purview import PurviewCollectionsClient
 from .glossary import GlossaryClient, PurviewGlossaryClient
 from .discovery.purview import PurviewDiscoveryClient
 from .typedef import BaseTypeDef, TypeCategory
 from .msgraph import MsGraphClient
 from .graphql import GraphQLClient
-from .entity import AtlasClassification, AtlasEntity
+from .entity import AtlasClassification, AtlasEntity, RawAtlasEntity
+from .migration import fetch_entities
+from .snapshot import SnapshotExporter, SnapshotImporter
 from ..auth.base import AtlasAuthBase
+from concurrent.futures import ThreadPoolExecutor
+import json
 import logging
 import re
 import warnings
 
+import requests
+
 _AZ_IDENTITY_INSTALLED = False
 try:
     import azure.identity
@@ -38,6 +44,32 @@ class AtlasClient(AtlasBaseClient):
             Kwargs to pass to the underlying `requests` package method call.
             For example passing `requests_verify = False` will supply `verify=False`
             to any API call.
+        :param json_codec:
+            The json codec used to encode request bodies and decode
+            responses. One of "json" (default), "orjson", "ujson", "auto", or
+            a :class:`~pyapacheatlas.core.codec.JsonCodec`.
+        :param bool lazy_responses:
+            Keep the raw bytes of each response and only decode them the
+            first time the body is accessed. Defaults to False.
+        :param bool compress_requests:
+            Gzip the json body of POST and PUT requests (for example
+            `/entity/bulk` uploads) and send it with a `Content-Encoding: gzip`
+            header. The server must accept gzip request bodies. Gzip responses
+            are always decompressed. Defaults to False.
+        :param int compression_threshold:
+            The minimum size in bytes of a body before it is compressed.
+            Defaults to 16384.
+        :param int compression_level:
+            The gzip compression level from 1 (fastest) to 9 (smallest).
+            Defaults to 6.
+        :param hooks:
+            Instrumentation called before each request and after each
+            response with the method, route template, status code, bytes
+            sent and received, and latency. See
+            :mod:`~pyapacheatlas.core.instrumentation` for the built in
+            collectors.
+        :type hooks:
+            list(:class:`~pyapacheatlas.core.instrumentation.RequestHook`)
     """
 
     def __init__(self, endpoint_url, authentication=None, **kwargs):
@@ -55,14 +87,16 @@ class AtlasClient(AtlasBaseClient):
             requests_args = AtlasClient._parse_requests_args(**kwargs)
         else:
             requests_args = kwargs.pop("requests_args")
+        client_args = AtlasBaseClient._parse_client_args(**kwargs)
 
         if "glossary" not in kwargs:
             self.glossary = GlossaryClient(
-                endpoint_url, authentication, requests_args=requests_args)
+                endpoint_url, authentication, requests_args=requests_args,
+                **client_args)
         else:
             self.glossary = kwargs["glossary"]
 
-        super().__init__(requests_args=requests_args)
+        super().__init__(requests_args=requests_args, **client_args)
 
     def delete_entity(self, guid=None, qualifiedName=None, typeName=None):
         """
@@ -962,6 +996,138 @@ class AtlasClient(AtlasBaseClient):
         }
         return results
 
+    def classify_entities(self, classifications, force_update=False,
+                          chunk_size=100, max_workers=4, max_retries=3):
+        """
+        Apply classifications to many entities with as few requests as
+        possible.
+
+        The existing classifications of the entities are read with bulk
+        requests and each classification is sorted into an add or, if the
+        entity already has it, an update. Entities that get an identical
+        classification are classified together with
+        `/entity/bulk/classification` and the remaining adds and updates
+        are sent with one request per entity. The requests run
+        concurrently. When a bulk request fails, its entities are
+        classified one at a time so one entity does not fail the others.
+
+        .. code-block:: python
+
+            results = client.classify_entities({
+                table_guid: [AtlasClassification("PII")],
+                column_guid: [{"typeName": "PII"}, {"typeName": "Sensitive"}]
+            }, force_update=True)
+            print(results["errors"])
+
+        :param classifications:
+            A dict of guids and the classifications to apply to each one or
+            a list of (entity, classifications) pairs where the entity is a
+            guid, a dict with a guid, or an AtlasEntity with a guid.
+        :type classifications:
+            Union(dict(str, list(dict)),
+            list(tuple(Union(str, dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`),
+            list(Union(dict, :class:`~pyapacheatlas.core.entity.AtlasClassification`)))))
+        :param bool force_update:
+            Whether to update the classifications an entity already has.
+            They are skipped otherwise.
+        :param int chunk_size:
+            The number of guids in each bulk get and bulk classification.
+        :param int max_workers: The number of concurrent requests.
+        :param int max_retries:
+            The times to retry a failed read of the existing classifications.
+        :return:
+            The names of the classifications that were added ('adds'),
+            updated ('updates'), and skipped ('skipped') for each guid and
+            the error messages of each guid that failed ('errors').
+        :rtype: dict(str, dict(str, list(str)))
+        """
+        if isinstance(classifications, dict):
+            classifications = classifications.items()
+        wanted = {}
+        for entity, entity_classifications in classifications:
+            if isinstance(entity, AtlasEntity):
+                guid = entity.guid
+            elif isinstance(entity, dict):
+                guid = entity["guid"]
+            else:
+                guid = entity
+            if isinstance(entity_classifications, (dict, AtlasClassification)):
+                entity_classifications = [entity_classifications]
+            wanted.setdefault(str(guid), []).extend(
+                c.to_json() if isinstance(c, AtlasClassification) else c
+                for c in entity_classifications)
+
+        results = {"adds": {}, "updates": {}, "skipped": {}, "errors": {}}
+        existing = {}
+        for found, failed in fetch_entities(
+                self, list(wanted), chunk_size, max_workers, max_retries):
+            for entity in found:
+                # Propagated classifications can not be updated on this entity
+                existing[entity["guid"]] = {
+                    c["typeName"] for c in entity.get("classifications") or []
+                    if c.get("entityGuid") in (None, entity["guid"])}
+            for guid, error in failed.items():
+                results["errors"][guid] = [
+                    "The entity was not found." if _is_not_found(error) else str(error)]
+
+        # Group the adds by identical classifications to use the bulk api
+        add_groups = {}
+        updates = {}
+        for guid, entity_classifications in wanted.items():
+            if guid not in existing:
+                continue
+            for classification in entity_classifications:
+                if classification["typeName"] not in existing[guid]:
+                    key = json.dumps(classification, sort_keys=True)
+                    add_groups.setdefault(key, (classification, []))[1].append(guid)
+                elif force_update:
+                    updates.setdefault(guid, []).append(classification)
+                else:
+                    results["skipped"].setdefault(guid, []).append(classification["typeName"])
+
+        bulk_adds = []
+        single_adds = {}
+        for classification, guids in add_groups.values():
+            if len(guids) == 1:
+                single_adds.setdefault(guids[0], []).append(classification)
+            else:
+                bulk_adds.extend(
+                    (classification, chunk) for chunk in _chunks(guids, chunk_size))
+
+        def _per_entity(kind, guid, entity_classifications):
+            func = self._classify_entity_adds if kind == "adds" else self._classify_entity_updates
+            try:
+                func(guid, entity_classifications)
+                return [(guid, kind, entity_classifications, None)]
+            except (AtlasException, requests.RequestException) as e:
+                return [(guid, kind, entity_classifications, e)]
+
+        def _bulk(classification, guids):
+            try:
+                self._post_http(
+                    self.endpoint_url + "/entity/bulk/classification",
+                    json={"classification": classification, "entityGuids": guids})
+                return [(guid, "adds", [classification], None) for guid in guids]
+            except (AtlasException, requests.RequestException):
+                return [result for guid in guids
+                        for result in _per_entity("adds", guid, [classification])]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_bulk, c, g) for c, g in bulk_adds]
+            futures.extend(executor.submit(_per_entity, "adds", g, c)
+                           for g, c in single_adds.items())
+            futures.extend(executor.submit(_per_entity, "updates", g, c)
+                           for g, c in updates.items())
+            for future in futures:
+                for guid, kind, applied, error in future.result():
+                    if error is None:
+                        results[kind].setdefault(guid, []).extend(
+                            c["typeName"] for c in applied)
+                    else:
+                        results["errors"].setdefault(guid, []).append(str(error))
+
+        return results
+
     def declassify_entity(self, guid, classificationName):
         """
         Given an entity guid and a classification name, remove the
@@ -1150,13 +1316,16 @@ class AtlasClient(AtlasBaseClient):
         return results
 
     @staticmethod
-    def _prepare_entity_upload(batch):
+    def _prepare_entity_upload(batch, to_json=True):
         """
         Massages the batch to be in the right format and coerces to json/dict.
         Supports list of dicts, dict of single entity, dict of AtlasEntitiesWithExtInfo.
 
         :param batch: The batch of entities you want to upload.
         :type batch: Union(list(dict), dict))
+        :param bool to_json:
+            Whether to convert AtlasEntity objects in a list to dicts. When
+            False they are left for the json codec to convert while encoding.
         :return: Provides a dict formatted in the Atlas entity bulk upload.
         :rtype: dict(str, list(dict))
         """
@@ -1167,8 +1336,11 @@ class AtlasClient(AtlasBaseClient):
             # It's a list, so we're assuming it's a list of entities
             # Handles any type of AtlasEntity and mixed batches of dicts
             # and AtlasEntities
-            dict_batch = [e.to_json() if isinstance(
-                e, AtlasEntity) else e for e in batch]
+            if to_json:
+                dict_batch = [e.to_json() if isinstance(
+                    e, (AtlasEntity, RawAtlasEntity)) else e for e in batch]
+            else:
+                dict_batch = list(batch)
             payload = {"entities": dict_batch}
         elif isinstance(batch, dict):
             current_keys = list(batch.keys())
@@ -1180,7 +1352,7 @@ class AtlasClient(AtlasBaseClient):
                 # json, you know the schema and I will not support
                 # AtlasEntity here.
                 payload = {"entities": [batch]}
-        elif isinstance(batch, AtlasEntity):
+        elif isinstance(batch, (AtlasEntity, RawAtlasEntity)):
             payload = {"entities": [batch.to_json()]}
         else:
             raise NotImplementedError(
@@ -1194,10 +1366,12 @@ class AtlasClient(AtlasBaseClient):
 
         :param batch:
             The batch of entities you want to upload. Supports a single dict,
-            AtlasEntity, list of dicts, list of atlas entities.
+            AtlasEntity, list of dicts, list of atlas entities. Entity dicts
+            may be wrapped in a RawAtlasEntity.
         :type batch:
             Union(dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`,
-            list(dict), list(:class:`~pyapacheatlas.core.entity.AtlasEntity`) )
+            list(dict), list(:class:`~pyapacheatlas.core.entity.AtlasEntity`),
+            list(:class:`~pyapacheatlas.core.entity.RawAtlasEntity`) )
         :param int batch_size: The number of entities you want to send in bulk
         :return: The results of your bulk entity upload.
         :rtype: dict
@@ -1206,12 +1380,16 @@ class AtlasClient(AtlasBaseClient):
         results = None
         atlas_endpoint = self.endpoint_url + "/entity/bulk"
 
-        payload = AtlasClient._prepare_entity_upload(batch)
+        # AtlasEntity objects are converted by the codec while encoding
+        # unless they need to be inspected to split them into batches
+        payload = AtlasClient._prepare_entity_upload(batch, to_json=False)
 
         results = []
         if batch_size and len(payload["entities"]) > batch_size:
+            entities = [e.to_json() if isinstance(e, (AtlasEntity, RawAtlasEntity))
+                        else e for e in payload["entities"]]
             batches = [{"entities": x} for x in batch_dependent_entities(
-                payload["entities"], batch_size=batch_size)]
+                entities, batch_size=batch_size)]
 
             for batch_id, batch in enumerate(batches):
                 batch_size = len(batch["entities"])
@@ -1528,6 +1706,389 @@ class AtlasClient(AtlasBaseClient):
 
         return {"message": f"Successfully updated business metadata for {guid}"}
 
+    @staticmethod
+    def _entity_key(entity):
+        """
+        Turn a guid, (typeName, qualifiedName) tuple, dict, or AtlasEntity
+        into a guid string or (typeName, qualifiedName) tuple.
+        """
+        if isinstance(entity, AtlasEntity):
+            if entity.guid is not None and not str(entity.guid).startswith("-"):
+                return str(entity.guid)
+            return (entity.typeName, entity.qualifiedName)
+        if isinstance(entity, dict):
+            if entity.get("guid") is not None and not str(entity["guid"]).startswith("-"):
+                return str(entity["guid"])
+            qualified_name = entity.get("qualifiedName") or \
+                (entity.get("uniqueAttributes") or entity.get("attributes") or {}).get("qualifiedName")
+            return (entity["typeName"], qualified_name)
+        if isinstance(entity, (tuple, list)):
+            return tuple(entity)
+        return str(entity)
+
+    def _resolve_entities(self, keys, chunk_size=100, max_workers=4, max_retries=3):
+        """
+        Get the entities of guids and (typeName, qualifiedName) tuples with
+        concurrent bulk requests. A failed request does not stop the
+        others; its keys are returned with the error instead.
+
+        :return:
+            The entity of each key that was found and the error of each key
+            whose request failed.
+        :rtype:
+            tuple(dict(Union(str, tuple(str, str)), dict),
+            dict(Union(str, tuple(str, str)), Exception))
+        """
+        entities = {}
+        errors = {}
+        guids = [k for k in keys if isinstance(k, str)]
+        for found, failed in fetch_entities(self, guids, chunk_size, max_workers, max_retries):
+            entities.update({e["guid"]: e for e in found})
+            errors.update(failed)
+
+        names = {}
+        for key in keys:
+            if isinstance(key, tuple):
+                names.setdefault(key[0], []).append(key[1])
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (type_name, chunk, executor.submit(
+                    _with_retries, lambda t=type_name, c=chunk: self.get_entity(
+                        typeName=t, qualifiedName=c, minExtInfo=True), max_retries))
+                for type_name, qualified_names in names.items()
+                for chunk in _chunks(qualified_names, chunk_size)
+            ]
+            for type_name, chunk, future in futures:
+                try:
+                    response = future.result()
+                except (AtlasException, requests.RequestException) as e:
+                    errors.update({(type_name, name): e for name in chunk})
+                    continue
+                for entity in response.get("entities") or []:
+                    key = (entity["typeName"], entity["attributes"]["qualifiedName"])
+                    entities[key] = entity
+        return entities, errors
+
+    def _update_entities(self, changes, merge, single, fold=True,
+                         chunk_size=100, max_workers=4, max_retries=3):
+        """
+        Apply a change to many entities and report the outcome of each one.
+
+        The entities are resolved in bulk. With fold, `merge(entity, change)`
+        returns the labels and/or businessAttributes the entity should have
+        afterwards and the changes are written with `/entity/bulk`. Entities
+        of a failed bulk request and every entity without fold are updated
+        with `single(guid, change)`.
+        """
+        if isinstance(changes, dict):
+            changes = changes.items()
+        wanted = {}
+        for entity, change in changes:
+            wanted[self._entity_key(entity)] = change
+
+        resolved, errors = self._resolve_entities(
+            list(wanted), chunk_size, max_workers, max_retries)
+        rows = {}
+        for key in wanted:
+            entity = resolved.get(key)
+            rows[key] = {
+                "entity": key,
+                "guid": entity["guid"] if entity else None,
+                "status": "pending" if entity else "not_found",
+                "method": None,
+                "error": None if entity else "The entity was not found."
+            }
+            error = errors.get(key)
+            if error is not None and not _is_not_found(error):
+                rows[key].update({"status": "failed", "error": str(error)})
+        pending = [(key, resolved[key]) for key in wanted if key in resolved]
+
+        def _single(key, entity):
+            try:
+                _with_retries(lambda: single(entity["guid"], wanted[key]), max_retries)
+                return [(key, "entity", None)]
+            except (AtlasException, requests.RequestException) as e:
+                return [(key, "entity", e)]
+
+        def _bulk(chunk):
+            payload = []
+            params = {}
+            for key, entity in chunk:
+                update = merge(entity, wanted[key])
+                if "businessAttributes" in update:
+                    # The merged business attributes are the entity's complete set
+                    params = {"businessAttributeUpdateBehavior": "replace"} if self.is_purview \
+                        else {"replaceBusinessAttributes": True}
+                update.update({
+                    "typeName": entity["typeName"],
+                    "guid": entity["guid"],
+                    "attributes": {"qualifiedName": entity["attributes"]["qualifiedName"]}
+                })
+                payload.append(update)
+            try:
+                _with_retries(lambda: self._post_http(
+                    self.endpoint_url + "/entity/bulk",
+                    json={"entities": payload}, params=params), max_retries)
+                return [(key, "bulk", None) for key, _ in chunk]
+            except (AtlasException, requests.RequestException):
+                return [result for key, entity in chunk for result in _single(key, entity)]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if fold:
+                futures = [executor.submit(_bulk, chunk)
+                           for chunk in _chunks(pending, chunk_size)]
+            else:
+                futures = [executor.submit(_single, key, entity)
+                           for key, entity in pending]
+            for future in futures:
+                for key, method, error in future.result():
+                    rows[key].update({
+                        "status": "failed" if error else "updated",
+                        "method": method,
+                        "error": str(error) if error else None
+                    })
+
+        return list(rows.values())
+
+    def update_entities_labels(self, labels, force_update=False, fold=True,
+                               chunk_size=100, max_workers=4, max_retries=3):
+        """
+        Add (or with force_update, set) the labels of many entities.
+
+        The entities are found with bulk requests and their new labels are
+        written with `/entity/bulk` in chunks of `chunk_size`. Entities of a
+        chunk that fails, or every entity when fold is False, are updated
+        one request per entity with at most `max_workers` concurrent
+        requests. The labels are computed from the entity as it was read,
+        so a label added by someone else in between may be overwritten
+        when fold is True.
+
+        .. code-block:: python
+
+            rows = client.update_entities_labels({
+                "7e1c1ff5-...": ["finance"],
+                ("azure_sql_table", "mssql://server/db/dbo/sales"): ["finance", "pii"]
+            })
+            failed = [r for r in rows if r["status"] != "updated"]
+
+        :param labels:
+            A dict of entities and the labels for each one, or a list of
+            (entity, labels) pairs. An entity is a guid, a (typeName,
+            qualifiedName) tuple, a dict, or an AtlasEntity.
+        :type labels:
+            Union(dict(Union(str, tuple(str, str)), list(str)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), list(str))))
+        :param bool force_update:
+            Set to True to replace the existing labels rather than adding to them.
+        :param bool fold:
+            Whether to write the labels with `/entity/bulk`. Set to False to
+            use the label endpoint of each entity.
+        :param int chunk_size: The number of entities in each bulk request.
+        :param int max_workers: The number of concurrent requests.
+        :param int max_retries: The times to retry a failed request.
+        :return:
+            A row for each entity with the keys entity, guid, status
+            (updated, failed, or not_found), method (bulk or entity), and
+            error.
+        :rtype: list(dict)
+        """
+        def merge(entity, new_labels):
+            existing = [] if force_update else list(entity.get("labels") or [])
+            return {"labels": existing + [label for label in new_labels if label not in existing]}
+
+        return self._update_entities(
+            labels, merge,
+            lambda guid, new_labels: self.update_entity_labels(
+                new_labels, guid=guid, force_update=force_update),
+            fold, chunk_size, max_workers, max_retries)
+
+    def delete_entities_labels(self, labels, fold=True, chunk_size=100,
+                               max_workers=4, max_retries=3):
+        """
+        Remove labels from many entities. See
+        :meth:`~pyapacheatlas.core.client.AtlasClient.update_entities_labels`
+        for how the entities are identified and updated.
+
+        :param labels:
+            A dict of entities and the labels to remove from each one, or a
+            list of (entity, labels) pairs.
+        :type labels:
+            Union(dict(Union(str, tuple(str, str)), list(str)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), list(str))))
+        :param bool fold:
+            Whether to write the labels with `/entity/bulk`. Set to False to
+            use the label endpoint of each entity.
+        :param int chunk_size: The number of entities in each bulk request.
+        :param int max_workers: The number of concurrent requests.
+        :param int max_retries: The times to retry a failed request.
+        :return: A row for each entity with its guid, status, method, and error.
+        :rtype: list(dict)
+        """
+        def merge(entity, removed):
+            return {"labels": [label for label in entity.get("labels") or [] if label not in removed]}
+
+        return self._update_entities(
+            labels, merge,
+            lambda guid, removed: self.delete_entity_labels(removed, guid=guid),
+            fold, chunk_size, max_workers, max_retries)
+
+    def update_entities_businessMetadata(self, businessMetadata, force_update=False,
+                                         fold=True, chunk_size=100, max_workers=4,
+                                         max_retries=3):
+        """
+        Update the business metadata of many entities. See
+        :meth:`~pyapacheatlas.core.client.AtlasClient.update_entities_labels`
+        for how the entities are identified and updated.
+
+        .. code-block:: python
+
+            rows = client.update_entities_businessMetadata({
+                ("hive_table", "db.sales"): {"operations": {"expenseCode": "123"}}
+            })
+
+        :param businessMetadata:
+            A dict of entities and the business metadata of each one (in
+            the format of
+            :meth:`~pyapacheatlas.core.client.AtlasClient.update_businessMetadata`),
+            or a list of (entity, businessMetadata) pairs.
+        :type businessMetadata:
+            Union(dict(Union(str, tuple(str, str)), dict(str, dict)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), dict(str, dict))))
+        :param bool force_update:
+            Set to True to replace all of the existing business metadata
+            attributes rather than only the ones provided.
+        :param bool fold:
+            Whether to write the business metadata with `/entity/bulk`. Set
+            to False to use the business metadata endpoint of each entity.
+        :param int chunk_size: The number of entities in each bulk request.
+        :param int max_workers: The number of concurrent requests.
+        :param int max_retries: The times to retry a failed request.
+        :return: A row for each entity with its guid, status, method, and error.
+        :rtype: list(dict)
+        """
+        def merge(entity, business_metadata):
+            output = {} if force_update else {
+                k: dict(v) for k, v in (entity.get("businessAttributes") or {}).items()}
+            for type_name, attributes in business_metadata.items():
+                output.setdefault(type_name, {}).update(attributes)
+            return {"businessAttributes": output}
+
+        return self._update_entities(
+            businessMetadata, merge,
+            lambda guid, business_metadata: self.update_businessMetadata(
+                guid, business_metadata, force_update),
+            fold, chunk_size, max_workers, max_retries)
+
+    def delete_entities_businessMetadata(self, businessMetadata, fold=True,
+                                         chunk_size=100, max_workers=4,
+                                         max_retries=3):
+        """
+        Remove business metadata attributes from many entities. See
+        :meth:`~pyapacheatlas.core.client.AtlasClient.update_entities_labels`
+        for how the entities are identified and updated.
+
+        :param businessMetadata:
+            A dict of entities and the business metadata attributes to
+            remove (in the format of
+            :meth:`~pyapacheatlas.core.client.AtlasClient.delete_businessMetadata`),
+            or a list of (entity, businessMetadata) pairs.
+        :type businessMetadata:
+            Union(dict(Union(str, tuple(str, str)), dict(str, dict)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), dict(str, dict))))
+        :param bool fold:
+            Whether to write the business metadata with `/entity/bulk`. Set
+            to False to use the business metadata endpoint of each entity.
+        :param int chunk_size: The number of entities in each bulk request.
+        :param int max_workers: The number of concurrent requests.
+        :param int max_retries: The times to retry a failed request.
+        :return: A row for each entity with its guid, status, method, and error.
+        :rtype: list(dict)
+        """
+        def merge(entity, removed):
+            output = {}
+            for type_name, attributes in (entity.get("businessAttributes") or {}).items():
+                kept = {k: v for k, v in attributes.items()
+                        if k not in removed.get(type_name, {})}
+                if kept:
+                    output[type_name] = kept
+            return {"businessAttributes": output}
+
+        return self._update_entities(
+            businessMetadata, merge,
+            lambda guid, removed: self.delete_businessMetadata(guid, removed),
+            fold, chunk_size, max_workers, max_retries)
+
+    def export_snapshot(self, path, type_names=None, shard_size=100000,
+                        fetch_size=100, max_workers=4, include_glossary=True,
+                        **kwargs):
+        """
+        Export the entities, type definitions, glossaries, and glossary terms
+        of the catalog to a folder of gzip compressed json lines shards and a
+        manifest. Entities are enumerated with partitioned searches and read
+        in concurrent bulk requests so memory stays constant regardless of
+        the size of the catalog. See
+        :class:`~pyapacheatlas.core.snapshot.SnapshotExporter` for the layout.
+
+        :param str path: The folder to write. It is created if it does not exist.
+        :param list(str) type_names:
+            The entity types to export. Defaults to every type.
+        :param int shard_size: The number of entities in each shard.
+        :param int fetch_size: The number of entities in each bulk get.
+        :param int max_workers: The number of concurrent requests.
+        :param bool include_glossary: Whether to export glossaries and terms.
+        :param int page_size: The number of results in each search page.
+        :param int compresslevel: The gzip compression level from 1 to 9.
+        :param int max_retries: The times to retry a failed entity read.
+        :return: The manifest of the snapshot.
+        :rtype: dict
+        """
+        return SnapshotExporter(
+            self, path, type_names=type_names, shard_size=shard_size,
+            fetch_size=fetch_size, max_workers=max_workers,
+            include_glossary=include_glossary, **kwargs
+        ).run()
+
+    def import_snapshot(self, path, state_path=None, batch_size=1000,
+                        max_workers=4, force_update=False, **kwargs):
+        """
+        Import a snapshot written by
+        :meth:`~pyapacheatlas.core.client.AtlasClient.export_snapshot`.
+        Type definitions are deployed first, then glossary terms, then the
+        entities in concurrent bulk uploads, and finally the relationships,
+        classifications, and term assignments in later bulk phases. See
+        :class:`~pyapacheatlas.core.snapshot.SnapshotImporter` for the phases.
+
+        Each phase of each shard is checkpointed in `state_path` so an
+        interrupted import resumes where it stopped when called again with
+        the same path.
+
+        :param str path: The folder of the snapshot.
+        :param str state_path:
+            The sqlite file that makes the import resumable. Defaults to
+            keeping the state in memory.
+        :param int batch_size: The most entities in each upload.
+        :param int max_workers: The number of concurrent requests.
+        :param bool force_update:
+            Whether to update type definitions that already exist.
+        :param int window_size: The number of entities read before writing.
+        :param str collection:
+            The Purview collection to upload into. Defaults to the root collection.
+        :param bool include_glossary:
+            Whether to import glossaries, terms, and term assignments.
+        :param function progress:
+            Called with the :class:`~pyapacheatlas.core.snapshot.SnapshotImportStats`
+            after each shard of each phase.
+        :return: The counts and throughput of the import.
+        :rtype: :class:`~pyapacheatlas.core.snapshot.SnapshotImportStats`
+        """
+        importer = SnapshotImporter(
+            self, path, state_path=state_path, batch_size=batch_size,
+            max_workers=max_workers, force_update=force_update, **kwargs)
+        try:
+            return importer.run()
+        finally:
+            importer.state.close()
+
 
 class PurviewClient(AtlasClient):
     """
@@ -1550,6 +2111,32 @@ class PurviewClient(AtlasClient):
             Kwargs to pass to the underlying `requests` package method call.
             For example passing `requests_verify = False` will supply
             `verify=False` to any API call.
+        :param json_codec:
+            The json codec used to encode request bodies and decode
+            responses. One of "json" (default), "orjson", "ujson", "auto", or
+            a :class:`~pyapacheatlas.core.codec.JsonCodec`.
+        :param bool lazy_responses:
+            Keep the raw bytes of each response and only decode them the
+            first time the body is accessed. Defaults to False.
+        :param bool compress_requests:
+            Gzip the json body of POST and PUT requests (for example
+            `/entity/bulk` uploads) and send it with a `Content-Encoding: gzip`
+            header. The server must accept gzip request bodies. Gzip responses
+            are always decompressed. Defaults to False.
+        :param int compression_threshold:
+            The minimum size in bytes of a body before it is compressed.
+            Defaults to 16384.
+        :param int compression_level:
+            The gzip compression level from 1 (fastest) to 9 (smallest).
+            Defaults to 6.
+        :param hooks:
+            Instrumentation called before each request and after each
+            response with the method, route template, status code, bytes
+            sent and received, and latency. See
+            :mod:`~pyapacheatlas.core.instrumentation` for the built in
+            collectors.
+        :type hooks:
+            list(:class:`~pyapacheatlas.core.instrumentation.RequestHook`)
     """
 
     def __init__(self, account_name, authentication=None, **kwargs):
@@ -1566,17 +2153,19 @@ class PurviewClient(AtlasClient):
             requests_args = kwargs.pop("requests_args")
         else:
             requests_args = AtlasBaseClient._parse_requests_args(**kwargs)
+        client_args = AtlasBaseClient._parse_client_args(**kwargs)
 
         glossary = PurviewGlossaryClient(
-            endpoint_url, authentication, requests_args=requests_args)
+            endpoint_url, authentication, requests_args=requests_args,
+            **client_args)
         self.collections = PurviewCollectionsClient(
             f"https://{account_name.lower()}.purview.azure.com/",
-            authentication, requests_args=requests_args)
+            authentication, requests_args=requests_args, **client_args)
         self.msgraph = MsGraphClient(
             authentication, requests_args=requests_args)
         self.discovery = PurviewDiscoveryClient(
             f"https://{account_name.lower()}.purview.azure.com/catalog/api",
-            authentication, requests_args=requests_args)
+            authentication, requests_args=requests_args, **client_args)
         self.graphql = GraphQLClient(
             endpoint_url = f"https://{account_name.lower()}.purview.azure.com/datamap/api/graphql",
             authentication=authentication
@@ -1787,3 +2376,56 @@ class PurviewClient(AtlasClient):
         :rtype: dict(str, str)
         """
         return super().delete_entity_labels(tags, guid, typeName, qualifiedName)
+
+    def update_entities_tags(self, tags, force_update=False, **kwargs):
+        """
+        Add (or with force_update, set) the tags of many entities.
+
+        Note: This is a facade over `update_entities_labels` as MSFT Purview's
+        UI refers to labels as 'tags'.
+
+        :param tags:
+            A dict of entities and the tags for each one, or a list of
+            (entity, tags) pairs. An entity is a guid, a (typeName,
+            qualifiedName) tuple, a dict, or an AtlasEntity.
+        :type tags:
+            Union(dict(Union(str, tuple(str, str)), list(str)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), list(str))))
+        :param bool force_update:
+            Set to True to replace the existing tags rather than adding to them.
+
+        Kwargs:
+            :param bool fold: Whether to write the tags with `/entity/bulk`.
+            :param int chunk_size: The number of entities in each bulk request.
+            :param int max_workers: The number of concurrent requests.
+            :param int max_retries: The times to retry a failed request.
+
+        :return: A row for each entity with its guid, status, method, and error.
+        :rtype: list(dict)
+        """
+        return super().update_entities_labels(tags, force_update, **kwargs)
+
+    def delete_entities_tags(self, tags, **kwargs):
+        """
+        Remove tags from many entities.
+
+        Note: This is a facade over `delete_entities_labels` as MSFT Purview's
+        UI refers to labels as 'tags'.
+
+        :param tags:
+            A dict of entities and the tags to remove from each one, or a
+            list of (entity, tags) pairs.
+        :type tags:
+            Union(dict(Union(str, tuple(str, str)), list(str)),
+            list(tuple(Union(str, tuple(str, str), dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`), list(str))))
+
+        Kwargs:
+            :param bool fold: Whether to write the tags with `/entity/bulk`.
+            :param int chunk_size: The number of entities in each bulk request.
+            :param int max_workers: The number of concurrent requests.
+            :param int max_retries: The times to retry a failed request.
+
+        :return: A row for each entity with its guid, status, method, and error.
+        :rtype: list(dict)
+        """
+        return super().delete_entities_labels(tags, **kwargs)
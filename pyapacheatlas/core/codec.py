@@ -0,0 +1,137 @@
+import json
+
+
+class JsonCodec():
+    """
+    Encodes request bodies to and decodes response bodies from json.
+
+    :param str name: The name of the codec.
+    :param function dumps:
+        Converts a python object into utf-8 json bytes. Accepts an optional
+        `default` function that is called for objects that are not natively
+        serializable, like the standard library's json.dumps.
+    :param function loads:
+        Converts json bytes (or a string) into a python object. Raises a
+        ValueError when the json is invalid.
+    """
+
+    def __init__(self, name, dumps, loads):
+        super().__init__()
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self):
+        return f"JsonCodec({self.name})"
+
+
+def _stdlib_codec():
+    return JsonCodec(
+        "json",
+        # Matches the way requests encodes the json parameter
+        lambda obj, default=None: json.dumps(
+            obj, allow_nan=False, default=default).encode("utf-8"),
+        json.loads
+    )
+
+
+def _orjson_codec():
+    import orjson
+    return JsonCodec(
+        "orjson",
+        lambda obj, default=None: orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS),
+        orjson.loads
+    )
+
+
+def _ujson_codec():
+    import ujson
+    return JsonCodec(
+        "ujson",
+        lambda obj, default=None: ujson.dumps(
+            obj, ensure_ascii=False, default=default).encode("utf-8"),
+        ujson.loads
+    )
+
+
+_CODECS = {
+    "json": _stdlib_codec,
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec
+}
+# The order that codecs are tried when using "auto"
+_FASTEST_FIRST = ["orjson", "ujson", "json"]
+
+
+def get_codec(codec="json"):
+    """
+    Get a json codec by name.
+
+    :param codec:
+        One of "json" (the standard library, default), "orjson", "ujson",
+        or "auto" to use the fastest installed codec. A JsonCodec is returned
+        as is.
+    :type codec: Union(str, :class:`~pyapacheatlas.core.codec.JsonCodec`)
+    :raises ValueError: The codec is unknown.
+    :raises ImportError: The codec's package is not installed.
+    :return: The json codec.
+    :rtype: :class:`~pyapacheatlas.core.codec.JsonCodec`
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None:
+        codec = "json"
+
+    if codec == "auto":
+        for name in _FASTEST_FIRST:
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+
+    if codec not in _CODECS:
+        raise ValueError(
+            f"The json codec {codec} is not supported. Use one of "
+            f"{', '.join(list(_CODECS.keys()) + ['auto'])}.")
+
+    return _CODECS[codec]()
+
+
+DEFAULT_CODEC = get_codec("json")
+
+
+def entity_default(obj):
+    """
+    The `default` function of a codec's dumps that serializes objects with
+    a `to_json` method, such as an AtlasEntity, while they are encoded.
+
+    :param obj: The object that the codec could not serialize.
+    :raises TypeError: The object has no to_json method.
+    :return: The object as a dict.
+    :rtype: dict
+    """
+    to_json = getattr(obj, "to_json", None)
+    if to_json is None:
+        raise TypeError(
+            f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_json()
+
+
+def dumps_entities(entities, codec=None):
+    """
+    Encode a list of entities as the body of a bulk entity request in a
+    single pass. AtlasEntity objects are converted while the codec writes
+    the payload so no intermediate list of dicts is built. With orjson the
+    whole payload is serialized in C.
+
+    :param entities: The entities to encode.
+    :type entities:
+        Union(list(dict), list(:class:`~pyapacheatlas.core.entity.AtlasEntity`))
+    :param codec: The json codec or codec name to use. Defaults to "json".
+    :type codec: Union(str, :class:`~pyapacheatlas.core.codec.JsonCodec`)
+    :return: The utf-8 json bytes of `{"entities": [...]}`.
+    :rtype: bytes
+    """
+    codec = get_codec(codec)
+    return codec.dumps({"entities": list(entities)}, default=entity_default)
@@ -1,7 +1,7 @@
 import logging
 from typing import List, Union
 
-from ..entity import AtlasEntity
+from ..entity import AtlasEntity, RawAtlasEntity
 from ..util import AtlasBaseClient, batch_dependent_entities
 
 
@@ -78,10 +78,12 @@ class PurviewCollectionsClient(AtlasBaseClient):
 
         :param batch:
             The batch of entities you want to upload. Supports a single dict,
-            AtlasEntity, list of dicts, list of atlas entities.
+            AtlasEntity, list of dicts, list of atlas entities. Entity dicts
+            may be wrapped in a RawAtlasEntity.
         :type batch:
             Union(dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`,
-            list(dict), list(:class:`~pyapacheatlas.core.entity.AtlasEntity`) )
+            list(dict), list(:class:`~pyapacheatlas.core.entity.AtlasEntity`),
+            list(:class:`~pyapacheatlas.core.entity.RawAtlasEntity`) )
         :param str collection:
             Collection ID of the containing purview collection.
             Typically a 6-letter pseudo-random string such as "xcgw8s" which can be obtained
@@ -141,7 +143,7 @@ class PurviewCollectionsClient(AtlasBaseClient):
             # Handles any type of AtlasEntity and mixed batches of dicts
             # and AtlasEntities
             dict_batch = [e.to_json() if isinstance(
-                e, AtlasEntity) else e for e in batch]
+                e, (AtlasEntity, RawAtlasEntity)) else e for e in batch]
             payload = {"entities": dict_batch}
         elif isinstance(batch, dict):
             current_keys = list(batch.keys())
@@ -153,7 +155,7 @@ class PurviewCollectionsClient(AtlasBaseClient):
                 # json, you know the schema and I will not support
                 # AtlasEntity here.
                 payload = {"entities": [batch]}
-        elif isinstance(batch, AtlasEntity):
+        elif isinstance(batch, (AtlasEntity, RawAtlasEntity)):
             payload = {"entities": [batch.to_json()]}
         else:
             raise NotImplementedError(
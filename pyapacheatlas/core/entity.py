@@ -1,5 +1,15 @@
+from collections.abc import MutableMapping
+
 from .util import AtlasUnInit
 
+_UNINIT = AtlasUnInit()
+_OPTIONAL_FIELDS = (
+    "businessAttributes", "classifications", "contacts", "createTime",
+    "createdBy", "customAttributes", "homeId", "isIncomplete", "labels",
+    "lastModifiedTS", "provenanceType", "proxy", "relationshipAttributes",
+    "source", "sourceDetails", "status", "updateTime", "updatedBy", "version"
+)
+
 
 class AtlasEntity():
     """
@@ -29,38 +39,40 @@ class AtlasEntity():
         object id. Info is a string of extra information.
     """
 
+    # The optional top level fields default to the shared AtlasUnInit and
+    # are only stored on an entity once they are set.
+    businessAttributes = _UNINIT
+    classifications = _UNINIT
+    contacts = _UNINIT
+    createTime = _UNINIT
+    createdBy = _UNINIT
+    customAttributes = _UNINIT
+    homeId = _UNINIT
+    isIncomplete = _UNINIT
+    labels = _UNINIT
+    lastModifiedTS = _UNINIT
+    provenanceType = _UNINIT
+    proxy = _UNINIT
+    relationshipAttributes = _UNINIT
+    source = _UNINIT
+    sourceDetails = _UNINIT
+    status = _UNINIT
+    updateTime = _UNINIT
+    updatedBy = _UNINIT
+    version = _UNINIT
+
     def __init__(self, name, typeName, qualified_name, guid=None, **kwargs):
         super().__init__()
         self.attributes = kwargs.get("attributes", {})
         self.attributes.update({"name": None, "qualifiedName": None})
-        # Normally takes a dict of dicts
-        self.businessAttributes = kwargs.get(
-            "businessAttributes", AtlasUnInit())
-        self.classifications = kwargs.get("classifications", AtlasUnInit())
-        # This isn't implemented in Apache Atlas, so being cautious
-        # Data Structure: {"Expert":[{"id","info"}], "Owner":...}
-        self.contacts = kwargs.get("contacts", AtlasUnInit())
-        self.createTime = kwargs.get("createTime", AtlasUnInit())
-        self.createdBy = kwargs.get("createdBy", AtlasUnInit())
-        # Normally takes a dict of str
-        self.customAttributes = kwargs.get("customAttributes", AtlasUnInit())
         self.guid = guid
-        self.homeId = kwargs.get("homeId", AtlasUnInit())
-        self.isIncomplete = kwargs.get("isIncomplete", AtlasUnInit())
-        # Normally takes a list of strings
-        self.labels = kwargs.get("labels", AtlasUnInit())
-        self.lastModifiedTS = kwargs.get("lastModifiedTS", AtlasUnInit())
-        self.provenanceType = kwargs.get("provenanceType", AtlasUnInit())
-        self.proxy = kwargs.get("proxy", AtlasUnInit())
-        self.relationshipAttributes = kwargs.get(
-            "relationshipAttributes", AtlasUnInit())
-        self.source = kwargs.get("source", AtlasUnInit())
-        self.sourceDetails = kwargs.get("sourceDetails", AtlasUnInit())
-        self.status = kwargs.get("status", AtlasUnInit())
         self.typeName = typeName
-        self.updateTime = kwargs.get("updateTime", AtlasUnInit())
-        self.updatedBy = kwargs.get("updatedBy", AtlasUnInit())
-        self.version = kwargs.get("version", AtlasUnInit())
+        # Normally businessAttributes takes a dict of dicts, contacts takes
+        # {"Expert":[{"id","info"}], "Owner":...}, customAttributes takes a
+        # dict of str, and labels takes a list of strings.
+        for field in _OPTIONAL_FIELDS:
+            if kwargs.get(field, _UNINIT) is not _UNINIT:
+                setattr(self, field, kwargs[field])
         self.name = name
         self.qualifiedName = qualified_name
         if "description" in kwargs:
@@ -285,13 +297,13 @@ class AtlasEntity():
                 "guid": self.guid,
                 "attributes": self.attributes
             }
-            # Add ins for optional top level attributes
-            for k, v in vars(self).items():
-                is_uninitialized = isinstance(v, AtlasUnInit)
-                is_asset_attribute = k in ["name", "qualifiedName"]
-                if is_uninitialized or is_asset_attribute:
-                    continue
-                output[k] = v
+            # Add ins for optional top level attributes. Unset fields fall
+            # back to the class level AtlasUnInit, which is a shared instance
+            # so an identity check also skips any reset to uninitialized.
+            for field in _OPTIONAL_FIELDS:
+                value = getattr(self, field)
+                if value is not _UNINIT:
+                    output[field] = value
 
         return output
 
@@ -492,6 +504,330 @@ class AtlasProcess(AtlasEntity):
         self.outputs = _deduped_outputs
 
 
+# Top level fields of an entity that the service manages
+_SYSTEM_FIELDS = (
+    "createTime", "createdBy", "updateTime", "updatedBy", "version",
+    "lastModifiedTS", "homeId", "isIncomplete", "provenanceType", "proxy",
+    "collectionId"
+)
+# Fields of a related object id that describe the relationship in the
+# source catalog rather than the entity being pointed to
+_RELATIONSHIP_FIELDS = (
+    "relationshipGuid", "relationshipStatus", "relationshipType",
+    "relationshipAttributes", "displayText", "entityStatus"
+)
+
+
+def _object_ids(value):
+    """
+    Yield the object id dicts (those with a guid) in an attribute value,
+    including those nested in lists and struct values.
+    """
+    if isinstance(value, dict):
+        if "guid" in value:
+            yield value
+        else:
+            for item in value.values():
+                yield from _object_ids(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _object_ids(item)
+
+
+def _drop_object_ids(container, guids):
+    """
+    Remove the object ids that refer to any of the guids from a dict or
+    list and the lists and struct values nested in it, in place.
+    Returns the number of object ids removed.
+    """
+    removed = 0
+    if isinstance(container, list):
+        kept = [v for v in container if not (
+            isinstance(v, dict) and v.get("guid") in guids)]
+        removed += len(container) - len(kept)
+        container[:] = kept
+    else:
+        for key, value in list(container.items()):
+            if isinstance(value, dict) and value.get("guid") in guids:
+                del container[key]
+                removed += 1
+        kept = container.values()
+    for value in kept:
+        if isinstance(value, list) or (isinstance(value, dict) and "guid" not in value):
+            removed += _drop_object_ids(value, guids)
+    return removed
+
+
+class RawAtlasEntity(MutableMapping):
+    """
+    A view over an entity dict, such as one returned by
+    :meth:`~pyapacheatlas.core.client.AtlasClient.get_entity`, that edits
+    the dict in place. Unlike
+    :meth:`~pyapacheatlas.core.entity.AtlasEntity.from_json`, nothing is
+    copied so entities can be read from one catalog, remapped, and uploaded
+    to another without constructing AtlasEntity objects.
+
+    The view behaves like the underlying dict and is accepted by
+    `upload_entities` and
+    :func:`~pyapacheatlas.core.util.batch_dependent_entities`.
+
+    .. code-block:: python
+
+        response = old_client.get_entity(guid=guids)
+        entities = RawAtlasEntity.from_response(response)
+        for entity in entities:
+            entity.strip_system_fields()
+            entity.remap_guids(old_to_new)
+        new_client.upload_entities(entities)
+
+    :param dict entity_json: The entity dict to wrap.
+    """
+    __slots__ = ("_entity",)
+
+    def __init__(self, entity_json):
+        super().__init__()
+        if isinstance(entity_json, RawAtlasEntity):
+            entity_json = entity_json._entity
+        self._entity = entity_json
+
+    @classmethod
+    def from_json(cls, entity_json):
+        """
+        Wrap an entity dict without copying it.
+
+        :param dict entity_json: The entity dict to wrap.
+        :return: The view over the dict.
+        :rtype: :class:`~pyapacheatlas.core.entity.RawAtlasEntity`
+        """
+        return cls(entity_json)
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Wrap every entity in a get entity or search response.
+
+        :param response:
+            An AtlasEntitiesWithExtInfo dict (with "entities"), an
+            AtlasEntityWithExtInfo dict (with "entity"), or a list of
+            entity dicts.
+        :type response: Union(dict, list(dict))
+        :return: A view over each entity in the response.
+        :rtype: list(:class:`~pyapacheatlas.core.entity.RawAtlasEntity`)
+        """
+        if isinstance(response, dict):
+            if "entities" in response:
+                response = response["entities"]
+            elif "entity" in response:
+                response = [response["entity"]]
+            else:
+                response = [response]
+        return [cls(e) for e in response]
+
+    def __getitem__(self, key):
+        return self._entity[key]
+
+    def __setitem__(self, key, value):
+        self._entity[key] = value
+
+    def __delitem__(self, key):
+        del self._entity[key]
+
+    def __iter__(self):
+        return iter(self._entity)
+
+    def __len__(self):
+        return len(self._entity)
+
+    def __repr__(self):
+        return f"RawAtlasEntity({self._entity!r})"
+
+    @property
+    def guid(self):
+        return self._entity.get("guid")
+
+    @guid.setter
+    def guid(self, value):
+        self._entity["guid"] = value
+
+    @property
+    def typeName(self):
+        return self._entity.get("typeName")
+
+    @typeName.setter
+    def typeName(self, value):
+        self._entity["typeName"] = value
+
+    @property
+    def attributes(self):
+        """
+        The attributes of the entity. Reading them does not change the
+        entity, so an entity without attributes returns a new empty dict
+        that is not added to it.
+        """
+        return self._entity.get("attributes", {})
+
+    @attributes.setter
+    def attributes(self, value):
+        self._entity["attributes"] = value
+
+    @property
+    def relationshipAttributes(self):
+        """
+        The relationship attributes of the entity. An entity without them
+        returns a new empty dict that is not added to it.
+        """
+        return self._entity.get("relationshipAttributes", {})
+
+    @relationshipAttributes.setter
+    def relationshipAttributes(self, value):
+        self._entity["relationshipAttributes"] = value
+
+    @property
+    def name(self):
+        return self.attributes.get("name")
+
+    @name.setter
+    def name(self, value):
+        self._entity.setdefault("attributes", {})["name"] = value
+
+    @property
+    def qualifiedName(self):
+        return self.attributes.get("qualifiedName")
+
+    @qualifiedName.setter
+    def qualifiedName(self, value):
+        self._entity.setdefault("attributes", {})["qualifiedName"] = value
+
+    def addRelationship(self, **kwargs):
+        """
+        Add or replace relationship attributes of the entity. See
+        :meth:`~pyapacheatlas.core.entity.AtlasEntity.addRelationship`.
+
+        Kwargs:
+            :param kwarg: The name of the relationship attribute you're adding.
+            :type kwarg:
+                Union(dict, :class:`pyapacheatlas.core.entity.AtlasEntity`,
+                :class:`pyapacheatlas.core.entity.RawAtlasEntity`)
+        """
+        def _pointer(value):
+            if isinstance(value, (AtlasEntity, RawAtlasEntity)):
+                return value.to_json(minimum=True)
+            return value
+
+        relationships = self._entity.setdefault("relationshipAttributes", {})
+        for k, v in kwargs.items():
+            if isinstance(v, list):
+                relationships[k] = [_pointer(vv) for vv in v]
+            else:
+                relationships[k] = _pointer(v)
+
+    def remap_guids(self, guid_map):
+        """
+        Replace the entity's guid and the guids of the entities it refers to
+        in its attributes (including object ids nested in struct values),
+        relationship attributes, and classifications. Guids that are not in
+        `guid_map` are left unchanged.
+
+        :param dict guid_map: A mapping of old guids to new guids.
+        :return: The number of guids that were replaced.
+        :rtype: int
+        """
+        replaced = 0
+        entity = self._entity
+        if entity.get("guid") in guid_map:
+            entity["guid"] = guid_map[entity["guid"]]
+            replaced += 1
+
+        for field in ("attributes", "relationshipAttributes"):
+            for value in (entity.get(field) or {}).values():
+                for object_id in _object_ids(value):
+                    if object_id["guid"] in guid_map:
+                        object_id["guid"] = guid_map[object_id["guid"]]
+                        replaced += 1
+
+        for classification in entity.get("classifications") or []:
+            if classification.get("entityGuid") in guid_map:
+                classification["entityGuid"] = guid_map[classification["entityGuid"]]
+                replaced += 1
+
+        return replaced
+
+    def referenced_guids(self):
+        """
+        The guids of the entities this entity refers to in its attributes
+        and relationship attributes, including object ids nested in struct
+        values.
+
+        :return: The referenced guids.
+        :rtype: set(Union(str, int))
+        """
+        output = set()
+        for field in ("attributes", "relationshipAttributes"):
+            for value in (self._entity.get(field) or {}).values():
+                output.update(object_id["guid"] for object_id in _object_ids(value))
+        return output
+
+    def remove_references(self, guids):
+        """
+        Remove the object ids that refer to any of the given guids from the
+        attributes and relationship attributes of the entity, including
+        those nested in struct values.
+
+        :param set guids: The guids of the references to remove.
+        :return: The number of references that were removed.
+        :rtype: int
+        """
+        removed = 0
+        for field in ("attributes", "relationshipAttributes"):
+            removed += _drop_object_ids(self._entity.get(field) or {}, guids)
+        return removed
+
+    def strip_system_fields(self):
+        """
+        Remove the fields that the source catalog manages (create and update
+        times and users, version, etc.), the details of the relationships in
+        the source catalog, and classifications propagated from other
+        entities so the entity can be uploaded to another one.
+        """
+        entity = self._entity
+        for field in _SYSTEM_FIELDS:
+            entity.pop(field, None)
+        if entity.get("classifications"):
+            entity["classifications"] = [
+                c for c in entity["classifications"]
+                if c.get("entityGuid") in (None, entity.get("guid"))
+            ]
+        for value in (entity.get("relationshipAttributes") or {}).values():
+            for object_id in _object_ids(value):
+                for field in _RELATIONSHIP_FIELDS:
+                    object_id.pop(field, None)
+
+    def to_json(self, minimum=False):
+        """
+        Return the underlying entity dict.
+
+        :param bool minimum: If True, returns only the
+            type name, qualified name, and guid of the entity (when guid is
+            defined). If True and guid is None, returns typeName and
+            uniqueAttributes.
+        :return:
+            The wrapped dict itself (not a copy) or a new minimum dict.
+        :rtype: dict
+        """
+        if not minimum:
+            return self._entity
+        if self.guid is not None:
+            return {
+                "typeName": self.typeName,
+                "guid": self.guid,
+                "qualifiedName": self.qualifiedName
+            }
+        return {
+            "typeName": self.typeName,
+            "uniqueAttributes": {"qualifiedName": self.qualifiedName}
+        }
+
+
 class AtlasClassification():
     """
     A python implementation of the AtlasClassification from Apache Atlas.
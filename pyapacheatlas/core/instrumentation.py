@@ -0,0 +1,377 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+import json
+import re
+import threading
+from urllib.parse import urlparse
+
+_OPENTELEMETRY_INSTALLED = False
+try:
+    from opentelemetry import metrics as otel_metrics
+    from opentelemetry import trace as otel_trace
+    _OPENTELEMETRY_INSTALLED = True
+except ImportError:
+    pass
+
+GUID_PATTERN = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$|^-?\d+$")
+# The path segment that follows one of these segments is a parameter that
+# is not a guid. Guid parameters (e.g. /glossary/{guid}) are found by
+# GUID_PATTERN instead so literal routes like /glossary/terms are kept.
+_PARAMETER_AFTER = {
+    "guid": "{guid}",
+    "name": "{name}",
+    "type": "{typeName}",
+    "classification": "{classificationName}",
+    "collections": "{collectionName}",
+    "users": "{userId}",
+}
+# Upper bounds in seconds of the latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = [
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+]
+
+
+def template_route(url, endpoint_url=None):
+    """
+    Convert a request url into a route template so that requests for
+    different entities are grouped together. For example
+    `https://account.purview.azure.com/catalog/api/atlas/v2/entity/guid/abc-123`
+    becomes `/entity/guid/{guid}`.
+
+    :param str url: The url of the request.
+    :param str endpoint_url:
+        The endpoint of the client. It is removed from the start of the route.
+    :return: The route template.
+    :rtype: str
+    """
+    path = urlparse(url).path
+    if endpoint_url:
+        base_path = urlparse(endpoint_url).path.rstrip("/")
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+
+    segments = path.strip("/").split("/")
+    templated = []
+    previous = None
+    for segment in segments:
+        if previous in _PARAMETER_AFTER and segment not in _PARAMETER_AFTER:
+            templated.append(_PARAMETER_AFTER[previous])
+        elif GUID_PATTERN.match(segment):
+            templated.append("{guid}")
+        else:
+            templated.append(segment)
+        previous = segment
+    return "/" + "/".join(templated)
+
+
+# The retry attempt of the requests being made on each thread
+_retry_state = threading.local()
+
+
+@contextmanager
+def _retry_attempt(attempt):
+    """
+    Mark the requests made on this thread inside the block as the given
+    retry attempt so their RequestEvent reports it.
+    """
+    previous = getattr(_retry_state, "attempt", 0)
+    _retry_state.attempt = attempt
+    try:
+        yield
+    finally:
+        _retry_state.attempt = previous
+
+
+def _current_retries():
+    """
+    The retry attempt of the requests being made on this thread.
+    """
+    return getattr(_retry_state, "attempt", 0)
+
+
+class RequestEvent():
+    """
+    Describes one http request made by a client. Hooks receive the same
+    event before the request is sent and after the response is received.
+
+    :param str method: The http method (GET, POST, PUT, DELETE).
+    :param str url: The full url of the request.
+    :param str route: The route template of the request (e.g. `/lineage/{guid}`).
+    :param int bytes_sent: The size of the request body in bytes.
+
+    The following attributes are filled in after the response:
+
+    * status_code: The http status code or None if no response was received.
+    * bytes_received: The size of the response body in bytes.
+    * latency: The seconds between sending the request and receiving the response.
+    * retries: The number of times the request was retried before this
+      attempt (e.g. by a bulk operation that retries throttled requests).
+    * error: The exception raised when no response was received.
+    * context: A dict that hooks may use to store state between calls.
+    """
+
+    def __init__(self, method, url, route, bytes_sent=0):
+        super().__init__()
+        self.method = method
+        self.url = url
+        self.route = route
+        self.bytes_sent = bytes_sent
+        self.status_code = None
+        self.bytes_received = 0
+        self.latency = None
+        self.retries = 0
+        self.error = None
+        self.context = {}
+
+    @property
+    def is_successful(self):
+        """
+        Whether a response with a 1xx, 2xx, or 3xx status code was received.
+        """
+        return self.status_code is not None and self.status_code < 400
+
+    def to_json(self):
+        """
+        Convert the event into a dict that can be serialized to json.
+
+        :return: The event as a dict.
+        :rtype: dict
+        """
+        return {
+            "method": self.method,
+            "route": self.route,
+            "url": self.url,
+            "status_code": self.status_code,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "latency": self.latency,
+            "retries": self.retries,
+            "error": None if self.error is None else repr(self.error)
+        }
+
+
+class RequestHook():
+    """
+    The base class of request instrumentation. Pass hooks to a client with
+    the `hooks` kwarg and override either method. Hooks are called on the
+    thread that makes the request. An error raised by a hook is logged and
+    does not affect the request.
+    """
+
+    def before_request(self, event):
+        """
+        Called before the request is sent.
+
+        :param event: The request that is about to be sent.
+        :type event: :class:`~pyapacheatlas.core.instrumentation.RequestEvent`
+        """
+        pass
+
+    def after_response(self, event):
+        """
+        Called after the response is received or the request failed.
+
+        :param event: The completed request.
+        :type event: :class:`~pyapacheatlas.core.instrumentation.RequestEvent`
+        """
+        pass
+
+
+class LatencyHistogram(RequestHook):
+    """
+    Collect in memory latency histograms, status codes, and bytes
+    transferred for each method and route.
+
+    .. code-block:: python
+
+        histogram = LatencyHistogram()
+        client = PurviewClient("account", auth, hooks=[histogram])
+        ...
+        for route, stats in histogram.summary().items():
+            print(route, stats["count"], stats["p95"], stats["throttled"])
+
+    :param list(float) buckets:
+        The upper bounds in seconds of the latency buckets.
+    """
+
+    def __init__(self, buckets=None):
+        super().__init__()
+        self.buckets = sorted(buckets or DEFAULT_LATENCY_BUCKETS)
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def _new_stats(self):
+        return {
+            "count": 0,
+            "errors": 0,
+            "throttled": 0,
+            "retries": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+            "status_codes": {},
+            # One more bucket than bounds for latencies above the last bound
+            "bucket_counts": [0] * (len(self.buckets) + 1)
+        }
+
+    def after_response(self, event):
+        key = f"{event.method} {event.route}"
+        latency = event.latency or 0.0
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._new_stats()
+                self._routes[key] = stats
+            stats["count"] += 1
+            stats["retries"] += event.retries
+            stats["bytes_sent"] += event.bytes_sent or 0
+            stats["bytes_received"] += event.bytes_received or 0
+            stats["total_latency"] += latency
+            stats["max_latency"] = max(stats["max_latency"], latency)
+            stats["bucket_counts"][bisect_left(self.buckets, latency)] += 1
+            if not event.is_successful:
+                stats["errors"] += 1
+            if event.status_code == 429:
+                stats["throttled"] += 1
+            if event.status_code is not None:
+                stats["status_codes"][event.status_code] = stats["status_codes"].get(
+                    event.status_code, 0) + 1
+
+    def _percentile(self, stats, percentile):
+        """
+        Estimate a percentile as the upper bound of the bucket it falls in.
+        """
+        target = stats["count"] * percentile
+        running = 0
+        for bound, count in zip(self.buckets, stats["bucket_counts"]):
+            running += count
+            if running >= target:
+                return min(bound, stats["max_latency"])
+        return stats["max_latency"]
+
+    def summary(self):
+        """
+        Summarize the requests made for each method and route.
+
+        :return:
+            A dict of "METHOD /route" to count, errors, throttled (429s),
+            retries, bytes sent and received, mean, p50, p95, p99 and max
+            latency in seconds, and the count of each status code.
+        :rtype: dict(str, dict)
+        """
+        output = {}
+        with self._lock:
+            for key, stats in self._routes.items():
+                output[key] = {
+                    "count": stats["count"],
+                    "errors": stats["errors"],
+                    "throttled": stats["throttled"],
+                    "retries": stats["retries"],
+                    "bytes_sent": stats["bytes_sent"],
+                    "bytes_received": stats["bytes_received"],
+                    "mean": stats["total_latency"] / stats["count"],
+                    "p50": self._percentile(stats, 0.5),
+                    "p95": self._percentile(stats, 0.95),
+                    "p99": self._percentile(stats, 0.99),
+                    "max": stats["max_latency"],
+                    "status_codes": dict(stats["status_codes"])
+                }
+        return output
+
+    def reset(self):
+        """
+        Remove all of the collected requests.
+        """
+        with self._lock:
+            self._routes = {}
+
+
+class JsonLinesExporter(RequestHook):
+    """
+    Write every completed request as a json object on its own line.
+
+    :param str path: The file to append the json lines to.
+    :param stream:
+        An open text stream to write to instead of a path (e.g. sys.stderr).
+    """
+
+    def __init__(self, path=None, stream=None):
+        super().__init__()
+        if (path is None) == (stream is None):
+            raise ValueError("Provide exactly one of path or stream.")
+        self._owns_stream = stream is None
+        self._stream = stream if stream is not None else open(
+            path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def after_response(self, event):
+        line = json.dumps(event.to_json())
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self):
+        """
+        Close the file if the exporter opened it.
+        """
+        if self._owns_stream:
+            self._stream.close()
+
+
+class OpenTelemetryHooks(RequestHook):
+    """
+    Record each request as an OpenTelemetry client span and in a request
+    duration histogram. Requires the `opentelemetry-api` package and uses
+    the globally configured tracer and meter providers by default.
+
+    :param tracer_provider: An optional OpenTelemetry TracerProvider.
+    :param meter_provider: An optional OpenTelemetry MeterProvider.
+    """
+
+    def __init__(self, tracer_provider=None, meter_provider=None):
+        super().__init__()
+        if not _OPENTELEMETRY_INSTALLED:
+            raise ImportError(
+                "You probably need to install opentelemetry-api to use "
+                "OpenTelemetryHooks.")
+        self._tracer = otel_trace.get_tracer(
+            "pyapacheatlas", tracer_provider=tracer_provider)
+        meter = otel_metrics.get_meter(
+            "pyapacheatlas", meter_provider=meter_provider)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration", unit="s",
+            description="Duration of HTTP client requests.")
+
+    def before_request(self, event):
+        event.context["otel_span"] = self._tracer.start_span(
+            f"{event.method} {event.route}",
+            kind=otel_trace.SpanKind.CLIENT,
+            attributes={
+                "http.request.method": event.method,
+                "http.route": event.route,
+                "url.full": event.url,
+                "http.request.body.size": event.bytes_sent or 0
+            }
+        )
+
+    def after_response(self, event):
+        attributes = {
+            "http.request.method": event.method,
+            "http.route": event.route
+        }
+        if event.status_code is not None:
+            attributes["http.response.status_code"] = event.status_code
+        if event.error is not None:
+            attributes["error.type"] = type(event.error).__name__
+
+        span = event.context.pop("otel_span", None)
+        if span is not None:
+            span.set_attributes(attributes)
+            span.set_attribute("http.response.body.size", event.bytes_received or 0)
+            span.set_attribute("http.request.resend_count", event.retries)
+            if not event.is_successful:
+                span.set_status(otel_trace.Status(otel_trace.StatusCode.ERROR))
+            span.end()
+        self._duration.record(event.latency or 0.0, attributes=attributes)
@@ -0,0 +1,668 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import json
+import logging
+import sqlite3
+import threading
+import time
+import warnings
+
+import requests
+
+from .entity import RawAtlasEntity
+from .util import AtlasException, _chunks, _is_not_found, _with_retries
+
+# Purview search returns at most this many results for one query
+MAX_SEARCH_RESULTS = 100000
+# The largest number of sqlite parameters used in one statement
+_SQLITE_CHUNK = 500
+
+
+def _search_partitions(discovery, type_names=None, max_results=MAX_SEARCH_RESULTS):
+    """
+    Split a Purview catalog into search filters that each match fewer than
+    `max_results` entities: one per entity type, split by collection when a
+    type has more entities than a search can page through.
+    """
+    if type_names is None:
+        facets = discovery.query(
+            keywords="*", limit=1,
+            facets=[{"facet": "entityType", "count": 0}]
+        ).get("@search.facets", {}).get("entityType", [])
+        type_names = [f["value"] for f in facets]
+
+    for type_name in type_names:
+        type_filter = {"entityType": type_name}
+        results = discovery.query(
+            keywords="*", filter=type_filter, limit=1,
+            facets=[{"facet": "collectionId", "count": 0}])
+        if results["@search.count"] <= max_results:
+            yield type_filter
+            continue
+
+        for facet in results.get("@search.facets", {}).get("collectionId", []):
+            if facet["count"] > max_results:
+                warnings.warn(
+                    f"The {type_name} entities in collection {facet['value']} "
+                    f"exceed the {max_results} results a search can return. "
+                    "Only the first results will be included.")
+            yield {"and": [type_filter, {"collectionId": facet["value"]}]}
+
+
+def iter_entity_guids(client, type_names=None, page_size=1000,
+                      max_results=MAX_SEARCH_RESULTS):
+    """
+    Yield the guid of every entity in a catalog.
+
+    A PurviewClient pages through its discovery search one entity type at a
+    time and splits a type by collection when it has more entities than
+    one search can return. An AtlasClient pages through the basic search of
+    each entity type.
+
+    :param client: The client of the catalog to enumerate.
+    :type client:
+        Union(:class:`~pyapacheatlas.core.client.PurviewClient`,
+        :class:`~pyapacheatlas.core.client.AtlasClient`)
+    :param list(str) type_names:
+        The entity types to enumerate in order. Defaults to every type in
+        the catalog.
+    :param int page_size: The number of results in each search page.
+    :param int max_results: The most results one Purview search can return.
+    :return: The guids of the entities.
+    :rtype: Iterator(str)
+    """
+    discovery = getattr(client, "discovery", None)
+    if discovery is not None:
+        for search_filter in _search_partitions(discovery, type_names, max_results):
+            for result in discovery.search_entities(
+                    "*", limit=page_size, search_filter=search_filter):
+                yield result["id"]
+        return
+
+    if type_names is None:
+        type_names = sorted(
+            t["name"] for t in client.get_all_typedefs().get("entityDefs", []))
+    atlas_endpoint = client.endpoint_url + "/search/basic"
+    for type_name in type_names:
+        offset = 0
+        while True:
+            results = client._post_http(atlas_endpoint, json={
+                "typeName": type_name,
+                "excludeDeletedEntities": True,
+                "includeSubTypes": False,
+                "limit": page_size,
+                "offset": offset
+            }).body or {}
+            entities = results.get("entities") or []
+            for entity in entities:
+                yield entity["guid"]
+            if len(entities) < page_size:
+                break
+            offset += len(entities)
+
+
+def _get_entities(client, guids, max_retries, backoff):
+    """
+    Get a chunk of entities and fall back to one request per entity when an
+    entity of the chunk does not exist (e.g. it was deleted after it was
+    found). Any other failure is returned for every guid of the chunk
+    rather than multiplying the requests to a throttled or failing catalog.
+    Returns the entities and the error of each guid that could not be
+    retrieved.
+    """
+    try:
+        response = _with_retries(
+            lambda: client.get_entity(guid=guids, minExtInfo=True),
+            max_retries, backoff)
+        return response.get("entities", []), {}
+    except (AtlasException, requests.RequestException) as e:
+        if len(guids) == 1 or not _is_not_found(e):
+            return [], {guid: e for guid in guids}
+
+    entities, errors = [], {}
+    for guid in guids:
+        found, failed = _get_entities(client, [guid], max_retries, backoff)
+        entities.extend(found)
+        errors.update(failed)
+    return entities, errors
+
+
+def fetch_entities(client, guids, chunk_size=100, max_workers=4,
+                   max_retries=3, backoff=1.0):
+    """
+    Get entities in concurrent bulk requests. At most twice `max_workers`
+    chunks are in flight so memory does not grow with the number of guids.
+
+    :param client: The client of the catalog to read.
+    :type client: :class:`~pyapacheatlas.core.client.AtlasClient`
+    :param guids: The guids of the entities to get.
+    :type guids: Iterator(str)
+    :param int chunk_size: The number of guids in each bulk request.
+    :param int max_workers: The number of concurrent requests.
+    :param int max_retries: The times to retry a failed request.
+    :param float backoff: The seconds to wait before the first retry.
+    :return:
+        A tuple of the entity dicts and the error of each guid that could
+        not be retrieved for each chunk, in the order of the guids. A guid
+        whose error has a 404 status code does not exist.
+    :rtype: Iterator(tuple(list(dict), dict(str, Exception)))
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for chunk in _chunks(guids, chunk_size):
+            pending.append(executor.submit(
+                _get_entities, client, chunk, max_retries, backoff))
+            if len(pending) >= max_workers * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class MigrationState():
+    """
+    The on disk progress of a migration or snapshot import: the guid of
+    each source entity in the target catalog, the entities whose
+    references still need to be written once their targets exist, and the
+    named steps that are complete. Uses sqlite so a run can stop at any
+    point and resume with the same path.
+
+    :param str path: The sqlite file. Defaults to an in memory database.
+    """
+
+    def __init__(self, path=None):
+        super().__init__()
+        self.path = path or ":memory:"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS guid_map "
+                "(old TEXT PRIMARY KEY, new TEXT NOT NULL)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS deferred "
+                "(old TEXT PRIMARY KEY, entity TEXT NOT NULL)")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (name TEXT PRIMARY KEY)")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM guid_map").fetchone()[0]
+
+    def __contains__(self, guid):
+        return bool(self.get_many([guid]))
+
+    def close(self):
+        """
+        Close the sqlite connection.
+        """
+        self._conn.close()
+
+    def get_many(self, guids):
+        """
+        Look up the target guids of source guids.
+
+        :param guids: The source guids.
+        :type guids: Iterable(str)
+        :return: The source guids that have been written and their target guids.
+        :rtype: dict(str, str)
+        """
+        output = {}
+        with self._lock:
+            for chunk in _chunks((str(g) for g in guids), _SQLITE_CHUNK):
+                output.update(self._conn.execute(
+                    "SELECT old, new FROM guid_map WHERE old IN "
+                    f"({','.join('?' * len(chunk))})", chunk).fetchall())
+        return output
+
+    def record(self, guid_map, deferred=None):
+        """
+        Save target guids and the entities to revisit in one transaction.
+
+        :param dict(str, str) guid_map: Source guids and their target guids.
+        :param dict(str, dict) deferred:
+            Source guids and entity dicts whose references could not all be
+            written yet.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO guid_map (old, new) VALUES (?, ?)",
+                [(str(k), str(v)) for k, v in guid_map.items()])
+            if deferred:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO deferred (old, entity) VALUES (?, ?)",
+                    [(str(k), json.dumps(v)) for k, v in deferred.items()])
+
+    def iter_deferred(self, batch_size=1000):
+        """
+        Read the deferred entities in batches.
+
+        :param int batch_size: The number of entities in each batch.
+        :return: Batches of source guids and entity dicts.
+        :rtype: Iterator(list(tuple(str, dict)))
+        """
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT old, entity FROM deferred WHERE old > ? "
+                    "ORDER BY old LIMIT ?", (last, batch_size)).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            yield [(old, json.loads(entity)) for old, entity in rows]
+
+    def resolve_deferred(self, guids):
+        """
+        Remove entities whose references have been written.
+
+        :param list(str) guids: The source guids of the entities.
+        """
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM deferred WHERE old = ?", [(str(g),) for g in guids])
+
+    def checkpoint(self, name):
+        """
+        Record that a step (e.g. a shard of a snapshot) is complete.
+
+        :param str name: The name of the step.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (name) VALUES (?)", (name,))
+
+    def has_checkpoint(self, name):
+        """
+        Whether a step was completed by this or an earlier run.
+
+        :param str name: The name of the step.
+        :rtype: bool
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM checkpoints WHERE name = ?", (name,)).fetchone() is not None
+
+    @property
+    def deferred_count(self):
+        """
+        The number of entities whose references have not been written.
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM deferred").fetchone()[0]
+
+
+class MigrationStats():
+    """
+    Counts and throughput of a migration.
+
+    * discovered: Guids found in the source catalog.
+    * skipped: Entities written by an earlier run.
+    * fetched: Entities read from the source catalog.
+    * written: Entities created or updated in the target catalog.
+    * deferred: Entities written before all of their references existed.
+    * fixed: Deferred entities written again with all of their references.
+    * unresolved_references: References to entities that were not migrated.
+    * missing: Entities that were deleted from the source catalog before
+      they could be read.
+    * failed: Entities that could not be read or written.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.discovered = 0
+        self.skipped = 0
+        self.fetched = 0
+        self.written = 0
+        self.deferred = 0
+        self.fixed = 0
+        self.unresolved_references = 0
+        self.missing = 0
+        self.failed = 0
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @property
+    def elapsed(self):
+        """
+        The seconds since the migration started.
+        """
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    @property
+    def entities_per_second(self):
+        """
+        The entities written per second.
+        """
+        return self.written / self.elapsed if self.elapsed else 0.0
+
+    def to_json(self):
+        """
+        Convert the counts into a dict.
+
+        :rtype: dict
+        """
+        return {
+            "discovered": self.discovered,
+            "skipped": self.skipped,
+            "fetched": self.fetched,
+            "written": self.written,
+            "deferred": self.deferred,
+            "fixed": self.fixed,
+            "unresolved_references": self.unresolved_references,
+            "missing": self.missing,
+            "failed": self.failed,
+            "elapsed": self.elapsed,
+            "entities_per_second": self.entities_per_second
+        }
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(written={self.written}, failed={self.failed}, "
+                f"deferred={self.deferred}, {self.entities_per_second:.1f}/s)")
+
+
+def _pack_batches(views, references, batch_size):
+    """
+    Group entities that refer to each other and pack the groups into
+    batches of at most `batch_size`. Groups larger than a batch are split.
+    """
+    parent = {v.guid: v.guid for v in views}
+
+    def find(guid):
+        while parent[guid] != guid:
+            parent[guid] = parent[parent[guid]]
+            guid = parent[guid]
+        return guid
+
+    for view in views:
+        for reference in references[view.guid]:
+            if reference in parent:
+                parent[find(reference)] = find(view.guid)
+
+    groups = {}
+    for view in views:
+        groups.setdefault(find(view.guid), []).append(view)
+
+    batches, current = [], []
+    for group in sorted(groups.values(), key=len, reverse=True):
+        for part in _chunks(group, batch_size):
+            if len(current) + len(part) > batch_size:
+                batches.append(current)
+                current = []
+            current.extend(part)
+    if current:
+        batches.append(current)
+    return batches
+
+
+class CatalogMigration():
+    """
+    Copy the entities of one catalog into another.
+
+    The source catalog is enumerated with partitioned searches and read in
+    concurrent bulk requests one window of entities at a time. Entities are
+    grouped with the entities they refer to so each group gets placeholder
+    guids in the same upload, and the groups are written in concurrent
+    batches. References to entities that are not written yet are removed
+    for the first write, kept on disk, and written once every window is
+    done.
+
+    The guid of every written entity is saved in a sqlite file at
+    `state_path`. Running again with the same path skips the entities that
+    were already written and finishes the remaining work.
+
+    Type definitions, glossary terms, and collections must already exist
+    in the target catalog. The term assignments (meanings) of the entities
+    are kept by matching each source term to the target term with the same
+    glossary and term name. Assignments of terms that are not in the
+    target are removed and counted in `unresolved_references`.
+
+    .. code-block:: python
+
+        migration = CatalogMigration(
+            source_client, target_client, state_path="migration.db",
+            max_workers=8)
+        stats = migration.run()
+        print(stats.to_json())
+
+    :param source: The client of the catalog to read.
+    :type source:
+        Union(:class:`~pyapacheatlas.core.client.PurviewClient`,
+        :class:`~pyapacheatlas.core.client.AtlasClient`)
+    :param target: The client of the catalog to write.
+    :type target:
+        Union(:class:`~pyapacheatlas.core.client.PurviewClient`,
+        :class:`~pyapacheatlas.core.client.AtlasClient`)
+    :param str state_path:
+        The sqlite file that makes the migration resumable. Defaults to
+        keeping the state in memory.
+    :param list(str) type_names:
+        The entity types to migrate in order. Defaults to every type.
+    :param int window_size: The number of entities read before writing.
+    :param int batch_size: The most entities in each upload.
+    :param int fetch_size: The number of entities in each bulk get.
+    :param int max_workers: The number of concurrent requests.
+    :param int page_size: The number of results in each search page.
+    :param str collection:
+        The Purview collection to upload into. Defaults to the root collection.
+    :param int max_retries: The times to retry a failed request.
+    :param float backoff: The seconds to wait before the first retry.
+    :param function progress:
+        Called with the :class:`~pyapacheatlas.core.migration.MigrationStats`
+        after each window.
+    """
+
+    def __init__(self, source, target, state_path=None, type_names=None,
+                 window_size=10000, batch_size=1000, fetch_size=100,
+                 max_workers=4, page_size=1000, collection=None,
+                 max_retries=3, backoff=1.0, progress=None):
+        super().__init__()
+        self.source = source
+        self.target = target
+        self.state = MigrationState(state_path)
+        self.type_names = type_names
+        self.window_size = window_size
+        self.batch_size = batch_size
+        self.fetch_size = fetch_size
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.collection = collection
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.progress = progress
+        self.stats = MigrationStats()
+        self._placeholder = 0
+
+    def _next_placeholder(self):
+        self._placeholder -= 1
+        return str(self._placeholder)
+
+    def _upload(self, entities):
+        if self.collection:
+            return self.target.collections.upload_entities(entities, self.collection)
+        return self.target.upload_entities(entities)
+
+    def _upload_all(self, executor, batches):
+        """
+        Upload batches concurrently and yield each batch with its response
+        or None if it failed.
+        """
+        futures = [
+            (batch, executor.submit(
+                _with_retries, lambda b=batch: self._upload(b),
+                self.max_retries, self.backoff))
+            for batch in batches
+        ]
+        for batch, future in futures:
+            try:
+                yield batch, future.result()
+            except (AtlasException, requests.RequestException) as e:
+                logging.warning(f"Failed to write {len(batch)} entities: {e}")
+                self.stats.failed += len(batch)
+                yield batch, None
+
+    def _glossary_terms(self, client):
+        """
+        The guid of every glossary term of a catalog by glossary and term name.
+        """
+        output = {}
+        glossaries = _with_retries(
+            client.glossary.get_glossaries, self.max_retries, self.backoff)
+        for glossary in glossaries:
+            detailed = _with_retries(
+                lambda g=glossary: client.glossary.get_glossary(guid=g["guid"], detailed=True),
+                self.max_retries, self.backoff)
+            for term in (detailed.get("termInfo") or {}).values():
+                output[(glossary["name"], term["name"])] = term["guid"]
+        return output
+
+    def _map_terms(self):
+        """
+        Record the target guid of each source glossary term so the meanings
+        of the entities are remapped like any other reference.
+        """
+        source_terms = self._glossary_terms(self.source)
+        if not source_terms:
+            return
+        target_terms = self._glossary_terms(self.target)
+        self.state.record({
+            guid: target_terms[key] for key, guid in source_terms.items()
+            if key in target_terms
+        })
+
+    def _migrate_window(self, executor, entities):
+        views = list({e["guid"]: RawAtlasEntity(e) for e in entities}.values())
+        references = {}
+        for view in views:
+            view.strip_system_fields()
+            references[view.guid] = view.referenced_guids()
+        window = set(references)
+        mapped = self.state.get_many(set().union(*references.values()) - window)
+
+        placeholders = {}
+        deferred = {}
+        batches = _pack_batches(views, references, self.batch_size)
+        for batch in batches:
+            batch_map = dict(mapped)
+            for view in batch:
+                placeholders[view.guid] = self._next_placeholder()
+                batch_map[view.guid] = placeholders[view.guid]
+            for view in batch:
+                unresolved = {g for g in references[view.guid] if g not in batch_map}
+                if unresolved:
+                    deferred[view.guid] = json.loads(json.dumps(view.to_json()))
+                    view.remove_references(unresolved)
+                view.remap_guids(batch_map)
+
+        # The views were remapped in place so look the source guids up by
+        # placeholder when recording the results
+        source_guid = {v: k for k, v in placeholders.items()}
+        for batch, response in self._upload_all(executor, batches):
+            if response is None:
+                continue
+            assignments = response.get("guidAssignments", {})
+            guid_map = {}
+            for view in batch:
+                old = source_guid[str(view.guid)]
+                if str(view.guid) in assignments:
+                    guid_map[old] = assignments[str(view.guid)]
+                else:
+                    self.stats.failed += 1
+            batch_deferred = {k: deferred[k] for k in guid_map if k in deferred}
+            self.state.record(guid_map, batch_deferred)
+            self.stats.written += len(guid_map)
+            self.stats.deferred += len(batch_deferred)
+
+    def _fix_deferred(self, executor):
+        """
+        Write the deferred entities again now that their references exist.
+
+        When some entities failed to be read or written, the references
+        that are still missing may be written by a later run, so those
+        entities stay deferred. Entities that were deleted from the source
+        are not retried by a later run and do not keep them deferred.
+        """
+        incomplete = self.stats.failed > 0
+        for rows in self.state.iter_deferred(self.batch_size * self.max_workers):
+            views = {old: RawAtlasEntity(entity) for old, entity in rows}
+            wanted = set(views)
+            for view in views.values():
+                wanted.update(view.referenced_guids())
+            mapped = self.state.get_many(wanted)
+            pending = set()
+            for old, view in views.items():
+                unresolved = view.referenced_guids() - set(mapped)
+                if unresolved:
+                    removed = view.remove_references(unresolved)
+                    if incomplete:
+                        pending.add(old)
+                    else:
+                        self.stats.unresolved_references += removed
+                view.remap_guids(mapped)
+
+            olds = {id(view): old for old, view in views.items()}
+            batches = list(_chunks(views.values(), self.batch_size))
+            for batch, response in self._upload_all(executor, batches):
+                if response is None:
+                    continue
+                resolved = [olds[id(view)] for view in batch
+                            if olds[id(view)] not in pending]
+                self.state.resolve_deferred(resolved)
+                self.stats.fixed += len(resolved)
+
+    def run(self, guids=None):
+        """
+        Migrate the catalog, or only the given entities, and then write the
+        deferred references.
+
+        :param guids:
+            The source guids to migrate. Defaults to every entity found by
+            :func:`~pyapacheatlas.core.migration.iter_entity_guids`.
+        :type guids: Iterable(str)
+        :return: The counts and throughput of the migration.
+        :rtype: :class:`~pyapacheatlas.core.migration.MigrationStats`
+        """
+        if guids is None:
+            guids = iter_entity_guids(
+                self.source, self.type_names, page_size=self.page_size)
+
+        self._map_terms()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for window in _chunks(guids, self.window_size):
+                window = list(dict.fromkeys(str(g) for g in window))
+                self.stats.discovered += len(window)
+                done = self.state.get_many(window)
+                self.stats.skipped += len(done)
+                pending = [g for g in window if g not in done]
+
+                entities = []
+                for found, failed in fetch_entities(
+                        self.source, pending, self.fetch_size, self.max_workers,
+                        self.max_retries, self.backoff):
+                    entities.extend(found)
+                    for guid, error in failed.items():
+                        if _is_not_found(error):
+                            self.stats.missing += 1
+                        else:
+                            logging.warning(f"Failed to read {guid}: {error}")
+                            self.stats.failed += 1
+                self.stats.fetched += len(entities)
+                if entities:
+                    self._migrate_window(executor, entities)
+
+                logging.info(f"Migration progress: {self.stats}")
+                if self.progress:
+                    self.progress(self.stats)
+
+            self._fix_deferred(executor)
+
+        self.stats.end_time = time.perf_counter()
+        logging.info(f"Migration complete: {self.stats}")
+        if self.progress:
+            self.progress(self.stats)
+        return self.stats
@@ -1,18 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
 import json
 from json import JSONDecodeError
+import os
+import time
+from urllib.parse import quote
+
 import requests
 
+# The maximum number of requests MS Graph accepts in one JSON batch.
+GRAPH_BATCH_LIMIT = 20
+# The maximum number of values MS Graph accepts in a $filter in clause.
+GRAPH_IN_CLAUSE_LIMIT = 15
+
 
 class MsGraphException(BaseException):
     pass
 
 
 class MsGraphClient():
+    """
+    Utilities for looking up users in MS Graph.
+
+    :param authentication: The authentication used for the graph headers.
+    :param dict requests_args: Additional arguments passed to requests.
+    :param int cache_ttl:
+        The seconds an identity resolved by `resolve_many` is cached.
+        Defaults to an hour.
+    :param int negative_cache_ttl:
+        The seconds an identity that was not found by `resolve_many` is
+        cached. Defaults to five minutes.
+    """
 
     def __init__(self, authentication, **kwargs):
         super().__init__()
         self.authentication = authentication
         self._requests_args = kwargs.get("requests_args", {})
+        self._session = requests.Session()
+        self.cache_ttl = kwargs.get("cache_ttl", 3600)
+        self.negative_cache_ttl = kwargs.get("negative_cache_ttl", 300)
+        # {lower case identity: (object id or None, expires at epoch seconds)}
+        self._identity_cache = {}
+        # The identities that the most recent lookup could not find
+        self.unresolved = set()
 
     def upn_to_id(self, userPrincipalName, api_version="v1.0"):
         """
@@ -25,7 +54,7 @@ class MsGraphClient():
         """
         graph_endpoint = f"https://graph.microsoft.com/{api_version}/users/{userPrincipalName}"
 
-        getUser = requests.get(
+        getUser = self._session.get(
             graph_endpoint,
             headers=self.authentication.get_graph_authentication_headers(),
             **self._requests_args
@@ -57,7 +86,7 @@ class MsGraphClient():
         """
         graph_endpoint = f"https://graph.microsoft.com/{api_version}/users?$filter=mail eq '{email}'"
 
-        getUser = requests.get(
+        getUser = self._session.get(
             graph_endpoint,
             headers=self.authentication.get_graph_authentication_headers(),
             **self._requests_args
@@ -82,3 +111,264 @@ class MsGraphClient():
                 f"For email {email}: Response did not include a value or id field:"+json.dumps(graph_response))
 
         return results
+
+    def batch(self, graph_requests, api_version="v1.0"):
+        """
+        Send up to 20 requests to MS Graph in a single call to the JSON
+        batching endpoint.
+
+        :param list(dict) graph_requests:
+            The requests to batch. Each has an `id`, `method`, and `url`
+            relative to the api version (e.g. `/users/someone@contoso.com`).
+        :return: The responses (with status, headers, and body) keyed by id.
+        :rtype: dict(str, dict)
+        """
+        if len(graph_requests) > GRAPH_BATCH_LIMIT:
+            raise ValueError(
+                f"MS Graph supports at most {GRAPH_BATCH_LIMIT} requests in a "
+                f"batch but {len(graph_requests)} were provided.")
+
+        graph_endpoint = f"https://graph.microsoft.com/{api_version}/$batch"
+
+        postBatch = self._session.post(
+            graph_endpoint,
+            json={"requests": graph_requests},
+            headers=self.authentication.get_graph_authentication_headers(),
+            **self._requests_args
+        )
+
+        try:
+            graph_response = json.loads(postBatch.text)
+            postBatch.raise_for_status()
+            results = {r["id"]: r for r in graph_response["responses"]}
+        except JSONDecodeError:
+            raise ValueError(
+                f"For batch: Error in parsing response: {postBatch.text}")
+        except requests.RequestException:
+            raise requests.RequestException(
+                f"For batch: Error in parsing response: {postBatch.text}")
+        except KeyError:
+            raise KeyError(
+                "For batch: Response did not include a responses or id field:"+json.dumps(graph_response))
+
+        return results
+
+    def _batch_with_retries(self, graph_requests, api_version, max_retries):
+        """
+        Send a batch and resend the throttled requests after the longest
+        Retry-After, up to max_retries times.
+        """
+        responses = {}
+        pending = graph_requests
+        for attempt in range(max_retries + 1):
+            batch_responses = self.batch(pending, api_version=api_version)
+            throttled = []
+            retry_after = 0
+            for graph_request in pending:
+                response = batch_responses.get(graph_request["id"], {})
+                if response.get("status") in [429, 503] and attempt < max_retries:
+                    throttled.append(graph_request)
+                    retry_after = max(retry_after, int(
+                        (response.get("headers") or {}).get("Retry-After", 1)))
+                else:
+                    responses[graph_request["id"]] = response
+            if not throttled:
+                break
+            time.sleep(retry_after)
+            pending = throttled
+        return responses
+
+    def _resolve_identity_batch(self, chunks, api_version, max_retries):
+        """
+        Look up each chunk of identities by userPrincipalName and by mail
+        with `in` filters, all in one batch.
+        """
+        graph_requests = []
+        for n, chunk in enumerate(chunks):
+            values = ",".join(
+                "'{}'".format(identity.replace("'", "''")) for identity in chunk)
+            for field in ["userPrincipalName", "mail"]:
+                graph_requests.append({
+                    "id": f"{n}-{field}",
+                    "method": "GET",
+                    "url": "/users?$filter={}&$select=id,userPrincipalName,mail".format(
+                        quote(f"{field} in ({values})"))
+                })
+
+        responses = self._batch_with_retries(
+            graph_requests, api_version, max_retries)
+
+        by_upn = {}
+        by_mail = {}
+        for request_id, response in responses.items():
+            if response.get("status") != 200:
+                raise MsGraphException(
+                    f"For batch request {request_id}: MS Graph responded with "
+                    f"status {response.get('status')}: {json.dumps(response.get('body'))}")
+            for user in (response.get("body") or {}).get("value", []):
+                if user.get("userPrincipalName"):
+                    by_upn[user["userPrincipalName"].lower()] = user["id"]
+                if user.get("mail"):
+                    by_mail[user["mail"].lower()] = user["id"]
+
+        results = {}
+        for chunk in chunks:
+            for identity in chunk:
+                key = identity.lower()
+                results[identity] = by_upn.get(key, by_mail.get(key))
+        return results
+
+    def resolve_many(self, upns_or_emails, api_version="v1.0", max_workers=4, max_retries=3):
+        """
+        Look up many user principal names or email addresses in Azure Active
+        Directory. The distinct identities are matched on userPrincipalName
+        or mail with `$filter` in clauses, sent in `$batch` requests that run
+        concurrently.
+
+        Results are cached for `cache_ttl` seconds. Identities that are not
+        found are not raised. They are returned as None, cached for
+        `negative_cache_ttl` seconds, and recorded in `unresolved`.
+
+        :param list(str) upns_or_emails:
+            The user principal names or email addresses to look up.
+        :param str api_version: The MS Graph api version.
+        :param int max_workers: The number of batches sent concurrently.
+        :param int max_retries:
+            The number of times a throttled batch request is retried.
+        :raises MsGraphException:
+            A batch request failed for a reason other than a missing user.
+        :return: The object id (or None) of each distinct identity.
+        :rtype: dict(str, str)
+        """
+        now = time.time()
+        distinct = list(dict.fromkeys(upns_or_emails))
+        output = {}
+        missing = []
+        for identity in distinct:
+            cached = self._identity_cache.get(identity.lower())
+            if cached and cached[1] > now:
+                output[identity] = cached[0]
+            else:
+                missing.append(identity)
+
+        if missing:
+            chunks = [missing[i:i + GRAPH_IN_CLAUSE_LIMIT]
+                      for i in range(0, len(missing), GRAPH_IN_CLAUSE_LIMIT)]
+            # Each chunk uses one request for upn and one for mail
+            per_batch = GRAPH_BATCH_LIMIT // 2
+            batches = [chunks[i:i + per_batch]
+                       for i in range(0, len(chunks), per_batch)]
+
+            def resolve(batch_chunks):
+                return self._resolve_identity_batch(
+                    batch_chunks, api_version, max_retries)
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for resolved in executor.map(resolve, batches):
+                    for identity, oid in resolved.items():
+                        output[identity] = oid
+                        ttl = self.cache_ttl if oid else self.negative_cache_ttl
+                        self._identity_cache[identity.lower()] = (oid, now + ttl)
+
+        self.unresolved = set(i for i in distinct if output[i] is None)
+        return {identity: output[identity] for identity in distinct}
+
+
+class ContactsResolver():
+    """
+    Resolve experts and owners (user principal names or email addresses) to
+    Azure Active Directory object ids with
+    :meth:`~pyapacheatlas.core.msgraph.MsGraphClient.resolve_many` and
+    optionally keep its cache in a json file between runs.
+
+    Pass an instance as the `contacts_func` of the readers' parse_bulk_entities
+    methods. The reader collects every distinct contact first and resolves
+    them with a single call to `resolve_many`.
+
+    .. code-block:: python
+
+        resolver = ContactsResolver(client.msgraph, cache_path="contacts.json")
+        results = reader.parse_bulk_entities(path, contacts_func=resolver)
+        print(resolver.unresolved)
+
+    Contacts that are not found resolve to None and are listed in
+    `unresolved`. The reader leaves them out of the entity's contacts.
+
+    :param msgraph: The client used to call MS Graph.
+    :type msgraph: :class:`~pyapacheatlas.core.msgraph.MsGraphClient`
+    :param str cache_path:
+        An optional json file to load and save the resolved contacts. They
+        are kept for the cache_ttl (or negative_cache_ttl) of the msgraph
+        client.
+    :param int max_workers:
+        The number of batches sent to MS Graph concurrently. Defaults to 4.
+    :param int max_retries:
+        The number of times a throttled lookup is retried. Defaults to 3.
+    :param str api_version: The MS Graph api version. Defaults to "v1.0".
+    """
+
+    def __init__(self, msgraph, cache_path=None, max_workers=4, max_retries=3,
+                 api_version="v1.0"):
+        super().__init__()
+        self.msgraph = msgraph
+        self.cache_path = cache_path
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.api_version = api_version
+        if cache_path and os.path.exists(cache_path):
+            self._load()
+
+    def __call__(self, contact):
+        return self.resolve_many([contact])[contact]
+
+    @property
+    def unresolved(self):
+        """
+        The contacts that the most recent call could not find.
+        """
+        return self.msgraph.unresolved
+
+    def _load(self):
+        with open(self.cache_path, "r") as fp:
+            stored = json.load(fp)
+        now = time.time()
+        self.msgraph._identity_cache.update({
+            identity: (entry["id"], entry["expires"])
+            for identity, entry in stored.items() if entry["expires"] > now
+        })
+
+    def save(self):
+        """
+        Write the unexpired contacts to the cache_path. The file is replaced
+        atomically so a failed write does not corrupt the existing cache.
+        """
+        if not self.cache_path:
+            return
+        now = time.time()
+        stored = {
+            identity: {"id": oid, "expires": expires}
+            for identity, (oid, expires) in self.msgraph._identity_cache.items()
+            if expires > now
+        }
+        temp_path = self.cache_path + ".tmp"
+        with open(temp_path, "w") as fp:
+            json.dump(stored, fp)
+        os.replace(temp_path, self.cache_path)
+
+    def resolve_many(self, contacts):
+        """
+        Resolve many contacts to object ids with
+        :meth:`~pyapacheatlas.core.msgraph.MsGraphClient.resolve_many` and
+        save the results to the cache_path.
+
+        :param list(str) contacts: The user principal names or emails.
+        :raises MsGraphException:
+            A batch request failed for a reason other than a missing user.
+        :return: The object id (or None) of each distinct contact.
+        :rtype: dict(str, str)
+        """
+        output = self.msgraph.resolve_many(
+            contacts, api_version=self.api_version,
+            max_workers=self.max_workers, max_retries=self.max_retries)
+        self.save()
+        return output
@@ -0,0 +1,665 @@
+from concurrent.futures import ThreadPoolExecutor
+import datetime
+import gzip
+import json
+import logging
+import os
+import time
+import warnings
+
+import requests
+
+from .. import __version__
+from .codec import get_codec
+from .migration import (
+    CatalogMigration,
+    MigrationStats,
+    fetch_entities,
+    iter_entity_guids
+)
+from .util import AtlasException, _chunks, _is_not_found, _with_retries
+
+SNAPSHOT_FORMAT = "pyapacheatlas-snapshot"
+SNAPSHOT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+TYPEDEFS_FILE = "typedefs.json.gz"
+GLOSSARIES_FILE = "glossaries.jsonl.gz"
+TERMS_FILE = "terms.jsonl.gz"
+
+# Type definition fields that the catalog manages
+_TYPEDEF_SYSTEM_FIELDS = (
+    "guid", "createdBy", "updatedBy", "createTime", "updateTime", "version",
+    "lastModifiedTS"
+)
+# Glossary term fields that the catalog manages or that refer to other
+# terms, categories, and entities by their guid in the source catalog
+_TERM_EXCLUDED_FIELDS = (
+    "guid", "qualifiedName", "assignedEntities", "categories", "seeAlso",
+    "synonyms", "antonyms", "preferredTerms", "preferredToTerms",
+    "replacementTerms", "replacedBy", "translationTerms", "translatedTerms",
+    "isA", "classifies", "validValues", "validValuesFor", "createdBy",
+    "updatedBy", "createTime", "updateTime", "lastModifiedTS"
+)
+# Classification fields that describe the entity it is attached to
+_CLASSIFICATION_EXCLUDED_FIELDS = ("entityGuid", "entityStatus")
+
+
+def read_manifest(path):
+    """
+    Read the manifest of a snapshot.
+
+    :param str path: The folder of the snapshot.
+    :raises ValueError: The folder does not contain a complete snapshot.
+    :return: The manifest.
+    :rtype: dict
+    """
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        raise ValueError(
+            f"{path} is not a snapshot or its export did not finish. "
+            f"The {MANIFEST_FILE} file is missing.")
+    with open(manifest_path, "r", encoding="utf-8") as fp:
+        manifest = json.load(fp)
+    if manifest.get("format") != SNAPSHOT_FORMAT:
+        raise ValueError(f"{manifest_path} is not a {SNAPSHOT_FORMAT} manifest.")
+    return manifest
+
+
+def iter_json_lines(path, codec=None):
+    """
+    Read a gzip compressed json lines file one line at a time.
+
+    :param str path: The file to read.
+    :param codec: The json codec or codec name to use. Defaults to "json".
+    :type codec: Union(str, :class:`~pyapacheatlas.core.codec.JsonCodec`)
+    :return: The object on each line.
+    :rtype: Iterator(dict)
+    """
+    codec = get_codec(codec)
+    with gzip.open(path, "rb") as fp:
+        for line in fp:
+            if line.strip():
+                yield codec.loads(line)
+
+
+class _ShardWriter():
+    """
+    Write json lines to numbered gzip files with at most `shard_size` lines.
+    """
+
+    def __init__(self, folder, prefix, shard_size, codec, compresslevel):
+        super().__init__()
+        self.folder = folder
+        self.prefix = prefix
+        self.shard_size = shard_size
+        self.codec = codec
+        self.compresslevel = compresslevel
+        self.shards = []
+        self._fp = None
+
+    def write(self, obj):
+        if self._fp is None or self.shards[-1]["count"] >= self.shard_size:
+            self.close()
+            name = f"{self.prefix}-{len(self.shards):05d}.jsonl.gz"
+            self._fp = gzip.open(os.path.join(self.folder, name), "wb",
+                                 compresslevel=self.compresslevel)
+            self.shards.append({"file": name, "count": 0})
+        self._fp.write(self.codec.dumps(obj) + b"\n")
+        self.shards[-1]["count"] += 1
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+
+class SnapshotExporter():
+    """
+    Write every entity, type definition, glossary, and glossary term of a
+    catalog to a folder. Use
+    :meth:`~pyapacheatlas.core.client.AtlasClient.export_snapshot` rather
+    than creating the exporter directly.
+
+    Entity guids are enumerated with partitioned searches (see
+    :func:`~pyapacheatlas.core.migration.iter_entity_guids`), the entities
+    are read in concurrent bulk requests, and each entity is written as a
+    line of a gzip compressed json lines shard as soon as it arrives, so
+    memory does not grow with the size of the catalog.
+
+    Entities are written as the catalog returns them: relationships (with
+    their relationshipGuid and relationshipType), glossary term assignments
+    (the meanings relationship), and classifications are part of each
+    entity.
+
+    The folder contains:
+
+    * manifest.json: The files, counts, source, and time of the snapshot.
+      It is written last so a snapshot without it is incomplete. Entities
+      that were deleted during the export are counted in `deleted`. The
+      guids of entities that could not be read (e.g. the catalog kept
+      throttling the requests) are listed in `missing_guids` and counted
+      in `missing`.
+    * typedefs.json.gz: All of the type definitions.
+    * entities-NNNNN.jsonl.gz: The entities, `shard_size` per file.
+    * glossaries.jsonl.gz and terms.jsonl.gz: The glossaries and terms.
+
+    :param client: The client of the catalog to export.
+    :type client:
+        Union(:class:`~pyapacheatlas.core.client.PurviewClient`,
+        :class:`~pyapacheatlas.core.client.AtlasClient`)
+    :param str path: The folder to write. It is created if it does not exist.
+    :param list(str) type_names:
+        The entity types to export. Defaults to every type.
+    :param int shard_size: The number of entities in each shard.
+    :param int fetch_size: The number of entities in each bulk get.
+    :param int max_workers: The number of concurrent requests.
+    :param int page_size: The number of results in each search page.
+    :param bool include_glossary: Whether to export glossaries and terms.
+    :param int compresslevel: The gzip compression level from 1 to 9.
+    :param int max_retries: The times to retry a failed entity read.
+    :param float backoff: The seconds to wait before the first retry.
+    """
+
+    def __init__(self, client, path, type_names=None, shard_size=100000,
+                 fetch_size=100, max_workers=4, page_size=1000,
+                 include_glossary=True, compresslevel=6, max_retries=3,
+                 backoff=1.0):
+        super().__init__()
+        self.client = client
+        self.path = path
+        self.type_names = type_names
+        self.shard_size = shard_size
+        self.fetch_size = fetch_size
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.include_glossary = include_glossary
+        self.compresslevel = compresslevel
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.codec = client._json_codec
+
+    def _export_typedefs(self):
+        typedefs = self.client.get_all_typedefs()
+        with gzip.open(os.path.join(self.path, TYPEDEFS_FILE), "wb",
+                       compresslevel=self.compresslevel) as fp:
+            fp.write(self.codec.dumps(typedefs))
+        return {category: len(defs) for category, defs in typedefs.items()
+                if isinstance(defs, list)}
+
+    def _export_glossaries(self):
+        glossary_count, term_count = 0, 0
+        with gzip.open(os.path.join(self.path, GLOSSARIES_FILE), "wb",
+                       compresslevel=self.compresslevel) as glossaries, \
+                gzip.open(os.path.join(self.path, TERMS_FILE), "wb",
+                          compresslevel=self.compresslevel) as terms:
+            for header in self.client.glossary.get_glossaries():
+                glossary = self.client.glossary.get_glossary(
+                    guid=header["guid"], detailed=True)
+                for term in (glossary.pop("termInfo", None) or {}).values():
+                    terms.write(self.codec.dumps(term) + b"\n")
+                    term_count += 1
+                glossary.pop("categoryInfo", None)
+                glossaries.write(self.codec.dumps(glossary) + b"\n")
+                glossary_count += 1
+        return {
+            "glossaries": {"file": GLOSSARIES_FILE, "count": glossary_count},
+            "terms": {"file": TERMS_FILE, "count": term_count}
+        }
+
+    def run(self):
+        """
+        Export the catalog.
+
+        :return: The manifest of the snapshot.
+        :rtype: dict
+        """
+        os.makedirs(self.path, exist_ok=True)
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        if os.path.exists(manifest_path):
+            os.remove(manifest_path)
+        started = datetime.datetime.now(datetime.timezone.utc)
+
+        manifest = {
+            "format": SNAPSHOT_FORMAT,
+            "version": SNAPSHOT_VERSION,
+            "pyapacheatlas": __version__,
+            "source": self.client.endpoint_url,
+            "started": started.isoformat(),
+            "typedefs": {"file": TYPEDEFS_FILE, "counts": self._export_typedefs()}
+        }
+
+        entities = _ShardWriter(
+            self.path, "entities", self.shard_size, self.codec, self.compresslevel)
+        type_counts = {}
+        deleted_count = 0
+        missing = []
+        try:
+            guids = iter_entity_guids(
+                self.client, self.type_names, page_size=self.page_size)
+            for found, failed in fetch_entities(
+                    self.client, guids, self.fetch_size, self.max_workers,
+                    self.max_retries, self.backoff):
+                for guid, error in failed.items():
+                    if _is_not_found(error):
+                        deleted_count += 1
+                    else:
+                        logging.warning(f"Failed to export {guid}: {error}")
+                        missing.append(guid)
+                for entity in found:
+                    entities.write(entity)
+                    type_counts[entity["typeName"]] = type_counts.get(
+                        entity["typeName"], 0) + 1
+        finally:
+            entities.close()
+
+        entity_count = sum(s["count"] for s in entities.shards)
+        logging.info(
+            f"Exported {entity_count} entities in {len(entities.shards)} shards")
+        manifest["entities"] = {
+            "shards": entities.shards,
+            "count": entity_count,
+            "type_counts": type_counts,
+            "deleted": deleted_count,
+            "missing": len(missing),
+            "missing_guids": missing
+        }
+        if missing:
+            logging.warning(
+                f"{len(missing)} entities could not be read and are not in the "
+                "snapshot. Their guids are in the manifest's missing_guids.")
+        if self.include_glossary:
+            manifest.update(self._export_glossaries())
+        manifest["completed"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+
+        # Write the manifest last and atomically to mark the snapshot complete
+        with open(manifest_path + ".tmp", "w", encoding="utf-8") as fp:
+            json.dump(manifest, fp, indent=2)
+        os.replace(manifest_path + ".tmp", manifest_path)
+        return manifest
+
+
+def _term_guids(entity):
+    """
+    The guids of the glossary terms assigned to an entity dict.
+    """
+    output = set()
+    relationships = entity.get("relationshipAttributes") or {}
+    for meaning in relationships.get("meanings") or []:
+        if isinstance(meaning, dict) and meaning.get("guid"):
+            output.add(meaning["guid"])
+    for meaning in entity.get("meanings") or []:
+        if isinstance(meaning, dict) and meaning.get("termGuid"):
+            output.add(meaning["termGuid"])
+    return output
+
+
+class SnapshotImportStats(MigrationStats):
+    """
+    Counts and throughput of a snapshot import. Adds to the counts of
+    :class:`~pyapacheatlas.core.migration.MigrationStats`:
+
+    * typedefs: Type definitions created or updated.
+    * terms: Glossary terms created.
+    * classified: Classifications applied to entities.
+    * assigned_terms: Glossary terms assigned to entities.
+    * unapplied: Classifications and term assignments that failed. The
+      shard is repeated by the next run.
+    * skipped_shards: Shards of a phase completed by an earlier run.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.typedefs = 0
+        self.terms = 0
+        self.classified = 0
+        self.assigned_terms = 0
+        self.unapplied = 0
+        self.skipped_shards = 0
+
+    def to_json(self):
+        """
+        Convert the counts into a dict.
+
+        :rtype: dict
+        """
+        output = super().to_json()
+        output.update({
+            "typedefs": self.typedefs,
+            "terms": self.terms,
+            "classified": self.classified,
+            "assigned_terms": self.assigned_terms,
+            "unapplied": self.unapplied,
+            "skipped_shards": self.skipped_shards
+        })
+        return output
+
+
+class SnapshotImporter(CatalogMigration):
+    """
+    Restore a snapshot written by
+    :class:`~pyapacheatlas.core.snapshot.SnapshotExporter` into a catalog.
+    Use :meth:`~pyapacheatlas.core.client.AtlasClient.import_snapshot`
+    rather than creating the importer directly.
+
+    The import runs in phases:
+
+    1. Type definitions missing from the target are created. Existing ones
+       are updated only with `force_update`.
+    2. Glossaries and terms are created or matched by name.
+    3. Each entity shard is read one window at a time. Entities are grouped
+       with the entities they refer to, given placeholder guids, and
+       written in concurrent bulk uploads without their classifications
+       and term assignments. References to entities of later windows are
+       removed for this write.
+    4. The entities with removed references are written again with all of
+       their relationships.
+    5. Classifications are applied with one bulk request per
+       classification and group of entities.
+    6. Terms are assigned with one request per term and group of entities.
+
+    The guid of every written entity and term and each phase of a shard
+    that completed without failures is saved in a sqlite file at
+    `state_path`. Running again with the same path skips the finished
+    shards and entities so a large restore can resume after a failure.
+
+    A snapshot whose export could not read some entities (see the
+    `missing` count of its manifest) is imported with a warning since
+    those entities and any references to them will not be restored.
+
+    .. code-block:: python
+
+        importer = SnapshotImporter(
+            client, "backup/2024-01-01", state_path="restore.db",
+            max_workers=8)
+        stats = importer.run()
+
+    :param target: The client of the catalog to write.
+    :type target:
+        Union(:class:`~pyapacheatlas.core.client.PurviewClient`,
+        :class:`~pyapacheatlas.core.client.AtlasClient`)
+    :param str path: The folder of the snapshot.
+    :param str state_path:
+        The sqlite file that makes the import resumable. Defaults to
+        keeping the state in memory.
+    :param int window_size: The number of entities read before writing.
+    :param int batch_size: The most entities in each upload.
+    :param int max_workers: The number of concurrent requests.
+    :param str collection:
+        The Purview collection to upload into. Defaults to the root collection.
+    :param bool force_update:
+        Whether to update type definitions that already exist in the target.
+    :param bool include_glossary:
+        Whether to import glossaries, terms, and term assignments.
+    :param int max_retries: The times to retry a failed request.
+    :param float backoff: The seconds to wait before the first retry.
+    :param function progress:
+        Called with the :class:`~pyapacheatlas.core.snapshot.SnapshotImportStats`
+        after each shard of each phase.
+    :raises ValueError: The folder does not contain a complete snapshot.
+    """
+
+    def __init__(self, target, path, state_path=None, window_size=10000,
+                 batch_size=1000, max_workers=4, collection=None,
+                 force_update=False, include_glossary=True, max_retries=3,
+                 backoff=1.0, progress=None):
+        super().__init__(
+            None, target, state_path=state_path, window_size=window_size,
+            batch_size=batch_size, max_workers=max_workers,
+            collection=collection, max_retries=max_retries, backoff=backoff,
+            progress=progress)
+        self.path = path
+        self.manifest = read_manifest(path)
+        missing = self.manifest["entities"].get("missing", 0)
+        if missing:
+            warnings.warn(
+                f"The snapshot at {path} is missing {missing} entities that "
+                "could not be read when it was exported. They will not be "
+                "imported. Their guids are in the manifest's missing_guids.")
+        self.force_update = force_update
+        self.include_glossary = include_glossary and "glossaries" in self.manifest
+        self.codec = target._json_codec
+        self.stats = SnapshotImportStats()
+
+    def _report(self):
+        logging.info(f"Snapshot import progress: {self.stats}")
+        if self.progress:
+            self.progress(self.stats)
+
+    def _shards(self, phase):
+        """
+        Yield the path of each entity shard whose phase is not complete and
+        checkpoint it once the caller is done with it.
+        """
+        for shard in self.manifest["entities"]["shards"]:
+            name = f"{phase}/{shard['file']}"
+            if self.state.has_checkpoint(name):
+                self.stats.skipped_shards += 1
+                continue
+            failed, unapplied = self.stats.failed, self.stats.unapplied
+            yield os.path.join(self.path, shard["file"])
+            # A shard with failures, or whose entities were not all written,
+            # is repeated by the next run
+            written = phase == "entities" or \
+                self.state.has_checkpoint(f"entities/{shard['file']}")
+            if written and self.stats.failed == failed and \
+                    self.stats.unapplied == unapplied:
+                self.state.checkpoint(name)
+            self._report()
+
+    def _windows(self, shard):
+        return _chunks(iter_json_lines(shard, self.codec), self.window_size)
+
+    def _target_entities(self, guids):
+        """
+        Read entities from the target so classifications and terms they
+        already have (e.g. from an interrupted run) are not applied twice.
+        Entities that no longer exist are left out. Any other error stops
+        the import so the phase resumes from this shard on the next run.
+        """
+        entities = {}
+        for found, failed in fetch_entities(
+                self.target, guids, self.batch_size, self.max_workers,
+                self.max_retries, self.backoff):
+            entities.update({e["guid"]: e for e in found})
+            for guid, error in failed.items():
+                if not _is_not_found(error):
+                    logging.error(f"Failed to read {guid} from the target: {error}")
+                    raise error
+        return entities
+
+    def _apply_all(self, executor, func, calls):
+        """
+        Call func(value, guids) concurrently for each value and guids. When a
+        call fails, apply it to one entity at a time so one entity does not
+        fail the others. Returns the number of entities updated.
+        """
+        futures = [
+            (value, guids, executor.submit(
+                _with_retries, lambda v=value, g=guids: func(v, g),
+                self.max_retries, self.backoff))
+            for value, guids in calls
+        ]
+        applied = 0
+        for value, guids, future in futures:
+            try:
+                future.result()
+                applied += len(guids)
+                continue
+            except (AtlasException, requests.RequestException):
+                pass
+            for guid in guids:
+                try:
+                    func(value, [guid])
+                    applied += 1
+                except (AtlasException, requests.RequestException) as e:
+                    logging.warning(f"Failed to update {guid}: {e}")
+                    self.stats.unapplied += 1
+        return applied
+
+    def _import_typedefs(self):
+        if self.state.has_checkpoint("typedefs"):
+            return
+        with gzip.open(os.path.join(self.path, self.manifest["typedefs"]["file"]), "rb") as fp:
+            typedefs = self.codec.loads(fp.read())
+        existing = {t["name"] for defs in self.target.get_all_typedefs().values()
+                    if isinstance(defs, list) for t in defs}
+
+        payload = {}
+        for category, defs in typedefs.items():
+            if not isinstance(defs, list):
+                continue
+            for typedef in defs:
+                if typedef["name"] in existing and not self.force_update:
+                    continue
+                payload.setdefault(category, []).append(
+                    {k: v for k, v in typedef.items() if k not in _TYPEDEF_SYSTEM_FIELDS})
+        if payload:
+            _with_retries(
+                lambda: self.target.upload_typedefs(payload, force_update=self.force_update),
+                self.max_retries, self.backoff)
+            self.stats.typedefs += sum(len(defs) for defs in payload.values())
+        self.state.checkpoint("typedefs")
+
+    def _import_glossaries(self):
+        if not self.include_glossary or self.state.has_checkpoint("glossaries"):
+            return
+        glossary_client = self.target.glossary
+        existing = {g["name"]: g["guid"] for g in glossary_client.get_glossaries()}
+        glossary_map = {}
+        for glossary in iter_json_lines(
+                os.path.join(self.path, self.manifest["glossaries"]["file"]), self.codec):
+            if glossary["name"] not in existing:
+                payload = {k: v for k, v in glossary.items()
+                           if k not in ("guid", "terms", "categories")}
+                existing[glossary["name"]] = glossary_client._post_http(
+                    glossary_client.endpoint_url + "/glossary", json=payload).body["guid"]
+            glossary_map[glossary["guid"]] = existing[glossary["name"]]
+
+        # Terms that exist in the target (e.g. from an earlier run) are reused
+        term_names = {}
+        for guid in set(glossary_map.values()):
+            term_info = glossary_client.get_glossary(guid=guid, detailed=True).get("termInfo") or {}
+            term_names.update({(guid, t["name"]): t["guid"] for t in term_info.values()})
+
+        terms = iter_json_lines(
+            os.path.join(self.path, self.manifest["terms"]["file"]), self.codec)
+        for chunk in _chunks(terms, self.batch_size):
+            term_map, new_terms = {}, []
+            for term in chunk:
+                glossary_guid = glossary_map.get(term["anchor"]["glossaryGuid"])
+                if (glossary_guid, term["name"]) in term_names:
+                    term_map["term:" + term["guid"]] = term_names[(glossary_guid, term["name"])]
+                    continue
+                payload = {k: v for k, v in term.items() if k not in _TERM_EXCLUDED_FIELDS}
+                payload["anchor"] = {"glossaryGuid": glossary_guid}
+                new_terms.append((term["guid"], payload))
+            if new_terms:
+                created = glossary_client.upload_terms([p for _, p in new_terms])
+                for (old, _), term in zip(new_terms, created):
+                    term_map["term:" + old] = term["guid"]
+                self.stats.terms += len(new_terms)
+            self.state.record(term_map)
+        self.state.checkpoint("glossaries")
+
+    def _import_entities(self, executor):
+        for shard in self._shards("entities"):
+            for window in self._windows(shard):
+                self.stats.discovered += len(window)
+                done = self.state.get_many(e["guid"] for e in window)
+                self.stats.skipped += len(done)
+                entities = [e for e in window if str(e["guid"]) not in done]
+                # Classifications and terms are applied once every entity exists
+                for entity in entities:
+                    entity.pop("classifications", None)
+                    entity.pop("meanings", None)
+                    (entity.get("relationshipAttributes") or {}).pop("meanings", None)
+                self.stats.fetched += len(entities)
+                if entities:
+                    self._migrate_window(executor, entities)
+
+    def _import_classifications(self, executor):
+        for shard in self._shards("classifications"):
+            for window in self._windows(shard):
+                classified = [e for e in window if e.get("classifications")]
+                mapped = self.state.get_many(e["guid"] for e in classified)
+                targets = self._target_entities(list(mapped.values()))
+                groups = {}
+                for entity in classified:
+                    guid = mapped.get(str(entity["guid"]))
+                    if guid is None:
+                        continue
+                    if guid not in targets:
+                        self.stats.unapplied += 1
+                        continue
+                    existing = {c["typeName"] for c in targets[guid].get("classifications") or []}
+                    for classification in entity["classifications"]:
+                        # Propagated classifications come with their source
+                        if classification.get("entityGuid") not in (None, entity["guid"]):
+                            continue
+                        if classification["typeName"] in existing:
+                            continue
+                        classification = {
+                            k: v for k, v in classification.items()
+                            if k not in _CLASSIFICATION_EXCLUDED_FIELDS}
+                        key = json.dumps(classification, sort_keys=True)
+                        groups.setdefault(key, (classification, []))[1].append(guid)
+
+                calls = [(classification, chunk) for classification, guids in groups.values()
+                         for chunk in _chunks(guids, self.batch_size)]
+                self.stats.classified += self._apply_all(
+                    executor, lambda c, g: self.target.classify_bulk_entities(g, c), calls)
+
+    def _import_term_assignments(self, executor):
+        for shard in self._shards("meanings"):
+            for window in self._windows(shard):
+                assigned = {str(e["guid"]): _term_guids(e) for e in window}
+                assigned = {guid: terms for guid, terms in assigned.items() if terms}
+                mapped = self.state.get_many(
+                    list(assigned) + ["term:" + t for terms in assigned.values() for t in terms])
+                targets = self._target_entities([mapped[g] for g in assigned if g in mapped])
+                groups = {}
+                for guid, terms in assigned.items():
+                    if guid not in mapped:
+                        continue
+                    target = targets.get(mapped[guid])
+                    if target is None:
+                        self.stats.unapplied += len(terms)
+                        continue
+                    existing = _term_guids(target)
+                    for term in terms:
+                        if "term:" + term not in mapped:
+                            logging.warning(f"Term {term} of {guid} is not in the snapshot.")
+                            self.stats.unresolved_references += 1
+                            continue
+                        if mapped["term:" + term] not in existing:
+                            groups.setdefault(mapped["term:" + term], []).append(mapped[guid])
+
+                calls = [(term_guid, chunk) for term_guid, guids in groups.items()
+                         for chunk in _chunks(guids, self.batch_size)]
+                self.stats.assigned_terms += self._apply_all(
+                    executor,
+                    lambda t, g: self.target.glossary.assignTerm(
+                        [{"guid": guid} for guid in g], termGuid=t),
+                    calls)
+
+    def run(self):
+        """
+        Import the snapshot.
+
+        :return: The counts and throughput of the import.
+        :rtype: :class:`~pyapacheatlas.core.snapshot.SnapshotImportStats`
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            self._import_typedefs()
+            self._import_glossaries()
+            self._import_entities(executor)
+            self._fix_deferred(executor)
+            self._import_classifications(executor)
+            if self.include_glossary:
+                self._import_term_assignments(executor)
+
+        self.stats.end_time = time.perf_counter()
+        logging.info(f"Snapshot import complete: {self.stats}")
+        if self.progress:
+            self.progress(self.stats)
+        return self.stats
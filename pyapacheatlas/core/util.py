@@ -1,13 +1,23 @@
 from typing import List, Union
 from .. import __version__
 from functools import wraps
+import gzip
+import itertools
 import json
 from json import JSONDecodeError
+import logging
 import re
+import time
 import warnings
 
 import requests
 
+from .codec import DEFAULT_CODEC, entity_default, get_codec
+from .instrumentation import RequestEvent, _current_retries, _retry_attempt, template_route
+
+DEFAULT_COMPRESSION_THRESHOLD = 16384
+DEFAULT_COMPRESSION_LEVEL = 6
+
 
 class AtlasResponse():
     """
@@ -17,7 +27,10 @@ class AtlasResponse():
     * status_code: The status code returned by the HTTP Response
     * method: The method used to make the HTTP Request
 
-    Takes an option responseNotJson to just read the content.
+    Takes an option responseNotJson to just read the content, an option
+    codec to choose the :class:`~pyapacheatlas.core.codec.JsonCodec` that
+    decodes the body, and an option lazy to keep the raw bytes and only
+    decode them the first time the body is accessed.
 
     * Raises a `ValueError` if a non 204 status code's.
     * Raises a `AtlasException` if 'errorCode' appears in the response text and a 4xx or 5xx status code is returned.
@@ -26,35 +39,81 @@ class AtlasResponse():
     """
 
     def __init__(self, response, **kwargs):
-        self.body = None
+        self._body = None
+        self._raw = None
+        self._codec = kwargs.get("codec") or DEFAULT_CODEC
         self.status_code = response.status_code
         self.method = response.request.method
         self.is_successful = 200 <= response.status_code < 400
         try:
             response.raise_for_status()
-            if response.status_code != 204 and response.text and response.text != "":
+            content = response.content
+            if response.status_code != 204 and content:
                 if "responseNotJson" in kwargs and kwargs["responseNotJson"]:
-                    self.body = response.content
+                    self._body = content
+                elif kwargs.get("lazy"):
+                    self._raw = content
                 else:
-                    self.body = json.loads(response.text)
-        except JSONDecodeError:
+                    self._body = self._codec.loads(content)
+        except ValueError:
             raise ValueError("Error in parsing: {}".format(response.text))
         except requests.RequestException:
             if "errorCode" in response.text:
-                raise AtlasException(response.text)
+                error = AtlasException(response.text)
+                error.status_code = response.status_code
+                raise error
             else:
                 raise requests.RequestException(response.text)
 
+    @property
+    def body(self):
+        """
+        The decoded json (or content when responseNotJson) of the response.
+        A lazy response decodes its raw bytes on first access.
+        """
+        if self._raw is not None:
+            raw = self._raw
+            try:
+                self._body = self._codec.loads(raw)
+            except ValueError:
+                raise ValueError("Error in parsing: {}".format(
+                    raw.decode("utf-8", errors="replace")))
+            self._raw = None
+        return self._body
+
+    @body.setter
+    def body(self, value):
+        self._body = value
+        self._raw = None
+
+    @property
+    def raw(self):
+        """
+        The undecoded bytes of a lazy response or None once it is decoded.
+        """
+        return self._raw
+
 
 class AtlasBaseClient():
     _USER_AGENT = {"User-Agent": "pyapacheatlas/{0} {1}".format(
         __version__, requests.utils.default_headers().get("User-Agent"))}
+    # Kwargs that configure how every client sends and receives requests
+    _CLIENT_ARGS = ["json_codec", "lazy_responses", "compress_requests",
+                    "compression_threshold", "compression_level", "hooks"]
 
     def __init__(self, **kwargs):
         if "requests_args" in kwargs:
             self._requests_args = kwargs["requests_args"]
         else:
             self._requests_args = {}
+        self._json_codec = get_codec(kwargs.get("json_codec"))
+        self._lazy_responses = kwargs.get("lazy_responses", False)
+        self._compress_requests = kwargs.get("compress_requests", False)
+        self._compression_threshold = kwargs.get(
+            "compression_threshold", DEFAULT_COMPRESSION_THRESHOLD)
+        self._compression_level = kwargs.get(
+            "compression_level", DEFAULT_COMPRESSION_LEVEL)
+        self.hooks = list(kwargs.get("hooks") or [])
         super().__init__()
 
     @staticmethod
@@ -65,6 +124,102 @@ class AtlasBaseClient():
             output[k.split("_", 1)[1]] = kwargs.pop(k)
         return output
 
+    @staticmethod
+    def _parse_client_args(**kwargs):
+        """
+        Pick out the kwargs that configure how requests are sent and
+        responses are read so they can be shared with the sub clients.
+
+        :return: The client kwargs that were provided.
+        :rtype: dict
+        """
+        return {k: v for k, v in kwargs.items() if k in AtlasBaseClient._CLIENT_ARGS}
+
+    def _encode_json(self, body, headers):
+        """
+        Encode a json request body with the client's codec. Objects with a
+        to_json method (e.g. AtlasEntity) are converted while encoding.
+
+        :param Union(list, dict) body: The json body to encode.
+        :param dict headers: The request headers, updated with the content type.
+        :return: The encoded body.
+        :rtype: bytes
+        """
+        headers.setdefault("Content-Type", "application/json")
+        return self._json_codec.dumps(body, default=entity_default)
+
+    def _compress_body(self, data, headers):
+        """
+        Gzip an encoded request body when compress_requests is enabled and
+        the body is at least compression_threshold bytes.
+
+        :param bytes data: The encoded request body.
+        :param dict headers: The request headers, updated with the content encoding.
+        :return: The (possibly compressed) body.
+        :rtype: bytes
+        """
+        if not self._compress_requests or len(data) < self._compression_threshold:
+            return data
+        headers["Content-Encoding"] = "gzip"
+        return gzip.compress(data, compresslevel=self._compression_level)
+
+    def _call_hooks(self, name, event):
+        """
+        Call the `name` method of every hook with the event. A hook that
+        raises is logged and does not change the outcome of the request.
+        """
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(event)
+            except Exception:
+                logging.exception(f"The {name} hook {hook!r} failed.")
+
+    def _send(self, method, url, **kwargs):
+        """
+        Send a request with the `requests` package and call the client's
+        hooks before the request and after the response.
+
+        :param str method: The http method (GET, POST, PUT, DELETE).
+        :param str url: The url of the request.
+        :return: The response from the requests package.
+        :rtype: requests.Response
+        """
+        send = getattr(requests, method.lower())
+        if not self.hooks:
+            return send(url, **kwargs, **self._requests_args)
+
+        data = kwargs.get("data")
+        event = RequestEvent(
+            method, url,
+            template_route(url, getattr(self, "endpoint_url", None)),
+            bytes_sent=len(data) if isinstance(data, (bytes, str)) else 0
+        )
+        event.retries = _current_retries()
+        self._call_hooks("before_request", event)
+
+        start = time.perf_counter()
+        try:
+            response = send(url, **kwargs, **self._requests_args)
+        except Exception as e:
+            event.error = e
+            raise
+        else:
+            event.status_code = response.status_code
+            event.bytes_received = len(response.content or b"")
+            if not event.bytes_sent and response.request is not None:
+                # Multipart uploads are only measurable once prepared
+                body = getattr(response.request, "body", None)
+                if isinstance(body, (bytes, str)):
+                    event.bytes_sent = len(body)
+        finally:
+            event.latency = time.perf_counter() - start
+            self._call_hooks("after_response", event)
+        return response
+
+    def _make_response(self, response, **kwargs):
+        return AtlasResponse(response, codec=self._json_codec,
+                             lazy=self._lazy_responses, **kwargs)
+
     def _handle_response(self, resp):
         """
         Safely handle an Atlas Response and return the results if valid.
@@ -92,12 +247,11 @@ class AtlasBaseClient():
         :kwargs dict headers_include:Additional headers to include.
         :kwargs List[str] headers_include:Additional headers to include.
         """
-        return AtlasResponse(requests.get(
-            url,
+        return self._make_response(self._send(
+            "GET", url,
             params=params,
             headers=self.generate_request_headers(kwargs.get(
                 "headers_include"), kwargs.get("headers_exclude")),
-            **self._requests_args
         ))
 
     def _post_http(self, url: str, params: dict = None,
@@ -107,9 +261,12 @@ class AtlasBaseClient():
         :kwargs dict headers_include:Additional headers to include.
         :kwargs List[str] headers_include:Additional headers to include.
         """
+        headers = self.generate_request_headers(kwargs.get(
+            "headers_include"), kwargs.get("headers_exclude"))
         extra_args = {}
         if json:
-            extra_args["json"] = json
+            extra_args["data"] = self._compress_body(
+                self._encode_json(json, headers), headers)
         if params:
             extra_args["params"] = params
         if files:
@@ -117,13 +274,11 @@ class AtlasBaseClient():
         response_args = {}
         if "responseNotJson" in kwargs:
             response_args["responseNotJson"] = kwargs["responseNotJson"]
-        return AtlasResponse(
-            requests.post(
-                url,
-                headers=self.generate_request_headers(kwargs.get(
-                    "headers_include"), kwargs.get("headers_exclude")),
-                **extra_args,
-                **self._requests_args
+        return self._make_response(
+            self._send(
+                "POST", url,
+                headers=headers,
+                **extra_args
             ),
             **response_args
         )
@@ -133,17 +288,17 @@ class AtlasBaseClient():
         :kwargs dict headers_include:Additional headers to include.
         :kwargs List[str] headers_include:Additional headers to include.
         """
+        headers = self.generate_request_headers(kwargs.get(
+            "headers_include"), kwargs.get("headers_exclude"))
         extra_args = {}
         if json:
-            extra_args["json"] = json
+            extra_args["data"] = self._encode_json(json, headers)
         if params:
             extra_args["params"] = params
-        return AtlasResponse(requests.delete(
-            url,
-            headers=self.generate_request_headers(kwargs.get(
-                "headers_include"), kwargs.get("headers_exclude")),
-            **extra_args,
-            **self._requests_args
+        return self._make_response(self._send(
+            "DELETE", url,
+            headers=headers,
+            **extra_args
         ))
 
     def _put_http(self, url: str, params: dict = None, json: Union[list, dict] = None, **kwargs) -> AtlasResponse:
@@ -151,17 +306,18 @@ class AtlasBaseClient():
         :kwargs dict headers_include:Additional headers to include.
         :kwargs List[str] headers_include:Additional headers to include.
         """
+        headers = self.generate_request_headers(kwargs.get(
+            "headers_include"), kwargs.get("headers_exclude"))
         extra_args = {}
         if json:
-            extra_args["json"] = json
+            extra_args["data"] = self._compress_body(
+                self._encode_json(json, headers), headers)
         if params:
             extra_args["params"] = params
-        return AtlasResponse(requests.put(
-            url,
-            headers=self.generate_request_headers(kwargs.get(
-                "headers_include"), kwargs.get("headers_exclude")),
-            **extra_args,
-            **self._requests_args
+        return self._make_response(self._send(
+            "PUT", url,
+            headers=headers,
+            **extra_args
         ))
 
     def generate_request_headers(self, include: dict = {}, exclude: List[str] = []):
@@ -184,11 +340,24 @@ class AtlasUnInit():
     """
     Represents a value that has not been initialized
     and will not be included in json body.
+
+    Every call returns the same shared instance so that objects with many
+    uninitialized fields do not each hold their own sentinel.
     """
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
     def __bool__(self):
         return False
 
+    def __repr__(self):
+        return "AtlasUnInit()"
+
 
 def PurviewOnly(func):
     """
@@ -309,7 +478,8 @@ def batch_dependent_entities(entities, batch_size=1000):
     columns may point to the given table. This will be handled by this
     function.
 
-    :param list(dict) entities: A list of AtlasEntities to be uploaded as dicts
+    :param list(dict) entities:
+        A list of AtlasEntities to be uploaded as dicts or RawAtlasEntity views.
     :param int batch_size:
     :return:
         A list of lists that organize the entities into batches of max
@@ -492,6 +662,43 @@ def batch_dependent_entities(entities, batch_size=1000):
     return output_batches
 
 
+def _chunks(iterable, size):
+    """
+    Yield lists of up to `size` items from an iterable.
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _is_not_found(error):
+    """
+    Whether an AtlasException means the type or entity does not exist.
+    """
+    return getattr(error, "status_code", None) == 404
+
+
+def _with_retries(func, max_retries=3, backoff=1.0):
+    """
+    Call func and retry it with exponential backoff when the request fails.
+    Client errors (e.g. an entity that does not exist) are not retried.
+    """
+    for attempt in itertools.count():
+        try:
+            with _retry_attempt(attempt):
+                return func()
+        except (AtlasException, requests.RequestException) as e:
+            status_code = getattr(e, "status_code", None)
+            permanent = status_code is not None and 400 <= status_code < 500 \
+                and status_code not in (408, 429)
+            if permanent or attempt >= max_retries:
+                raise
+            time.sleep(backoff * (2 ** attempt))
+
+
 def _handle_response(resp):
     """
     Safely handle an Atlas Response and return the results if valid.
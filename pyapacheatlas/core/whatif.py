@@ -1,8 +1,41 @@
 from collections import namedtuple
 import json
+from multiprocessing import Pool
 import warnings
 
+from .util import AtlasException, _is_not_found
+
 EntityField = namedtuple("EntityField", ["name", "isOptional"])
+WhatIfIssue = namedtuple("WhatIfIssue", ["check", "guid", "details"])
+
+_PRIMITIVE_TYPES = set([
+    "boolean", "byte", "short", "int", "long", "float", "double",
+    "biginteger", "bigdecimal", "string", "date", "object"
+])
+
+# The validator used by worker processes in validate_entities. It is set once
+# per process by the pool initializer rather than pickled for every chunk.
+_WORKER_VALIDATOR = None
+
+
+def _init_worker(validator):
+    global _WORKER_VALIDATOR
+    _WORKER_VALIDATOR = validator
+
+
+def _validate_chunk(entities):
+    return list(_WORKER_VALIDATOR.iter_issues(entities))
+
+
+def _chunked(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
 
 
 class WhatIfValidator():
@@ -11,6 +44,11 @@ class WhatIfValidator():
     upload.  Provides functions to validate the type, check if required
     attributes are missing, and check if superfluous attributes are included.
 
+    The valid and required attributes of every entity type are compiled once
+    when the validator is created. Attributes are inherited from all of a
+    type's superTypes. Super types that are not in the provided type_defs
+    fall back to the attributes of the base Atlas model (e.g. DataSet).
+
     :param dict type_defs:
         The list of type definitions to be validated against.  Should be
         in the form of an AtlasTypeDef composite wrapper.
@@ -36,34 +74,203 @@ class WhatIfValidator():
 
         self.classification_defs = type_defs.get("classificationDefs", [])
         self.entity_defs = type_defs.get("entityDefs", [])
-        # Create a dict of all entities by name, then find the name of all
-        # attributes and whether they are optional
-        entity_fields = {}
-        for e in self.entity_defs:
-            entity_fields[e["name"]] = []
-            for attr in e.get("attributeDefs", []):
-                ef = EntityField(attr.get("name"), attr.get("isOptional"))
-                entity_fields[e["name"]].append(ef)
-
-        # Adding Qualified Name to the set of valid fields as it doesn't
-        # show up in the entity type def
-        self.entity_valid_fields = {k: set(
-            [field.name for field in v] + ["qualifiedName"])
-            for k, v in entity_fields.items()}
-        # Adding Qualified Name to the set of required entity
-        # fields as it doesn't show up in the entity type def
-        self.entity_required_fields = {
-            k: set([field.name for field in v if not field.isOptional] + [
-                "qualifiedName"]) for k, v in entity_fields.items()
+        self.enum_defs = type_defs.get("enumDefs", [])
+        self.relationship_defs = type_defs.get("relationshipDefs", [])
+        self.struct_defs = type_defs.get("structDefs", [])
+
+        self._entity_defs_by_name = {e["name"]: e for e in self.entity_defs}
+        self._enum_values = {
+            e["name"]: set(v.get("value") for v in e.get("elementDefs", []))
+            for e in self.enum_defs
         }
 
+        # Relationship attributes declared by relationship defs live on the
+        # entity types referenced in each of the end defs.
+        relationships_by_type = {}
+        for rel in self.relationship_defs:
+            for end in ["endDef1", "endDef2"]:
+                end_def = rel.get(end, {})
+                if "type" in end_def and "name" in end_def:
+                    relationships_by_type.setdefault(
+                        end_def["type"], set()).add(end_def["name"])
+
+        self.entity_valid_fields = {}
+        self.entity_required_fields = {}
+        self.entity_relationship_fields = {}
+        self._enum_attributes = {}
+        for type_name in self._entity_defs_by_name:
+            self._compile_type(type_name, relationships_by_type)
+
         self.existing_entities = set(
             [e.get("attributes", {}).get("qualifiedName") for
              e in existing_entities])
 
-        self.enum_defs = type_defs.get("enumDefs", [])
-        self.relationship_defs = type_defs.get("relationshipDefs", [])
-        self.struct_defs = type_defs.get("structDefs", [])
+    @classmethod
+    def from_client(cls, client, entities, batch_size=100):
+        """
+        Create a WhatIfValidator by looking up only the type defs and existing
+        entities that are used by the provided entities. The entity type defs
+        are retrieved along with all of their super types and any enum defs
+        their attributes use. Existing entities are found by their typeName
+        and qualifiedName in batches of `batch_size`.
+
+        .. code-block:: python
+
+            whatif = WhatIfValidator.from_client(client, entities)
+            report = whatif.validate_entities(entities)
+
+        :param client: The client used to look up type defs and entities.
+        :type client: :class:`~pyapacheatlas.core.client.AtlasClient`
+        :param entities: The entities you intend to upload.
+        :type entities:
+            list(Union(dict, :class:`~pyapacheatlas.core.entity.AtlasEntity`))
+        :param int batch_size:
+            The maximum number of qualified names to look up in one request.
+        :return: A validator for the provided entities.
+        :rtype: :class:`~pyapacheatlas.core.whatif.WhatIfValidator`
+        """
+        qualified_names_by_type = {}
+        for entity in entities:
+            if not isinstance(entity, dict):
+                entity = entity.to_json()
+            qualified_name = (entity.get("attributes") or {}).get(
+                "qualifiedName")
+            # A dict keeps the qualified names unique and in order
+            names = qualified_names_by_type.setdefault(entity["typeName"], {})
+            if qualified_name is not None:
+                names[qualified_name] = None
+
+        type_defs = {"entityDefs": [], "enumDefs": []}
+        seen_types = set()
+        attribute_types = set()
+        to_visit = list(qualified_names_by_type.keys())
+        while to_visit:
+            type_name = to_visit.pop()
+            if type_name in seen_types:
+                continue
+            seen_types.add(type_name)
+            type_def = cls._get_typedef(client, type_name)
+            if type_def.get("category") != "ENTITY":
+                continue
+            type_defs["entityDefs"].append(type_def)
+            to_visit.extend(type_def.get("superTypes", []))
+            for attr in type_def.get("attributeDefs", []):
+                attr_type = attr.get("typeName", "")
+                if attr_type.startswith("array<") and attr_type.endswith(">"):
+                    attr_type = attr_type[len("array<"):-1]
+                if attr_type not in _PRIMITIVE_TYPES and "<" not in attr_type:
+                    attribute_types.add(attr_type)
+
+        # Only the enums are needed from the types used by attributes
+        for type_name in attribute_types.difference(seen_types):
+            type_def = cls._get_typedef(client, type_name)
+            if type_def.get("category") == "ENUM":
+                type_defs["enumDefs"].append(type_def)
+
+        existing_entities = []
+        known_types = set(e["name"] for e in type_defs["entityDefs"])
+        for type_name, qualified_names in qualified_names_by_type.items():
+            if type_name not in known_types:
+                continue
+            qualified_names = list(qualified_names)
+            for start in range(0, len(qualified_names), batch_size):
+                existing_entities.extend(
+                    cls._get_existing_entities(
+                        client, type_name,
+                        qualified_names[start:start + batch_size])
+                )
+
+        return cls(type_defs=type_defs, existing_entities=existing_entities)
+
+    @staticmethod
+    def _get_typedef(client, type_name):
+        """
+        Retrieve the type def by name or an empty dict if it does not exist.
+        Any other error is raised.
+        """
+        try:
+            return client.get_typedef(name=type_name) or {}
+        except AtlasException as e:
+            if not _is_not_found(e):
+                raise
+            return {}
+
+    @classmethod
+    def _get_existing_entities(cls, client, type_name, qualified_names):
+        """
+        Look up the existing entities in one request. If the service rejects
+        the batch because an entity does not exist, split the batch in half
+        and try again so the remaining entities are still found. Any other
+        error is raised.
+        """
+        try:
+            response = client.get_entity(
+                qualifiedName=qualified_names, typeName=type_name,
+                ignoreRelationships=True, minExtInfo=True)
+            return (response or {}).get("entities", [])
+        except AtlasException as e:
+            if not _is_not_found(e):
+                raise
+            if len(qualified_names) == 1:
+                return []
+            middle = len(qualified_names) // 2
+            return (
+                cls._get_existing_entities(
+                    client, type_name, qualified_names[:middle]) +
+                cls._get_existing_entities(
+                    client, type_name, qualified_names[middle:])
+            )
+
+    def _compile_type(self, type_name, relationships_by_type):
+        """
+        Walk every superType of the given type and store the inherited valid,
+        required, relationship, and enum attributes for that type.
+        """
+        valid = set(["qualifiedName"])
+        required = set(["qualifiedName"])
+        relationships = set()
+        enums = {}
+        # The relationship attributes can only be validated when the
+        # whole type hierarchy is known.
+        hierarchy_is_complete = True
+
+        seen = set()
+        to_visit = [type_name]
+        while to_visit:
+            current = to_visit.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+
+            if current not in self._entity_defs_by_name:
+                hierarchy_is_complete = False
+                valid.update(self.ATLAS_MODEL.get(current.upper(), []))
+                continue
+
+            current_def = self._entity_defs_by_name[current]
+            for attr in current_def.get("attributeDefs", []):
+                field = EntityField(attr.get("name"), attr.get("isOptional"))
+                valid.add(field.name)
+                if not field.isOptional:
+                    required.add(field.name)
+                attr_type = attr.get("typeName", "")
+                if attr_type.startswith("array<") and attr_type.endswith(">"):
+                    attr_type = attr_type[len("array<"):-1]
+                if attr_type in self._enum_values:
+                    enums[field.name] = self._enum_values[attr_type]
+
+            relationships.update(
+                attr.get("name") for attr in
+                current_def.get("relationshipAttributeDefs", []))
+            relationships.update(relationships_by_type.get(current, set()))
+            to_visit.extend(current_def.get("superTypes", []))
+
+        self.entity_valid_fields[type_name] = valid
+        self.entity_required_fields[type_name] = required
+        if hierarchy_is_complete:
+            self.entity_relationship_fields[type_name] = relationships
+        if enums:
+            self._enum_attributes[type_name] = enums
 
     def entity_type_exists(self, entity):
         """
@@ -89,9 +296,8 @@ class WhatIfValidator():
         :rtype: bool
         """
 
-        current_attributes = set(entity.get("attributes", {}).keys())
-        required_attributes = set(
-            self.entity_required_fields[entity["typeName"]])
+        current_attributes = (entity.get("attributes") or {}).keys()
+        required_attributes = self.entity_required_fields[entity["typeName"]]
         missing_attributes = required_attributes.difference(current_attributes)
         if len(missing_attributes) > 0:
             return missing_attributes
@@ -101,23 +307,14 @@ class WhatIfValidator():
     def entity_has_invalid_attributes(self, entity):
         """
         Check if the entity is using attributes that are not defined
-        on the type.
+        on the type or any of its super types.
 
         :param dict entity:
         :return: Whether the entity matches the list of known entity types.
         :rtype: bool
         """
-        current_attributes = set(entity.get("attributes", {}).keys())
-        valid_attributes = set(self.entity_valid_fields[entity["typeName"]])
-        # Append inherited attributes:
-        _entity_type = entity["typeName"]
-        # Assuming only one entity matches and only one super type
-        super_type = [e["superTypes"]
-                      for e in self.entity_defs
-                      if e["name"] == _entity_type][0][0].upper()
-        if super_type in self.ATLAS_MODEL:
-            valid_attributes = valid_attributes.union(
-                self.ATLAS_MODEL[super_type])
+        current_attributes = set((entity.get("attributes") or {}).keys())
+        valid_attributes = self.entity_valid_fields[entity["typeName"]]
         invalid_attributes = current_attributes.difference(valid_attributes)
 
         if len(invalid_attributes) > 0:
@@ -125,6 +322,65 @@ class WhatIfValidator():
         else:
             return False
 
+    def entity_has_invalid_relationship_attributes(self, entity):
+        """
+        Check if the entity is using relationship attributes that are not
+        defined on the type, its super types, or any relationship def. This
+        is only checked when every super type of the entity's type is included
+        in the type defs. Otherwise, it always passes.
+
+        :param dict entity:
+        :return:
+            The set of undefined relationship attributes or False if there
+            are none.
+        :rtype: Union(set(str), bool)
+        """
+        valid_relationships = self.entity_relationship_fields.get(
+            entity["typeName"])
+        if valid_relationships is None:
+            return False
+
+        current_relationships = set(
+            (entity.get("relationshipAttributes") or {}).keys())
+        invalid_relationships = current_relationships.difference(
+            valid_relationships)
+
+        if len(invalid_relationships) > 0:
+            return invalid_relationships
+        else:
+            return False
+
+    def entity_has_invalid_enum_values(self, entity):
+        """
+        Check if the entity is using values for enum attributes that are not
+        defined in the enum def.
+
+        :param dict entity:
+        :return:
+            A dict of attribute names and their invalid values or False if
+            there are none.
+        :rtype: Union(dict(str, list(str)), bool)
+        """
+        enum_attributes = self._enum_attributes.get(entity["typeName"])
+        if not enum_attributes:
+            return False
+
+        attributes = entity.get("attributes") or {}
+        invalid_values = {}
+        for attr_name, allowed in enum_attributes.items():
+            value = attributes.get(attr_name)
+            if value is None:
+                continue
+            values = value if isinstance(value, list) else [value]
+            bad_values = [v for v in values if v not in allowed]
+            if bad_values:
+                invalid_values[attr_name] = bad_values
+
+        if len(invalid_values) > 0:
+            return invalid_values
+        else:
+            return False
+
     def entity_would_overwrite(self, entity):
         """
         Based on the qualified name attributes, does the provided
@@ -145,33 +401,83 @@ class WhatIfValidator():
         else:
             return False
 
-    def validate_entities(self, entities):
+    def iter_issues(self, entities):
         """
-        Provide a report of invalid entities.  Includes TypeDoesNotExist,
-        UsingInvalidAttributes, and MissingRequiredAttributes.
+        Validate the entities one at a time and yield each problem found.
+        Useful for streaming a report over a very large batch without holding
+        the full report in memory.
 
-        :param list(dict) entities: A list of entities to validate.
-        :return: A dictionary containing counts values for the above values.
-        :rtype: dict
+        :param entities: An iterable of entities (as dicts) to validate.
+        :type entities: Iterable(dict)
+        :return:
+            A generator of WhatIfIssue namedtuples with a check (one of the
+            report keys in validate_entities), the entity's guid, and the
+            details of the problem.
+        :rtype: Iterator(:class:`~pyapacheatlas.core.whatif.WhatIfIssue`)
         """
-        report = {"TypeDoesNotExist": [], "UsingInvalidAttributes": {},
-                  "MissingRequiredAttributes": {}}
-
         for entity in entities:
+            cur_guid = entity["guid"]
             if not self.entity_type_exists(entity):
-                report["TypeDoesNotExist"].append(entity["guid"])
                 # If it's an invalid type, we have to skip over the rest
                 # of this
+                yield WhatIfIssue("TypeDoesNotExist", cur_guid, None)
                 continue
 
             using_invalid = self.entity_has_invalid_attributes(entity)
-            is_missing = self.entity_missing_attributes(entity)
-            cur_guid = entity["guid"]
             if using_invalid:
-                report["UsingInvalidAttributes"][cur_guid] = using_invalid
+                yield WhatIfIssue(
+                    "UsingInvalidAttributes", cur_guid, using_invalid)
 
+            is_missing = self.entity_missing_attributes(entity)
             if is_missing:
-                report["MissingRequiredAttributes"][cur_guid] = is_missing
+                yield WhatIfIssue(
+                    "MissingRequiredAttributes", cur_guid, is_missing)
+
+            invalid_relationships = self.entity_has_invalid_relationship_attributes(
+                entity)
+            if invalid_relationships:
+                yield WhatIfIssue(
+                    "UsingInvalidRelationshipAttributes", cur_guid,
+                    invalid_relationships)
+
+            invalid_enums = self.entity_has_invalid_enum_values(entity)
+            if invalid_enums:
+                yield WhatIfIssue("InvalidEnumValues", cur_guid, invalid_enums)
+
+    def validate_entities(self, entities, processes=None, chunk_size=10000):
+        """
+        Provide a report of invalid entities.  Includes TypeDoesNotExist,
+        UsingInvalidAttributes, MissingRequiredAttributes,
+        UsingInvalidRelationshipAttributes, and InvalidEnumValues.
+
+        :param entities: A list or iterable of entities to validate.
+        :type entities: Iterable(dict)
+        :param int processes:
+            The number of worker processes to validate with. Defaults to
+            validating in the current process.
+        :param int chunk_size:
+            The number of entities sent to a worker process at a time. Only
+            used when processes is greater than one.
+        :return: A dictionary containing counts values for the above values.
+        :rtype: dict
+        """
+        report = {"TypeDoesNotExist": [], "UsingInvalidAttributes": {},
+                  "MissingRequiredAttributes": {},
+                  "UsingInvalidRelationshipAttributes": {},
+                  "InvalidEnumValues": {}}
+
+        if processes and processes > 1:
+            with Pool(processes, initializer=_init_worker,
+                      initargs=(self,)) as pool:
+                issues = (
+                    issue
+                    for chunk_issues in pool.imap(
+                        _validate_chunk, _chunked(entities, chunk_size))
+                    for issue in chunk_issues
+                )
+                self._add_to_report(report, issues)
+        else:
+            self._add_to_report(report, self.iter_issues(entities))
 
         output = {
             "counts": {k: len(v) for k, v in report.items()},
@@ -180,3 +486,11 @@ class WhatIfValidator():
         output.update({"total": sum(output["counts"].values())})
 
         return output
+
+    @staticmethod
+    def _add_to_report(report, issues):
+        for issue in issues:
+            if issue.check == "TypeDoesNotExist":
+                report[issue.check].append(issue.guid)
+            else:
+                report[issue.check][issue.guid] = issue.details
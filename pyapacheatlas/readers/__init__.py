@@ -1 +1,2 @@
 from .excel import ExcelConfiguration, ExcelReader
+from .flatfile import CsvConfiguration, CsvReader, JsonLinesConfiguration, JsonLinesReader
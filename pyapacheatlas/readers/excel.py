@@ -72,6 +72,37 @@ class ExcelReader(Reader):
     Expects an :class:`~pyapacheatlas.readers.excel.ExcelConfiguration` object
     to determine the naming conventions of tabs and headers.
     """
+    @staticmethod
+    def _iter_spreadsheet(worksheet):
+        """
+        Standardizes the excel worksheet into a json format one row at a time.
+        Supports read only worksheets so that only one row is held in memory.
+
+        :param openpyxl.worksheet.worksheet.Worksheet worksheet:
+            A worksheet (or read only worksheet) class from openpyxl.
+        :return:
+            A generator of the excel spreadsheet's rows in json form.
+        :rtype: Iterator(dict(str,str))
+        """
+        if hasattr(worksheet, "reset_dimensions"):
+            # Read only worksheets trust the dimensions saved in the file
+            # which some tools write incorrectly.
+            worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+        # Standardize the column header
+        # TODO: Allow for skip lines
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        column_headers = [str(c).strip() for c in header_row]
+        num_headers = len(column_headers)
+
+        for row in rows:
+            # Read only worksheets may leave off the empty trailing cells
+            if len(row) < num_headers:
+                row = tuple(row) + (None,) * (num_headers - len(row))
+            yield dict(zip(column_headers, row))
+
     @staticmethod
     def _parse_spreadsheet(worksheet):
         """
@@ -83,25 +114,9 @@ class ExcelReader(Reader):
             The standardized version of the excel spreadsheet in json form.
         :rtype: list(dict(str,str))
         """
-        # Standardize the column header
-        # TODO: Allow for skip lines
-        column_headers = list(
-            zip(
-                range(0, len(worksheet[1])),
-                [str(c.value).strip() for c in worksheet[1]]
-            )
-        )
-
-        output = []
-        for row in worksheet.iter_rows(
-                min_row=2, max_row=worksheet.max_row,
-                min_col=1, max_col=worksheet.max_column):
-            output.append(
-                {k: row[idx].value for idx, k in column_headers})
-
-        return output
+        return list(ExcelReader._iter_spreadsheet(worksheet))
 
-    def parse_bulk_entities(self, filepath, contacts_func=None):
+    def parse_bulk_entities(self, filepath, contacts_func=None, processes=None, chunk_size=10000):
         """
         Generate a set of entities from an excel template file.
 
@@ -125,11 +140,17 @@ class ExcelReader(Reader):
             to the experts and owners section.
             It has a built in cache that will prevent redundant calls
             to your function.
+        :param int processes:
+            The number of worker processes to convert rows with. Defaults to
+            converting in the current process.
+        :param int chunk_size:
+            The number of rows sent to a worker process at a time. Only
+            used when processes is greater than one.
 
         :return: An AtlasTypeDef with entityDefs for the provided rows.
         :rtype: dict(str, list(dict))
         """
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
 
         sheetIsNotPresent = self.config.bulkEntity_sheet not in wb.sheetnames
         if self.config.bulkEntity_sheet and sheetIsNotPresent:
@@ -140,10 +161,11 @@ class ExcelReader(Reader):
 
         if self.config.bulkEntity_sheet:
             bulkEntity_sheet = wb[self.config.bulkEntity_sheet]
-            json_bulkEntities = ExcelReader._parse_spreadsheet(
+            json_bulkEntities = ExcelReader._iter_spreadsheet(
                 bulkEntity_sheet)
             bulkEntities_generated = super().parse_bulk_entities(
-                json_bulkEntities, contacts_func)
+                json_bulkEntities, contacts_func, processes=processes,
+                chunk_size=chunk_size)
             output.update(bulkEntities_generated)
 
         wb.close()
@@ -163,7 +185,7 @@ class ExcelReader(Reader):
         :return: An AtlasTypeDef with entityDefs for the provided rows.
         :rtype: dict(str, list(dict))
         """
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
         # A user may omit the entityDef_sheet by providing the config with None
         sheetIsNotPresent = self.config.entityDef_sheet not in wb.sheetnames
         if self.config.entityDef_sheet and sheetIsNotPresent:
@@ -175,7 +197,7 @@ class ExcelReader(Reader):
         # Getting entityDefinitions if the user provided a name of the sheet
         if self.config.entityDef_sheet:
             entityDef_sheet = wb[self.config.entityDef_sheet]
-            json_entitydefs = ExcelReader._parse_spreadsheet(entityDef_sheet)
+            json_entitydefs = ExcelReader._iter_spreadsheet(entityDef_sheet)
             entityDefs_generated = super().parse_entity_defs(json_entitydefs)
             output.update(entityDefs_generated)
 
@@ -215,7 +237,7 @@ class ExcelReader(Reader):
         :rtype: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
         """
 
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
 
         if self.config.column_sheet not in wb.sheetnames:
             raise KeyError("The sheet {} was not found".format(
@@ -223,7 +245,7 @@ class ExcelReader(Reader):
 
         # Getting column entities
         column_sheet = wb[self.config.column_sheet]
-        json_columns = ExcelReader._parse_spreadsheet(column_sheet)
+        json_columns = ExcelReader._iter_spreadsheet(column_sheet)
 
         entities = super().parse_finegrain_column_lineage(
             json_columns,
@@ -251,7 +273,7 @@ class ExcelReader(Reader):
         :rtype: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
         """
 
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
 
         entities = []
 
@@ -261,7 +283,7 @@ class ExcelReader(Reader):
 
         # Getting table entities
         table_sheet = wb[self.config.table_sheet]
-        json_sheet = ExcelReader._parse_spreadsheet(table_sheet)
+        json_sheet = ExcelReader._iter_spreadsheet(table_sheet)
         entities = super().parse_table_lineage(json_sheet)
 
         wb.close()
@@ -335,7 +357,7 @@ class ExcelReader(Reader):
             contents.
         :rtype: list(dict)
         """
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
 
         entities = []
 
@@ -345,7 +367,7 @@ class ExcelReader(Reader):
 
         # Getting table entities
         updateLineage_sheet = wb[self.config.updateLineage_sheet]
-        json_sheet = ExcelReader._parse_spreadsheet(updateLineage_sheet)
+        json_sheet = ExcelReader._iter_spreadsheet(updateLineage_sheet)
         entities = super().parse_update_lineage(json_sheet)
 
         wb.close()
@@ -368,7 +390,7 @@ class ExcelReader(Reader):
             contents.
         :rtype: list(dict)
         """
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
 
         entities = []
 
@@ -378,7 +400,7 @@ class ExcelReader(Reader):
 
         # Getting table entities
         columnMapping_sheet = wb[self.config.columnMapping_sheet]
-        json_sheet = ExcelReader._parse_spreadsheet(columnMapping_sheet)
+        json_sheet = ExcelReader._iter_spreadsheet(columnMapping_sheet)
         entities = super().parse_column_mapping(json_sheet)
 
         wb.close()
@@ -402,6 +424,20 @@ class ExcelReader(Reader):
 
         lineage = self.parse_update_lineage(filepath)
         mappings = self.parse_column_mapping(filepath)
+        return ExcelReader._merge_lineage_and_mappings(lineage, mappings)
+
+    @staticmethod
+    def _merge_lineage_and_mappings(lineage, mappings):
+        """
+        Combine the update lineage and column mapping process entities that
+        share a qualifiedName by adding the columnMapping attribute to the
+        update lineage process.
+
+        :param list(dict) lineage: The update lineage process entities.
+        :param list(dict) mappings: The column mapping process entities.
+        :return: The merged process entities.
+        :rtype: list(dict)
+        """
         seen_qualifiedNames = {}
         for working_entity in lineage + mappings:
             qn = working_entity["attributes"]["qualifiedName"]
@@ -429,7 +465,7 @@ class ExcelReader(Reader):
             contents.
         :rtype: list(dict)
         """
-        wb = load_workbook(filepath)
+        wb = load_workbook(filepath, read_only=True)
         # A user may omit the classificationDef_sheet by providing the config with None
         sheetIsNotPresent = self.config.classificationDef_sheet not in wb.sheetnames
         if self.config.classificationDef_sheet and sheetIsNotPresent:
@@ -441,7 +477,7 @@ class ExcelReader(Reader):
         # Getting classificationDef if the user provided a name of the sheet
         if self.config.classificationDef_sheet:
             classificationDef_sheet = wb[self.config.classificationDef_sheet]
-            json_classificationdefs = ExcelReader._parse_spreadsheet(
+            json_classificationdefs = ExcelReader._iter_spreadsheet(
                 classificationDef_sheet)
             classificationDefs_generated = super(
             ).parse_classification_defs(json_classificationdefs)
@@ -450,6 +486,117 @@ class ExcelReader(Reader):
         wb.close()
         return output
 
+    def parse_workbook(self, filepath, sheets=None, atlas_typedefs=None,
+                       contacts_func=None, use_column_mapping=False):
+        """
+        Read a given excel file that conforms to the excel atlas template and
+        parse every configured sheet while only opening the file once.
+
+        The sheets are parsed in the order: EntityDefs, ClassificationDefs,
+        BulkEntities, TablesLineage, FineGrainColumnLineage, UpdateLineage,
+        and ColumnMapping (using the sheet names from the ExcelConfiguration).
+        The UpdateLineage and ColumnMapping processes are merged as in
+        `parse_update_lineage_with_mappings`.
+
+        .. code-block:: python
+
+            results = reader.parse_workbook("template.xlsx")
+            client.upload_typedefs(results["typedefs"], force_update=True)
+            client.upload_entities(results["entities"])
+            client.upload_entities(results["lineage"])
+
+        :param str filepath:
+            The xlsx file that contains your table and columns.
+        :param list(str) sheets:
+            The names of the sheets to parse. Defaults to every configured
+            sheet that is present in the workbook. The FineGrainColumnLineage
+            sheet is only included by default when atlas_typedefs is provided.
+        :param dict(str,list(dict)) atlas_typedefs:
+            The type defs that include the relationshipDefs required by
+            the FineGrainColumnLineage sheet.
+        :param function contacts_func:
+            For Azure Purview, a function to be called on each experts or
+            owners value in the BulkEntities sheet.
+        :param bool use_column_mapping:
+            Should the table processes include the columnMappings attribute
+            when parsing the FineGrainColumnLineage sheet.
+        :return:
+            A dict with keys `typedefs` (an AtlasTypesDef), `entities` (the
+            bulk entities as dicts), and `lineage` (the lineage process and
+            referenced entities as dicts).
+        :rtype: dict(str, Union(dict, list(dict)))
+        """
+        wb = load_workbook(filepath, read_only=True)
+
+        try:
+            if sheets is None:
+                sheets = [
+                    name for name in [
+                        self.config.entityDef_sheet,
+                        self.config.classificationDef_sheet,
+                        self.config.bulkEntity_sheet,
+                        self.config.table_sheet,
+                        self.config.column_sheet if atlas_typedefs else None,
+                        self.config.updateLineage_sheet,
+                        self.config.columnMapping_sheet
+                    ] if name and name in wb.sheetnames
+                ]
+            for sheet in sheets:
+                if sheet not in wb.sheetnames:
+                    raise KeyError("The sheet {} was not found".format(sheet))
+
+            if self.config.column_sheet in sheets and not atlas_typedefs:
+                raise ValueError(
+                    "atlas_typedefs must be provided to parse the {} sheet."
+                    .format(self.config.column_sheet))
+
+            def rows(sheet_name):
+                return ExcelReader._iter_spreadsheet(wb[sheet_name])
+
+            output = {"typedefs": {}, "entities": [], "lineage": []}
+
+            if self.config.entityDef_sheet in sheets:
+                output["typedefs"].update(super().parse_entity_defs(
+                    rows(self.config.entityDef_sheet)))
+
+            if self.config.classificationDef_sheet in sheets:
+                output["typedefs"].update(super().parse_classification_defs(
+                    rows(self.config.classificationDef_sheet)))
+
+            if self.config.bulkEntity_sheet in sheets:
+                output["entities"].extend(super().parse_bulk_entities(
+                    rows(self.config.bulkEntity_sheet),
+                    contacts_func)["entities"])
+
+            table_entities = []
+            if self.config.table_sheet in sheets:
+                table_entities = super().parse_table_lineage(
+                    rows(self.config.table_sheet))
+
+            column_entities = []
+            if self.config.column_sheet in sheets:
+                # Modifies table_entities if use_column_mapping is True
+                column_entities = super().parse_finegrain_column_lineage(
+                    rows(self.config.column_sheet), table_entities,
+                    atlas_typedefs, use_column_mapping=use_column_mapping)
+            output["lineage"].extend(
+                [e.to_json() for e in table_entities + column_entities])
+
+            update_lineage = []
+            if self.config.updateLineage_sheet in sheets:
+                update_lineage = super().parse_update_lineage(
+                    rows(self.config.updateLineage_sheet))
+            column_mappings = []
+            if self.config.columnMapping_sheet in sheets:
+                column_mappings = super().parse_column_mapping(
+                    rows(self.config.columnMapping_sheet))
+            output["lineage"].extend(ExcelReader._merge_lineage_and_mappings(
+                update_lineage, column_mappings))
+        finally:
+            wb.close()
+
+        return output
+
     @staticmethod
     def _update_sheet_headers(headers, worksheet):
         """
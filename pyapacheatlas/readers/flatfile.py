@@ -0,0 +1,287 @@
+from abc import ABC
+from abc import abstractmethod
+import csv
+import gzip
+import io
+import json
+
+from .reader import Reader, ReaderConfiguration
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _open_text(filepath, encoding):
+    """
+    Open a text file for reading, transparently decompressing it if the file
+    starts with the gzip magic number.
+
+    :param str filepath: The path to the (optionally gzip compressed) file.
+    :param str encoding: The encoding of the text in the file.
+    :return: A text file object that must be closed by the caller.
+    :rtype: io.TextIOBase
+    """
+    with open(filepath, "rb") as fp:
+        is_gzip = fp.read(2) == GZIP_MAGIC
+
+    if is_gzip:
+        return gzip.open(filepath, "rt", encoding=encoding, newline="")
+    return io.open(filepath, "r", encoding=encoding, newline="")
+
+
+class CsvConfiguration(ReaderConfiguration):
+    """
+    A configuration utility to understand how your CSV files are structured.
+    Each CSV file plays the role of one sheet in the excel template and uses
+    the same column headers.
+
+    :param str delimiter: Defaults to ",".
+    :param str quotechar: Defaults to '"'.
+    :param str encoding:
+        Defaults to "utf-8-sig" which also handles files that begin with a
+        byte order mark.
+    :param str source_prefix:
+        Defaults to "Source" and represents the prefix of the columns
+        to be considered related to the source table or column.
+    :param str target_prefix:
+        Defaults to "Target" and represents the prefix of the columns
+        to be considered related to the target table or column.
+    :param str process_prefix:
+        Defaults to "Process" and represents the prefix of the columns
+        to be considered related to the table process.
+    """
+
+    def __init__(self, delimiter=",", quotechar='"', encoding="utf-8-sig",
+                 **kwargs):
+        super().__init__(**kwargs)
+        self.delimiter = delimiter
+        self.quotechar = quotechar
+        self.encoding = encoding
+
+
+class JsonLinesConfiguration(ReaderConfiguration):
+    """
+    A configuration utility to understand how your JSON Lines files are
+    structured. Each line is a json object whose keys are the same column
+    headers used in the excel template.
+
+    :param str encoding: Defaults to "utf-8".
+    :param str source_prefix:
+        Defaults to "Source" and represents the prefix of the keys
+        to be considered related to the source table or column.
+    :param str target_prefix:
+        Defaults to "Target" and represents the prefix of the keys
+        to be considered related to the target table or column.
+    :param str process_prefix:
+        Defaults to "Process" and represents the prefix of the keys
+        to be considered related to the table process.
+    """
+
+    def __init__(self, encoding="utf-8", **kwargs):
+        super().__init__(**kwargs)
+        self.encoding = encoding
+
+
+class _FlatFileReader(Reader, ABC):
+    """
+    Route every parse method of the Reader through `_iter_file` so that the
+    rows of a file are streamed one at a time instead of loaded up front.
+    """
+
+    @abstractmethod
+    def _iter_file(self, filepath):
+        """
+        Yield each row of the file as a dict of column header to value.
+
+        :param str filepath: The (optionally gzip compressed) file to read.
+        :rtype: Iterator(dict(str, str))
+        """
+        raise NotImplementedError
+
+    def parse_bulk_entities(self, filepath, contacts_func=None, processes=None, chunk_size=10000):
+        """
+        Generate a set of entities from a file that follows the BulkEntities
+        template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your entities.
+        :param function contacts_func:
+            For Azure Purview, a function to be called on each value
+            when you pass in an experts or owners header.
+            Leaving it as None will return the exact value passed in
+            to the experts and owners section.
+        :param int processes:
+            The number of worker processes to convert rows with. Defaults to
+            converting in the current process.
+        :param int chunk_size:
+            The number of rows sent to a worker process at a time. Only
+            used when processes is greater than one.
+        :return: A dict with an `entities` key of the parsed entities.
+        :rtype: dict(str, list(dict))
+        """
+        return super().parse_bulk_entities(
+            self._iter_file(filepath), contacts_func, processes=processes,
+            chunk_size=chunk_size)
+
+    def parse_entity_defs(self, filepath):
+        """
+        Generate a set of entity defs from a file that follows the EntityDefs
+        template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your defs.
+        :return: An AtlasTypeDef with entityDefs for the provided rows.
+        :rtype: dict(str, list(dict))
+        """
+        return super().parse_entity_defs(self._iter_file(filepath))
+
+    def parse_classification_defs(self, filepath):
+        """
+        Generate a set of classification defs from a file that follows the
+        ClassificationDefs template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your defs.
+        :return: An AtlasTypeDef with classificationDefs for the provided rows.
+        :rtype: dict(str, list(dict))
+        """
+        return super().parse_classification_defs(self._iter_file(filepath))
+
+    def parse_table_lineage(self, filepath):
+        """
+        Generate table lineage from a file that follows the TablesLineage
+        template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your lineage.
+        :return:
+            A list of Atlas Entities representing the file's rows.
+        :rtype: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+        """
+        return super().parse_table_lineage(self._iter_file(filepath))
+
+    def parse_finegrain_column_lineage(self, filepath, atlas_entities, atlas_typedefs, use_column_mapping=False):
+        """
+        Generate column lineage from a file that follows the
+        FineGrainColumnLineage template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your lineage.
+        :param list() atlas_entities:
+            A list of AtlasEntity objects representing the tables and
+            processes from `parse_table_lineage`.
+        :param dict(str,list(dict)) atlas_typedefs:
+            The results of requesting all type defs from Apache Atlas,
+            including entityDefs, relationshipDefs, etc.  relationshipDefs
+            are the only values used.
+        :param bool use_column_mapping:
+            Should the table processes include the columnMappings attribute
+            that represents Column Lineage in Azure Data Catalog.
+            Defaults to False.
+        :return:
+            A list of Atlas Entities representing the file's rows.
+        :rtype: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+        """
+        return super().parse_finegrain_column_lineage(
+            self._iter_file(filepath), atlas_entities, atlas_typedefs,
+            use_column_mapping=use_column_mapping
+        )
+
+    def parse_update_lineage(self, filepath):
+        """
+        Generate updated process entities from a file that follows the
+        UpdateLineage template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your lineage.
+        :return:
+            A list of Atlas Process entities as dicts.
+        :rtype: list(dict)
+        """
+        return super().parse_update_lineage(self._iter_file(filepath))
+
+    def parse_column_mapping(self, filepath):
+        """
+        Generate process entities with a columnMapping attribute from a file
+        that follows the ColumnMapping template headers.
+
+        :param str filepath:
+            The (optionally gzip compressed) file that contains your mappings.
+        :return:
+            A list of Atlas Process entities as dicts.
+        :rtype: list(dict)
+        """
+        return super().parse_column_mapping(self._iter_file(filepath))
+
+
+class CsvReader(_FlatFileReader):
+    """
+    Read in CSV files (optionally gzip compressed) that use the excel
+    template headers. Each file contains the rows of one template sheet.
+    Expects a :class:`~pyapacheatlas.readers.flatfile.CsvConfiguration` or
+    :class:`~pyapacheatlas.readers.reader.ReaderConfiguration` object to
+    determine the naming conventions of headers.
+
+    Empty cells are treated the same as empty cells in Excel (None).
+    """
+
+    def _iter_file(self, filepath):
+        """
+        Standardizes the csv file into a json format one row at a time.
+
+        :param str filepath: The (optionally gzip compressed) csv file.
+        :return: A generator of the csv file's rows in json form.
+        :rtype: Iterator(dict(str,str))
+        """
+        encoding = getattr(self.config, "encoding", "utf-8-sig")
+        delimiter = getattr(self.config, "delimiter", ",")
+        quotechar = getattr(self.config, "quotechar", '"')
+
+        with _open_text(filepath, encoding) as fp:
+            rows = csv.reader(fp, delimiter=delimiter, quotechar=quotechar)
+            header_row = next(rows, None)
+            if header_row is None:
+                return
+            column_headers = [c.strip() for c in header_row]
+            num_headers = len(column_headers)
+
+            for row in rows:
+                if not row:
+                    continue
+                if len(row) < num_headers:
+                    row = row + [""] * (num_headers - len(row))
+                yield {
+                    k: (v if v != "" else None)
+                    for k, v in zip(column_headers, row)
+                }
+
+
+class JsonLinesReader(_FlatFileReader):
+    """
+    Read in JSON Lines files (optionally gzip compressed) where each line is
+    a json object that uses the excel template headers as keys. Each file
+    contains the rows of one template sheet.
+    Expects a :class:`~pyapacheatlas.readers.flatfile.JsonLinesConfiguration`
+    or :class:`~pyapacheatlas.readers.reader.ReaderConfiguration` object to
+    determine the naming conventions of headers.
+    """
+
+    def _iter_file(self, filepath):
+        """
+        Read the json lines file one object at a time, skipping blank lines.
+
+        :param str filepath: The (optionally gzip compressed) json lines file.
+        :return: A generator of the file's json objects.
+        :rtype: Iterator(dict(str,object))
+        """
+        encoding = getattr(self.config, "encoding", "utf-8")
+
+        with _open_text(filepath, encoding) as fp:
+            for line_number, line in enumerate(fp, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise ValueError(
+                        f"Unable to parse line {line_number} of {filepath}: {e}"
+                    )
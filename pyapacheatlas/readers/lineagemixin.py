@@ -27,8 +27,16 @@ class LineageMixIn():
         :type entity:
             :class:`~pyapacheatlas.core.entity.AtlasEntity`
         :type mutableOutput:
-            list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+            Union(list(:class:`~pyapacheatlas.core.entity.AtlasEntity`),
+            dict(str, :class:`~pyapacheatlas.core.entity.AtlasEntity`))
         """
+        if isinstance(mutableOutput, dict):
+            # Keyed by qualifiedName, re-inserting moves it to the end
+            if entity.qualifiedName in mutableOutput:
+                entity.merge(mutableOutput.pop(entity.qualifiedName))
+            mutableOutput[entity.qualifiedName] = entity
+            return
+
         if entity in mutableOutput:
             # Assumes things like name, type name, are consistent
             poppable_index = mutableOutput.index(entity)
@@ -70,7 +78,7 @@ class LineageMixIn():
         :param json_rows:
             A list of dicts that contain the converted tables of your column
             spreadsheet.
-        :type json_rows: list(dict(str,str))
+        :type json_rows: Iterable(dict(str,str))
         :return:
             A list of atlas entities that represent your source, target,
             and table processes.
@@ -88,8 +96,8 @@ class LineageMixIn():
         process_header = {k: "{} {}".format(
             self.config.process_prefix, k) for k in ["name", "type"]}
 
-        # Read in all Source and Target entities
-        output = list()  # TODO: Change to a dict to facilitate lookups
+        # Read in all Source and Target entities keyed by qualifiedName
+        output = OrderedDict()
         for row in json_rows:
             # Set up defaults
             target_entity, source_entity, process_entity = None, None, None
@@ -136,9 +144,9 @@ class LineageMixIn():
                 self._update_entity_and_array(process_entity, output)
 
         # Return all entities
-        return output
+        return list(output.values())
 
-    def _update_parent_table_cache(self, parent_table_name, known_tables, atlas_entities):
+    def _update_parent_table_cache(self, parent_table_name, known_tables, atlas_entities, entities_by_name=None):
         """
         Updates the known_tables variable to include the parent table entity if
         it does not exist already in known_tables.  Looks up the table in the
@@ -151,15 +159,22 @@ class LineageMixIn():
             containing the referred entities.
         :type atlas_entities:
             list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+        :param entities_by_name:
+            An optional index of atlas_entities by their name attribute.
+        :type entities_by_name:
+            dict(str, :class:`~pyapacheatlas.core.entity.AtlasEntity`)
         :return: None
         :rtype: NoneType
         """
         if parent_table_name not in known_tables:
-            parent_entity = reader_util.first_entity_matching_attribute(
-                "name", parent_table_name, atlas_entities)
+            if entities_by_name and parent_table_name in entities_by_name:
+                parent_entity = entities_by_name[parent_table_name]
+            else:
+                parent_entity = reader_util.first_entity_matching_attribute(
+                    "name", parent_table_name, atlas_entities)
             known_tables[parent_table_name] = parent_entity
 
-    def _find_column_type(self, parentTypeName, atlas_typedefs):
+    def _find_column_type(self, parentTypeName, atlas_typedefs, relationships_by_end_def=None):
         """
         For the given type, find a relationship def that includes "columns" in
         the end def1 (presumably the table end of the relationship) and then
@@ -171,13 +186,20 @@ class LineageMixIn():
             The results of requesting all type defs from Apache Atlas,
             including entityDefs, relationshipDefs, etc.  relationshipDefs
             are the only values used.
+        :param dict(tuple(str,str,str), dict) relationships_by_end_def:
+            An optional index of the relationshipDefs as created by
+            :func:`~pyapacheatlas.readers.util.index_relationships_by_end_def`.
         """
-        columns_relationship = reader_util.first_relationship_that_matches(
-            end_def="endDef1",
-            end_def_type=parentTypeName,
-            end_def_name="columns",
-            relationship_typedefs=atlas_typedefs["relationshipDefs"]
-        )
+        key = ("endDef1", parentTypeName, "columns")
+        if relationships_by_end_def and key in relationships_by_end_def:
+            columns_relationship = relationships_by_end_def[key]
+        else:
+            columns_relationship = reader_util.first_relationship_that_matches(
+                end_def="endDef1",
+                end_def_type=parentTypeName,
+                end_def_name="columns",
+                relationship_typedefs=atlas_typedefs["relationshipDefs"]
+            )
         column_type = columns_relationship["endDef2"]["type"]
         return column_type
 
@@ -248,7 +270,7 @@ class LineageMixIn():
         :param json_rows:
             A list of dicts that contain the converted rows of your column
             spreadsheet.
-        :type json_rows: list(dict(str,str))
+        :type json_rows: Iterable(dict(str,str))
         :param atlas_entities:
             A list of :class:`~pyapacheatlas.core.entity.AtlasEntity`
             containing the referred entities.
@@ -289,6 +311,14 @@ class LineageMixIn():
         dataset_mapping = {}
         # Caches all of the table processes seen in the loop for faster lookup
         table_and_proc_mappings = {}
+        # Indexes built once so each row is a lookup rather than a scan of
+        # every entity and relationship def. A miss falls back to the scan
+        # which raises the appropriate error.
+        entities_by_name = reader_util.index_entities_by_attribute(
+            "name", atlas_entities)
+        processes_by_io = reader_util.index_processes_by_io(atlas_entities)
+        relationships_by_end_def = reader_util.index_relationships_by_end_def(
+            atlas_typedefs["relationshipDefs"])
 
         for row in json_rows:
             # Set up defaults
@@ -298,11 +328,13 @@ class LineageMixIn():
             # look up the appropriate column type
 
             self._update_parent_table_cache(
-                row[target_header["table"]], tables, atlas_entities)
+                row[target_header["table"]], tables, atlas_entities,
+                entities_by_name)
 
             target_parent = tables[row[target_header["table"]]]
             target_column_type = self._find_column_type(
-                target_parent.typeName, atlas_typedefs)
+                target_parent.typeName, atlas_typedefs,
+                relationships_by_end_def)
 
             target_qual_name = self._insert_column_entity(
                 self.config.target_prefix, row, target_column_type,
@@ -315,37 +347,54 @@ class LineageMixIn():
                 # Given the existing source table entity in atlas_entities,
                 # look up the appropriate column type
                 self._update_parent_table_cache(
-                    row[source_header["table"]], tables, atlas_entities)
+                    row[source_header["table"]], tables, atlas_entities,
+                    entities_by_name)
 
                 source_parent = tables[row[source_header["table"]]]
                 source_column_type = self._find_column_type(
-                    source_parent.typeName, atlas_typedefs)
+                    source_parent.typeName, atlas_typedefs,
+                    relationships_by_end_def)
 
                 source_qual_name = self._insert_column_entity(
                     self.config.source_prefix, row, source_column_type,
                     source_header,
                     columnEntitiesOutput, source_parent
                 )
-                table_process = reader_util.first_process_containing_io(
-                    row[source_header["table"]], row[target_header["table"]],
-                    atlas_entities)
+                table_process = processes_by_io.get(
+                    (row[source_header["table"]], row[target_header["table"]]))
+                if table_process is None:
+                    table_process = reader_util.first_process_containing_io(
+                        row[source_header["table"]], row[target_header["table"]],
+                        atlas_entities)
 
             # Given the existing process that with target table and source
             # table types, look up the appropriate column_lineage type
             # LIMITATION: Prevents you from specifying multiple processes
             # for the same input and output tables
             if row[source_header["table"]] is None:
-                table_process = reader_util.first_process_containing_io(
-                    "*", row[target_header["table"]], atlas_entities)
+                table_process = processes_by_io.get(
+                    ("*", row[target_header["table"]]))
+                if table_process is None:
+                    table_process = reader_util.first_process_containing_io(
+                        "*", row[target_header["table"]], atlas_entities)
 
             if table_process.name in table_and_proc_mappings:
                 process_type = table_and_proc_mappings[table_process.name]["column_lineage_type"]
             else:
-                process_type = reader_util.from_process_lookup_col_lineage(
-                    table_process.name,
-                    atlas_entities,
-                    atlas_typedefs["relationshipDefs"]
+                named_process = entities_by_name.get(table_process.name)
+                lineage_key = (
+                    "endDef2",
+                    named_process.typeName if named_process else None,
+                    "columnLineages"
                 )
+                if lineage_key in relationships_by_end_def:
+                    process_type = relationships_by_end_def[lineage_key]["endDef1"]["type"]
+                else:
+                    process_type = reader_util.from_process_lookup_col_lineage(
+                        table_process.name,
+                        atlas_entities,
+                        atlas_typedefs["relationshipDefs"]
+                    )
                 table_and_proc_mappings[table_process.name] = {
                     "column_lineage_type": process_type
                 }
@@ -465,6 +514,44 @@ class LineageMixIn():
     def _header_qn(self, entity):
         return entity["uniqueAttributes"]["qualifiedName"]
 
+    def _update_process_datasets(self, datasets, current, seen_qns, side, process_qual_name):
+        """
+        Merge the datasets from one update lineage row into the datasets
+        already collected for one side (inputs or outputs) of a process.
+        The `seen_qns` set mirrors the qualified names in `current` so that
+        repeated datasets are found without scanning the list.
+
+        :param datasets: The datasets from the row (None, empty, or one item).
+        :type datasets: Union(None, list(dict))
+        :param current: The datasets collected so far for this side.
+        :type current: Union(None, list(dict))
+        :param set(str) seen_qns: The qualified names already in `current`.
+        :param str side: Either 'Input' or 'Output' and used in warnings.
+        :param str process_qual_name: The process being updated.
+        :return: The updated datasets for this side of the process.
+        :rtype: Union(None, list(dict))
+        """
+        if datasets:
+            dataset_qn = self._header_qn(datasets[0])
+            if dataset_qn not in seen_qns:
+                seen_qns.add(dataset_qn)
+                if current is None:
+                    current = []
+                current.extend(datasets)
+            else:
+                warnings.warn(
+                    f"{side} '{dataset_qn}' is repeated in Process '{process_qual_name}'."
+                    " Only the earliest entry is kept.")
+        elif isinstance(datasets, list):
+            # We have an empty list, meaning destroy this side of the process
+            if current:
+                warnings.warn(
+                    f"Process '{process_qual_name}' has conflicting {side.lower()}s"
+                    " and N/A values and will possibly be overwritten.")
+            current = []
+            seen_qns.clear()
+        return current
+
     def parse_update_lineage(self, json_rows):
         """
         Take in UpdateLineage dictionaries and create the mutated Process
@@ -476,20 +563,23 @@ class LineageMixIn():
         source qualifiedNames will reset the existing input or output to an
         empty list.
 
+        The rows are consumed once, so a generator of rows can be passed in
+        and the processes are only serialized after the last row.
+
         :param json_rows:
             A list of dicts that contain the converted rows of your update
             lineage spreadsheet.
-        :type json_rows: list(dict(str,str))
+        :type json_rows: Iterable(dict(str,str))
         :return:
             A list of Atlas Processes as dictionaries representing the updated
             process entity.
         :rtype: list(dict)
         """
-        results = []
         sp = self.config.source_prefix
         tp = self.config.target_prefix
         pp = self.config.process_prefix
 
+        # {process qualifiedName: [process, inputs, outputs, input qns, output qns]}
         processes_seen = dict()
 
         for row in json_rows:
@@ -512,45 +602,11 @@ class LineageMixIn():
                 target_qual_name, target_type)
 
             if process_qual_name in processes_seen:
-                temp_proc = processes_seen[process_qual_name]
-                # Get the inputs and outputs as they exist before this row
-                temp_in = temp_proc.inputs
-                temp_out = temp_proc.outputs
-                # If we have an input, check if it already exists
-                if inputs and len(inputs) > 0:
-                    input_qn = self._header_qn(inputs[0])
-                    if input_qn not in [self._header_qn(x) for x in temp_in]:
-                        temp_in.extend(inputs)
-                        temp_proc.inputs = temp_in
-
-                    else:
-                        warnings.warn(
-                            f"Input '{input_qn}' is repeated in Process '{process_qual_name}'."
-                            " Only the earliest entry is kept.")
-                elif isinstance(inputs, list):
-                    # We have an empty list, as the input, meaning destroy the input
-                    if len(temp_in) > 0:
-                        warnings.warn(
-                            f"Process '{process_qual_name}' has conflicting inputs"
-                            " and N/A values and will possibly be overwritten.")
-                    temp_proc.inputs(inputs)
-
-                if outputs:
-                    output_qn = self._header_qn(outputs[0])
-                    if output_qn not in [self._header_qn(x) for x in temp_out]:
-                        temp_out.extend(outputs)
-                        temp_proc.outputs = temp_out
-                    else:
-                        warnings.warn(
-                            f"Output '{output_qn}' is repeated in Process '{process_qual_name}'."
-                            " Only the earliest entry is kept.")
-                elif isinstance(outputs, list):
-                    # We have an empty list, as the output, meaning destroy the output
-                    if len(temp_out) > 0:
-                        warnings.warn(
-                            f"Process '{process_qual_name}' has conflicting outputs"
-                            " and N/A values and will possibly be overwritten.")
-                    temp_proc.outputs = outputs
+                seen = processes_seen[process_qual_name]
+                seen[1] = self._update_process_datasets(
+                    inputs, seen[1], seen[3], "Input", process_qual_name)
+                seen[2] = self._update_process_datasets(
+                    outputs, seen[2], seen[4], "Output", process_qual_name)
 
             else:
                 proc = AtlasProcess(
@@ -558,12 +614,20 @@ class LineageMixIn():
                     typeName=process_type,
                     qualified_name=process_qual_name,
                     guid=self.guidTracker.get_guid(),
-                    inputs=inputs,
-                    outputs=outputs
+                    inputs=None,
+                    outputs=None
                 )
-                processes_seen[process_qual_name] = proc
+                processes_seen[process_qual_name] = [
+                    proc, inputs, outputs,
+                    set(self._header_qn(x) for x in inputs or []),
+                    set(self._header_qn(x) for x in outputs or [])
+                ]
 
-            results = [v.to_json() for v in processes_seen.values()]
+        results = []
+        for proc, inputs, outputs, _, _ in processes_seen.values():
+            proc.inputs = inputs
+            proc.outputs = outputs
+            results.append(proc.to_json())
         return results
 
     def parse_column_mapping(self, json_rows):
@@ -577,7 +641,7 @@ class LineageMixIn():
         :param json_rows:
             A list of dicts that contain the converted rows of your update
             lineage spreadsheet.
-        :type json_rows: list(dict(str,str))
+        :type json_rows: Iterable(dict(str,str))
         :return: An AtlasTypeDef with entityDefs for the provided rows.
         :rtype: dict(str, list(dict))
         """
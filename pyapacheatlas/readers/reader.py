@@ -1,4 +1,7 @@
-from collections import OrderedDict
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from multiprocessing import Pool
 import re
 from warnings import warn
 
@@ -14,6 +17,106 @@ from ..core import (
 from .lineagemixin import LineageMixIn
 from . import util as reader_util
 
+BIZ_MGD_ATTRIB_PATTERN = re.compile(r"\[(?:Business|Managed)\]\[(.*)\] (.*)")
+
+
+@lru_cache(maxsize=128)
+def _compile_header_layout(headers, ignore):
+    """
+    Decide once per set of headers which part of the entity each column
+    belongs to so that the rows do not re-scan every header.
+
+    :param tuple(str) headers: The column headers of a row in order.
+    :param tuple(str) ignore: The column headers to omit.
+    :return:
+        A tuple of (column name, kind, key) where kind is one of
+        relationship, root, custom, business, or attribute and key is the
+        cleaned up name (or (type, attribute) for business metadata).
+    :rtype: tuple(tuple(str,str,object))
+    """
+    layout = []
+    for column_name in headers:
+        if column_name in ignore:
+            continue
+        elif column_name.startswith("[Relationship]"):
+            layout.append((column_name, "relationship",
+                           column_name.replace("[Relationship]", "").strip()))
+        elif column_name.startswith("[root]"):
+            layout.append((column_name, "root",
+                           column_name.replace("[root]", "").strip()))
+        elif column_name.startswith("[custom]"):
+            layout.append((column_name, "custom",
+                           column_name.replace("[custom]", "").strip()))
+        elif BIZ_MGD_ATTRIB_PATTERN.match(column_name):
+            layout.append((column_name, "business",
+                           BIZ_MGD_ATTRIB_PATTERN.match(column_name).groups()))
+        else:
+            layout.append((column_name, "attribute", column_name))
+    return tuple(layout)
+
+
+class _EntityReference(namedtuple("_EntityReference", ["typeName", "guid", "qualifiedName"])):
+    """
+    The minimum json of a bulk entity row used by other rows' relationships.
+    """
+
+    def to_json(self, minimum=True):
+        return {"typeName": self.typeName, "guid": self.guid,
+                "qualifiedName": self.qualifiedName}
+
+
+class _PriorEntities():
+    """
+    A read only view of the entities defined before a given row position,
+    which matches what `existing_entities` holds when parsing serially.
+
+    :param dict references:
+        The qualifiedName to a tuple of (sorted positions, references).
+    :param int position: Only rows before this position are visible.
+    """
+
+    def __init__(self, references, position):
+        self._references = references
+        self._position = position
+
+    def _latest(self, qualified_name):
+        if qualified_name not in self._references:
+            return None
+        positions, references = self._references[qualified_name]
+        idx = bisect_left(positions, self._position)
+        return references[idx - 1] if idx > 0 else None
+
+    def __contains__(self, qualified_name):
+        return self._latest(qualified_name) is not None
+
+    def __getitem__(self, qualified_name):
+        reference = self._latest(qualified_name)
+        if reference is None:
+            raise KeyError(qualified_name)
+        return reference
+
+
+# The reader and entity references used by worker processes in
+# parse_bulk_entities. They are set once per process by the pool initializer.
+_WORKER_READER = None
+_WORKER_REFERENCES = None
+
+
+def _init_bulk_worker(configuration, references):
+    global _WORKER_READER, _WORKER_REFERENCES
+    _WORKER_READER = Reader(configuration)
+    _WORKER_REFERENCES = references
+
+
+def _convert_bulk_chunk(chunk):
+    results = []
+    for position, guid, row in chunk:
+        entity = _WORKER_READER._row_to_bulk_entity(
+            row, guid, _PriorEntities(_WORKER_REFERENCES, position))
+        results.append(
+            (row["qualifiedName"], entity.to_json(), "classifications" in row))
+    return results
+
 
 class ReaderConfiguration():
     """
@@ -145,20 +248,16 @@ class Reader(LineageMixIn):
         """
         output = {"attributes": {}, "relationshipAttributes": {},
                   "root": {}, "custom": {}, "businessAttributes": {}}
-        BIZ_MGD_ATTRIB_PATTERN = r"\[(?:Business|Managed)\]\[(.*)\] (.*)"
+        layout = _compile_header_layout(tuple(row.keys()), tuple(ignore))
 
-        for column_name, cell_value in row.items():
-            # Remove the required attributes so they're not double dipping.
-            if column_name in ignore:
-                continue
+        for column_name, kind, cleaned_key in layout:
+            cell_value = row[column_name]
             # Remove any cell with a None / Null attribute
-            elif cell_value is None:
+            if cell_value is None:
                 continue
             # If the Attribute key starts with [Relationship]
             # Move it to the relation
-            elif column_name.startswith("[Relationship]"):
-                cleaned_key = column_name.replace("[Relationship]", "").strip()
-
+            elif kind == "relationship":
                 if cleaned_key == "meanings":
 
                     terms = self._splitField(cell_value)
@@ -200,9 +299,8 @@ class Reader(LineageMixIn):
                             {cleaned_key: reference_object}
                         )
 
-            elif column_name.startswith("[root]"):
+            elif kind == "root":
                 # This is a root level attribute
-                cleaned_key = column_name.replace("[root]", "").strip()
                 output_value = cell_value
                 if self.config.value_separator in cell_value:
                     # There's a delimiter in here
@@ -219,13 +317,11 @@ class Reader(LineageMixIn):
 
                 output["root"].update({cleaned_key: output_value})
 
-            elif column_name.startswith("[custom]"):
-                cleaned_key = column_name.replace("[custom]", "").strip()
-
+            elif kind == "custom":
                 output["custom"].update({cleaned_key: cell_value})
 
-            elif re.match(BIZ_MGD_ATTRIB_PATTERN, column_name):
-                bizType, bizAttribute = re.match(BIZ_MGD_ATTRIB_PATTERN, column_name).groups()
+            elif kind == "business":
+                bizType, bizAttribute = cleaned_key
                 if bizType in output["businessAttributes"]:
                     output["businessAttributes"][bizType].update({bizAttribute: cell_value})
                 else:
@@ -235,16 +331,12 @@ class Reader(LineageMixIn):
 
         return output
 
-    def _organize_contacts(self, contacts, contacts_func, contacts_cache):
+    def _organize_contacts(self, contacts):
         """
-        Convert the string with delimiters into a list of `{id: contact, info: value}`
-        after calling the contacts_func on the stripped contact string.
+        Convert the string with delimiters into a list of `{id: contact, info: value}`.
+        The contacts are resolved afterwards by `_resolve_contacts`.
 
         :param str contacts: a splittable string.
-        :param function contacts_func:
-            A function that will be called on each contact.
-        :param dict contacts_cache:
-            Stores the contact and the results of the contacts_func.
         """
         contacts_enhanced = []
         for contact in contacts.split(self.config.value_separator):
@@ -257,18 +349,12 @@ class Reader(LineageMixIn):
 
             _clean_contact = _contact_and_info[0].strip()
             _clean_info = None
-            _contact_obj_id = None
             if len(_contact_and_info) > 1:
                 _clean_info = _contact_and_info[1].strip()
-                
-            if _clean_contact in contacts_cache:
-                _contact_obj_id = contacts_cache[_clean_contact]
-            else:
-                _contact_obj_id = contacts_func(_clean_contact)
-                contacts_cache[_clean_contact] = _contact_obj_id
+
             # This format is specific to Azure Purview
             output = {
-                "id": _contact_obj_id
+                "id": _clean_contact
             }
             if _clean_info:
                 output["info"] = _clean_info
@@ -276,88 +362,207 @@ class Reader(LineageMixIn):
 
         return contacts_enhanced
 
-    def parse_bulk_entities(self, json_rows, contacts_func=None):
+    BULK_HEADERS_THAT_ARENT_ATTRIBS = [
+        "typeName", "name", "qualifiedName", "classifications", "owners", "experts"]
+
+    def _row_to_bulk_entity(self, row, guid, existing_entities):
+        """
+        Convert one bulk entities row into an AtlasEntity.
+
+        :param dict(str,object) row: The row to convert.
+        :param str guid: The guid to assign to the entity.
+        :param existing_entities:
+            The entities defined by earlier rows, keyed by qualifiedName,
+            used to resolve relationship attributes.
+        :type existing_entities:
+            dict(str, `:class:~pyapacheatlas.core.entity.AtlasEntity`)
+        :return:
+            The entity for the row. Experts and owners are left unresolved
+            for `_resolve_contacts`.
+        :rtype: :class:`~pyapacheatlas.core.entity.AtlasEntity`
+        """
+        _extracted = self._organize_attributes(
+            row,
+            existing_entities,
+            self.BULK_HEADERS_THAT_ARENT_ATTRIBS
+        )
+
+        entity = AtlasEntity(
+            name=row["name"],
+            typeName=row["typeName"],
+            qualified_name=row["qualifiedName"],
+            guid=guid,
+            attributes=_extracted["attributes"],
+            relationshipAttributes=_extracted["relationshipAttributes"],
+            **_extracted["root"]
+        )
+
+        if _extracted["businessAttributes"]:
+            entity.addBusinessAttribute(**_extracted["businessAttributes"])
+
+        # TODO: Remove at 1.0.0 launch
+        if "classifications" in row:
+            entity.classifications = reader_util.string_to_classification(
+                row["classifications"],
+                sep=self.config.value_separator)
+
+        if ("experts" in row or "owners" in row) and (row.get("experts") or row.get("owners")):
+            experts = self._organize_contacts(row.get("experts") or "")
+            owners = self._organize_contacts(row.get("owners") or "")
+
+            entity.contacts = {"Expert": experts, "Owner": owners}
+
+        if _extracted["custom"]:
+            entity.customAttributes = _extracted["custom"]
+
+        return entity
+
+    def _parse_bulk_entities_in_parallel(self, json_rows, processes, chunk_size):
+        """
+        Convert the bulk entities rows in chunks on a pool of processes.
+
+        Guids are assigned to the rows up front and each worker receives the
+        qualifiedName, type, and guid of every row so relationships resolve
+        to the same (most recent prior) entity as when parsing serially.
+
+        :return:
+            The entities as dicts and whether the deprecated classifications
+            column was used.
+        :rtype: tuple(list(dict), bool)
+        """
+        rows = []
+        # {qualifiedName: ([positions], [_EntityReference])}
+        references = {}
+        for row in json_rows:
+            if ((row["name"] is None) or (row["typeName"] is None) or
+                    (row["qualifiedName"] is None)):
+                # An empty row snuck in somehow, skip it.
+                continue
+            position = len(rows)
+            guid = self.guidTracker.get_guid()
+            rows.append((position, guid, row))
+            positions, refs = references.setdefault(
+                row["qualifiedName"], ([], []))
+            positions.append(position)
+            refs.append(_EntityReference(
+                row["typeName"], guid, row["qualifiedName"]))
+
+        # Last one wins while keeping the position of the first occurrence
+        existing_entities = OrderedDict()
+        classification_column_used = False
+        chunks = (rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size))
+        with Pool(processes, initializer=_init_bulk_worker,
+                  initargs=(self.config, references)) as pool:
+            for chunk_results in pool.imap(_convert_bulk_chunk, chunks):
+                for qualified_name, entity, used_classifications in chunk_results:
+                    existing_entities[qualified_name] = entity
+                    classification_column_used = (
+                        classification_column_used or used_classifications)
+
+        return list(existing_entities.values()), classification_column_used
+
+    @staticmethod
+    def _resolve_contacts(entities, contacts_func):
+        """
+        Replace the expert and owner ids in the entity dicts with the result
+        of the contacts_func, calling it only once per distinct contact.
+
+        :param list(dict) entities: The entities to update in place.
+        :param contacts_func:
+            A function called on each distinct contact or an object with a
+            `resolve_many` method that takes a list of contacts and returns
+            a dict of contact to resolved id. Contacts resolved to None are
+            removed.
+        """
+        contact_lists = []
+        for entity in entities:
+            contacts = entity.get("contacts")
+            if isinstance(contacts, dict):
+                contact_lists.extend(
+                    [c for c in contacts.values() if isinstance(c, list)])
+        distinct = list(dict.fromkeys(
+            contact["id"] for contacts in contact_lists for contact in contacts))
+        if not distinct:
+            return
+
+        if hasattr(contacts_func, "resolve_many"):
+            resolved = contacts_func.resolve_many(distinct)
+        else:
+            resolved = {contact: contacts_func(contact) for contact in distinct}
+
+        for contacts in contact_lists:
+            for contact in contacts:
+                contact["id"] = resolved[contact["id"]]
+            contacts[:] = [c for c in contacts if c["id"] is not None]
+
+    def parse_bulk_entities(self, json_rows, contacts_func=None, processes=None, chunk_size=10000):
         """
         Create an AtlasEntityWithExtInfo consisting of entities and their attributes
         for the given json_rows.
 
-        :param list(dict(str,object)) json_rows:
-            A list of dicts containing at least `typeName`, `name`, and `qualifiedName`
-            that represents the entity to be uploaded.
+        When the same qualifiedName appears in more than one row, the last
+        row wins but keeps the position of the first row in the results.
+
+        :param json_rows:
+            A list (or any iterable, such as a generator of rows read from a
+            file) of dicts containing at least `typeName`, `name`, and
+            `qualifiedName` that represents the entity to be uploaded.
+        :type json_rows: Iterable(dict(str,object))
         :param function contacts_func:
             For Azure Purview, a function to be called on each value
             when you pass in an experts or owners header to json_rows.
             Leaving it as None will return the exact value passed in
             to the experts and owners section.
-            It has a built in cache that will prevent redundant calls
-            to your function.
+            It is called once per distinct contact after every row is
+            parsed. If it has a `resolve_many` method, such as a
+            :class:`~pyapacheatlas.core.msgraph.ContactsResolver`, all of the
+            distinct contacts are resolved with one call instead. Contacts
+            it resolves to None are left out.
+        :param int processes:
+            The number of worker processes to convert rows with. Defaults to
+            converting in the current process. The rows must be picklable.
+        :param int chunk_size:
+            The number of rows sent to a worker process at a time. Only
+            used when processes is greater than one.
 
         :return: An AtlasEntityWithExtInfo with entities for the provided rows.
         :rtype: dict(str, list(dict))
         """
-        # For each row,
-        # Extract the
-        # Extract any additional attributes
-        headers_that_arent_attribs = [
-            "typeName", "name", "qualifiedName", "classifications", "owners", "experts"]
-        existing_entities = OrderedDict()
-
-        # TODO: Remove this once deprecation is removed
-        classification_column_used = False
-
-        for row in json_rows:
-
-            if ((row["name"] is None) or (row["typeName"] is None) or
-                    (row["qualifiedName"] is None)):
-                # An empty row snuck in somehow, skip it.
-                continue
-
-            _extracted = self._organize_attributes(
-                row,
-                existing_entities,
-                headers_that_arent_attribs
-            )
+        if processes and processes > 1:
+            entities, classification_column_used = self._parse_bulk_entities_in_parallel(
+                json_rows, processes, chunk_size)
+            output = {"entities": entities}
+        else:
+            existing_entities = OrderedDict()
 
-            entity = AtlasEntity(
-                name=row["name"],
-                typeName=row["typeName"],
-                qualified_name=row["qualifiedName"],
-                guid=self.guidTracker.get_guid(),
-                attributes=_extracted["attributes"],
-                relationshipAttributes=_extracted["relationshipAttributes"],
-                **_extracted["root"]
-            )
+            # TODO: Remove this once deprecation is removed
+            classification_column_used = False
 
-            if _extracted["businessAttributes"]:
-                entity.addBusinessAttribute(**_extracted["businessAttributes"])
+            for row in json_rows:
 
-            # TODO: Remove at 1.0.0 launch
-            if "classifications" in row:
-                classification_column_used = True
-                entity.classifications = reader_util.string_to_classification(
-                    row["classifications"],
-                    sep=self.config.value_separator)
+                if ((row["name"] is None) or (row["typeName"] is None) or
+                        (row["qualifiedName"] is None)):
+                    # An empty row snuck in somehow, skip it.
+                    continue
 
-            contacts_cache = {}
-            contacts_func = contacts_func or (lambda x: x)
-            if ("experts" in row or "owners" in row) and (row.get("experts") or row.get("owners")):
-                experts = []
-                owners = []
+                entity = self._row_to_bulk_entity(
+                    row,
+                    self.guidTracker.get_guid(),
+                    existing_entities
+                )
 
-                experts = self._organize_contacts(
-                    (row.get("experts") or ""), contacts_func, contacts_cache)
-                owners = self._organize_contacts(
-                    (row.get("owners") or ""), contacts_func, contacts_cache)
+                # TODO: Remove at 1.0.0 launch
+                if "classifications" in row:
+                    classification_column_used = True
 
-                entity.contacts = {"Expert": experts, "Owner": owners}
+                existing_entities.update({row["qualifiedName"]: entity})
 
-            if _extracted["custom"]:
-                entity.customAttributes = _extracted["custom"]
+            output = {"entities": [e.to_json()
+                                   for e in list(existing_entities.values())]}
 
-            existing_entities.update({row["qualifiedName"]: entity})
+        if contacts_func:
+            self._resolve_contacts(output["entities"], contacts_func)
 
-        output = {"entities": [e.to_json()
-                               for e in list(existing_entities.values())]}
         # TODO: Remove this once deprecation is removed
         if classification_column_used:
             warn("Using `classifications` as a field header is deprecated and will be unsupported in the future." +
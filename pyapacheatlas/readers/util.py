@@ -208,6 +208,75 @@ def from_process_lookup_col_lineage(process_name, atlas_entities, relationship_t
     return column_lineage_type
 
 
+def index_entities_by_attribute(attribute, atlas_entities):
+    """
+    Build a lookup of attribute value to entity so repeated searches do not
+    scan every entity. Matches `first_entity_matching_attribute` by keeping
+    the first entity for each value.
+
+    :param str attribute: The name of the attribute to index on each
+        atlas entity.
+    :param atlas_entities: The list of atlas entities to index.
+    :type atlas_entities: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+    :return: A dict of the attribute's value to the first matching entity.
+    :rtype: dict(str, :class:`~pyapacheatlas.core.entity.AtlasEntity`)
+    """
+    output = {}
+    for entity in atlas_entities:
+        if attribute in entity.attributes:
+            output.setdefault(entity.attributes[attribute], entity)
+    return output
+
+
+def index_processes_by_io(atlas_entities):
+    """
+    Build a lookup of (input qualified name, output qualified name) to the
+    process entity that contains them. A '*' input matches any input and a
+    None input or output matches an empty list of inputs or outputs. Matches
+    `first_process_containing_io` by keeping the last process for each pair.
+
+    :param atlas_entities: The list of atlas entities to index.
+    :type atlas_entities: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+    :return: A dict of (input, output) qualified names to process entity.
+    :rtype: dict(tuple(str,str), :class:`~pyapacheatlas.core.entity.AtlasEntity`)
+    """
+    output = {}
+    for entity in atlas_entities:
+        if "inputs" not in entity.attributes or "outputs" not in entity.attributes:
+            continue
+        inputs = entity.attributes["inputs"] or []
+        outputs = entity.attributes["outputs"] or []
+        input_keys = ["*"] + (
+            [e.get("qualifiedName") for e in inputs] if inputs else [None])
+        output_keys = (
+            [e.get("qualifiedName") for e in outputs] if outputs else [None])
+        for input_key in input_keys:
+            for output_key in output_keys:
+                output[(input_key, output_key)] = entity
+    return output
+
+
+def index_relationships_by_end_def(relationship_typedefs):
+    """
+    Build a lookup of (end def, end def type, end def name) to relationship
+    type def. Matches `first_relationship_that_matches` by keeping the last
+    relationship for each key.
+
+    :param list(dict) relationship_typedefs:
+        A list of dictionaries that follow the relationship type defs.
+    :return: A dict of (end_def, end_def_type, end_def_name) to type def.
+    :rtype: dict(tuple(str,str,str), dict)
+    """
+    output = {}
+    for typedef in relationship_typedefs:
+        for end_def in ["endDef1", "endDef2"]:
+            if end_def in typedef:
+                key = (end_def, typedef[end_def].get("type"),
+                       typedef[end_def].get("name"))
+                output[key] = typedef
+    return output
+
+
 def _make_col_qual_name(col_name, parent_table_name):
     """
     Generate a standardized qualified name for column entities.
@@ -0,0 +1 @@
+from .fakeserver import FakeAtlasServer, FakeCatalogStore
@@ -0,0 +1,999 @@
+from collections import deque
+import copy
+import gzip
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import json
+import random
+import re
+from socketserver import ThreadingMixIn
+import threading
+import time
+from urllib.parse import parse_qs, urlparse
+import uuid
+
+from ..core.client import AtlasClient, PurviewClient
+
+# Prefixes of the atlas api that are stripped before routing
+_ATLAS_PREFIXES = ["/catalog/api/atlas/v2", "/datamap/api/atlas/v2", "/api/atlas/v2"]
+_TYPEDEF_CATEGORIES = {
+    "entity": "entityDefs",
+    "classification": "classificationDefs",
+    "relationship": "relationshipDefs",
+    "struct": "structDefs",
+    "enum": "enumDefs",
+    "businessmetadata": "businessMetadataDefs"
+}
+
+
+class FakeAtlasError(Exception):
+    """
+    Raised by a route to send an Atlas style error response.
+    """
+
+    def __init__(self, status_code, message, error_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.body = {
+            "errorCode": error_code or f"ATLAS-{status_code}-00-001",
+            "errorMessage": message
+        }
+
+
+class _Fault():
+    def __init__(self, status_code, route, retry_after, remaining, method=None):
+        self.status_code = status_code
+        self.route = route
+        self.method = method
+        self.retry_after = retry_after
+        self.remaining = remaining
+
+
+class FakeCatalogStore():
+    """
+    The in memory entities, type definitions, glossaries, and collections
+    of a :class:`~pyapacheatlas.testing.fakeserver.FakeAtlasServer`.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.RLock()
+        self.entities = {}
+        # {(typeName, qualifiedName): guid}
+        self.unique_index = {}
+        self.typedefs = {category: {} for category in _TYPEDEF_CATEGORIES.values()}
+        self.glossaries = {}
+        self.terms = {}
+        self.collections = {}
+
+    def resolve(self, reference):
+        """
+        Find the guid of an entity reference with a guid or a typeName and
+        qualifiedName (either as uniqueAttributes or a top level key).
+        """
+        if not isinstance(reference, dict):
+            return None
+        guid = reference.get("guid")
+        if guid in self.entities:
+            return guid
+        qualified_name = reference.get("uniqueAttributes", {}).get(
+            "qualifiedName", reference.get("qualifiedName"))
+        return self.unique_index.get((reference.get("typeName"), qualified_name))
+
+    @staticmethod
+    def header(entity):
+        return {
+            "typeName": entity["typeName"],
+            "guid": entity["guid"],
+            "status": entity.get("status", "ACTIVE"),
+            "displayText": entity["attributes"].get("name"),
+            "attributes": {
+                "qualifiedName": entity["attributes"].get("qualifiedName"),
+                "name": entity["attributes"].get("name")
+            }
+        }
+
+    def _replace_guids(self, value, assignments):
+        if isinstance(value, list):
+            return [self._replace_guids(v, assignments) for v in value]
+        if isinstance(value, dict):
+            output = {k: self._replace_guids(v, assignments)
+                      for k, v in value.items()}
+            if str(output.get("guid")) in assignments:
+                output["guid"] = assignments[str(output["guid"])]
+            return output
+        return value
+
+    def upsert_entities(self, entities, collection_id=None):
+        """
+        Create or update entities by typeName and qualifiedName and return an
+        EntityMutationResponse.
+        """
+        created, updated = [], []
+        assignments = {}
+        now = int(time.time() * 1000)
+        with self.lock:
+            for entity in entities:
+                key = (entity.get("typeName"),
+                       entity.get("attributes", {}).get("qualifiedName"))
+                if key[0] is None or key[1] is None:
+                    raise FakeAtlasError(
+                        400, "Entities require a typeName and qualifiedName.",
+                        "ATLAS-400-00-01A")
+                existing = self.unique_index.get(key)
+                placeholder = str(entity.get("guid"))
+                guid = existing or str(uuid.uuid4())
+                if placeholder.startswith("-"):
+                    assignments[placeholder] = guid
+
+            for entity in entities:
+                entity = self._replace_guids(copy.deepcopy(entity), assignments)
+                key = (entity["typeName"], entity["attributes"]["qualifiedName"])
+                existing_guid = self.unique_index.get(key)
+                if existing_guid:
+                    stored = self.entities[existing_guid]
+                    stored["attributes"].update(entity.get("attributes", {}))
+                    for extra in ["relationshipAttributes", "classifications",
+                                  "contacts", "businessAttributes", "labels"]:
+                        if extra in entity:
+                            stored[extra] = entity[extra]
+                    stored["updateTime"] = now
+                    stored["version"] = stored.get("version", 0) + 1
+                    updated.append(self.header(stored))
+                else:
+                    provided = entity.get("guid")
+                    guid = assignments.get(str(provided))
+                    if guid is None and provided and provided not in self.entities:
+                        # Keep a real guid (e.g. when copying between catalogs)
+                        guid = provided
+                    elif guid is None:
+                        guid = str(uuid.uuid4())
+                    entity["guid"] = guid
+                    entity.setdefault("status", "ACTIVE")
+                    entity["createTime"] = now
+                    entity["updateTime"] = now
+                    entity["version"] = 0
+                    self.entities[guid] = entity
+                    self.unique_index[key] = guid
+                    created.append(self.header(entity))
+                    stored = entity
+                if collection_id:
+                    stored["collectionId"] = collection_id
+
+        mutated = {}
+        if created:
+            mutated["CREATE"] = created
+        if updated:
+            mutated["UPDATE"] = updated
+        return {"mutatedEntities": mutated, "guidAssignments": assignments}
+
+    def delete_entities(self, guids):
+        deleted = []
+        with self.lock:
+            for guid in guids:
+                entity = self.entities.pop(guid, None)
+                if entity is None:
+                    continue
+                self.unique_index.pop(
+                    (entity["typeName"], entity["attributes"].get("qualifiedName")), None)
+                entity["status"] = "DELETED"
+                deleted.append(self.header(entity))
+        return {"mutatedEntities": {"DELETE": deleted} if deleted else {}}
+
+    def get_entity(self, guid):
+        with self.lock:
+            if guid not in self.entities:
+                raise FakeAtlasError(
+                    404, f"Given instance guid {guid} is invalid/not found",
+                    "ATLAS-404-00-005")
+            return copy.deepcopy(self.entities[guid])
+
+    def lineage(self, guid, direction, depth):
+        """
+        Build an AtlasLineageInfo from the inputs and outputs of processes.
+        """
+        with self.lock:
+            if guid not in self.entities:
+                raise FakeAtlasError(
+                    404, f"Given instance guid {guid} is invalid/not found",
+                    "ATLAS-404-00-005")
+            # {dataset guid: [(process guid, output dataset guid)]}
+            downstream, upstream = {}, {}
+            for process in self.entities.values():
+                attributes = process.get("attributes", {})
+                if "inputs" not in attributes and "outputs" not in attributes:
+                    continue
+                inputs = [self.resolve(r) for r in attributes.get("inputs") or []]
+                outputs = [self.resolve(r) for r in attributes.get("outputs") or []]
+                for i in inputs:
+                    if i:
+                        downstream.setdefault(i, []).append(process["guid"])
+                        upstream.setdefault(process["guid"], []).append(i)
+                for o in outputs:
+                    if o:
+                        downstream.setdefault(process["guid"], []).append(o)
+                        upstream.setdefault(o, []).append(process["guid"])
+
+            relations = []
+            seen = {guid}
+            directions = []
+            if direction in ("BOTH", "OUTPUT"):
+                directions.append((downstream, False))
+            if direction in ("BOTH", "INPUT"):
+                directions.append((upstream, True))
+            for edges, reverse in directions:
+                frontier = [guid]
+                # Depth counts datasets so a process and its output are one step
+                for _ in range(max(depth, 0) * 2):
+                    next_frontier = []
+                    for current in frontier:
+                        for neighbor in edges.get(current, []):
+                            relations.append({
+                                "fromEntityId": neighbor if reverse else current,
+                                "toEntityId": current if reverse else neighbor
+                            })
+                            if neighbor not in seen:
+                                seen.add(neighbor)
+                                next_frontier.append(neighbor)
+                    frontier = next_frontier
+
+            return {
+                "baseEntityGuid": guid,
+                "lineageDirection": direction,
+                "lineageDepth": depth,
+                "guidEntityMap": {g: self.header(self.entities[g]) for g in seen},
+                "relations": relations
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            raw = gzip.decompress(raw)
+        if not raw:
+            return None
+        return json.loads(raw)
+
+    def _send(self, status_code, body=None, headers=None):
+        content = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if content:
+            self.wfile.write(content)
+
+    def _handle(self, method):
+        server = self.server.fake
+        parsed = urlparse(self.path)
+        path = parsed.path
+        query = parse_qs(parsed.query)
+        try:
+            body = self._read_body()
+        except ValueError:
+            return self._send(400, {"errorCode": "ATLAS-400-00-001",
+                                    "errorMessage": "Invalid json body"})
+
+        server._record(method, path)
+        fault = server._next_fault(method, path)
+        if server.latency:
+            time.sleep(server.latency)
+        if fault is not None:
+            headers = {}
+            if fault.status_code == 429:
+                headers["Retry-After"] = str(fault.retry_after)
+                return self._send(429, {"error": {
+                    "code": "TooManyRequests",
+                    "message": "Rate limit exceeded. Retry after the given seconds."
+                }}, headers)
+            return self._send(fault.status_code, {
+                "errorCode": f"ATLAS-{fault.status_code}-00-000",
+                "errorMessage": "Injected failure"
+            })
+
+        try:
+            status_code, response = server._route(method, path, query, body)
+        except FakeAtlasError as e:
+            return self._send(e.status_code, e.body)
+        except (KeyError, TypeError, ValueError) as e:
+            return self._send(400, {"errorCode": "ATLAS-400-00-001",
+                                    "errorMessage": f"Bad request: {e!r}"})
+        self._send(status_code, response)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class FakeAtlasServer():
+    """
+    An in process stand in for the Apache Atlas and Microsoft Purview REST
+    APIs for offline benchmarks and load tests. Entities, type definitions,
+    glossaries, and collections are kept in memory.
+
+    Supports `/entity/bulk`, `/entity/bulk/classification`, `/entity/guid`
+    (including classifications, labels, and business metadata),
+    `/entity/uniqueAttribute`, `/types/typedefs`, `/glossary` (including
+    term assignment), `/search/query` (with facets),
+    `/search/basic`, `/lineage` and the
+    Purview collections endpoints. Latency, throttling (429 with a
+    Retry-After header), and server errors can be injected.
+
+    .. code-block:: python
+
+        with FakeAtlasServer(latency=0.01, throttle_rate=0.05) as server:
+            client = server.purview_client()
+            client.upload_entities(entities)
+
+    :param float latency: Seconds to wait before responding to each request.
+    :param float throttle_rate:
+        The fraction of requests (0 to 1) answered with a 429 status code.
+    :param int retry_after:
+        The seconds sent in the Retry-After header of a 429 response.
+    :param float error_rate:
+        The fraction of requests (0 to 1) answered with error_status.
+    :param int error_status: The status code of injected errors. Defaults to 500.
+    :param int seed: Seed of the random throttling and errors.
+    :param str host: The interface to listen on. Defaults to 127.0.0.1.
+    :param int port: The port to listen on. Defaults to any free port.
+    """
+
+    def __init__(self, latency=0.0, throttle_rate=0.0, retry_after=1,
+                 error_rate=0.0, error_status=500, seed=None,
+                 host="127.0.0.1", port=0):
+        super().__init__()
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.store = FakeCatalogStore()
+        self.request_log = deque(maxlen=100000)
+        self._random = random.Random(seed)
+        self._faults = []
+        self._fault_lock = threading.Lock()
+        self._httpd = _ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread = None
+        self._routes = self._build_routes()
+
+    @property
+    def url(self):
+        """
+        The base url of the server (e.g. http://127.0.0.1:50123).
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def atlas_endpoint(self):
+        """
+        The atlas api endpoint to pass to an AtlasClient.
+        """
+        return self.url + "/api/atlas/v2"
+
+    def start(self):
+        """
+        Start serving requests on a background thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, name="pyapacheatlas-fake-server",
+                daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop serving requests and close the socket.
+        """
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def atlas_client(self, **kwargs):
+        """
+        Create an AtlasClient that talks to this server.
+
+        :return: The client.
+        :rtype: :class:`~pyapacheatlas.core.client.AtlasClient`
+        """
+        return AtlasClient(self.atlas_endpoint, **kwargs)
+
+    def purview_client(self, **kwargs):
+        """
+        Create a PurviewClient (including its glossary, collections, and
+        discovery clients) that talks to this server.
+
+        :return: The client.
+        :rtype: :class:`~pyapacheatlas.core.client.PurviewClient`
+        """
+        client = PurviewClient("fake", **kwargs)
+        client.endpoint_url = self.url + "/catalog/api/atlas/v2"
+        client.glossary.endpoint_url = client.endpoint_url
+        client.collections.endpoint_url = self.url + "/"
+        client.discovery.endpoint_url = self.url + "/catalog/api"
+        return client
+
+    def inject(self, status_code, count=1, route=None, retry_after=None, method=None):
+        """
+        Answer the next `count` requests (whose path contains `route` and
+        whose method is `method` if provided) with the given status code.
+
+        :param int status_code: The status code to respond with (e.g. 429, 503).
+        :param int count: The number of requests to fail.
+        :param str route: Only fail requests whose path contains this text.
+        :param int retry_after:
+            The Retry-After seconds of a 429. Defaults to the server's retry_after.
+        :param str method: Only fail requests with this HTTP method.
+        """
+        with self._fault_lock:
+            self._faults.append(_Fault(
+                status_code, route,
+                self.retry_after if retry_after is None else retry_after, count,
+                method))
+
+    def clear_faults(self):
+        """
+        Remove the injected failures that have not been used.
+        """
+        with self._fault_lock:
+            self._faults.clear()
+
+    def _next_fault(self, method, path):
+        with self._fault_lock:
+            for fault in self._faults:
+                if (fault.route is None or fault.route in path) and \
+                        (fault.method is None or fault.method == method):
+                    fault.remaining -= 1
+                    if fault.remaining <= 0:
+                        self._faults.remove(fault)
+                    return fault
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return _Fault(429, None, self.retry_after, 1)
+        if roll < self.throttle_rate + self.error_rate:
+            return _Fault(self.error_status, None, None, 1)
+        return None
+
+    def _record(self, method, path):
+        self.request_log.append((method, path))
+
+    def request_count(self, method=None, route=None):
+        """
+        Count the requests received, optionally filtered by method and by
+        text that the path contains.
+
+        :rtype: int
+        """
+        return sum(1 for m, p in list(self.request_log)
+                   if (method is None or m == method) and (route is None or route in p))
+
+    def _build_routes(self):
+        return [
+            ("POST", r"/entity/bulk$", self._post_entity_bulk),
+            ("GET", r"/entity/bulk$", self._get_entity_bulk),
+            ("DELETE", r"/entity/bulk$", self._delete_entity_bulk),
+            ("POST", r"/entity/bulk/classification$", self._post_bulk_classification),
+            ("POST", r"/entity$", self._post_entity),
+            ("GET", r"/entity/guid/(?P<guid>[^/]+)$", self._get_entity_guid),
+            ("DELETE", r"/entity/guid/(?P<guid>[^/]+)$", self._delete_entity_guid),
+            ("POST", r"/entity/guid/(?P<guid>[^/]+)/classifications$",
+             self._post_entity_classifications),
+            ("PUT", r"/entity/guid/(?P<guid>[^/]+)/classifications$",
+             self._put_entity_classifications),
+            ("POST", r"/entity/guid/(?P<guid>[^/]+)/labels$", self._set_labels),
+            ("PUT", r"/entity/guid/(?P<guid>[^/]+)/labels$", self._add_labels),
+            ("DELETE", r"/entity/guid/(?P<guid>[^/]+)/labels$", self._delete_labels),
+            ("POST", r"/entity/guid/(?P<guid>[^/]+)/businessmetadata$",
+             self._post_business_metadata),
+            ("DELETE", r"/entity/guid/(?P<guid>[^/]+)/businessmetadata$",
+             self._delete_business_metadata),
+            ("GET", r"/entity/bulk/uniqueAttribute/type/(?P<type_name>[^/]+)$",
+             self._get_entity_bulk_unique),
+            ("GET", r"/entity/uniqueAttribute/type/(?P<type_name>[^/]+)$",
+             self._get_entity_unique),
+            ("DELETE", r"/entity/uniqueAttribute/type/(?P<type_name>[^/]+)$",
+             self._delete_entity_unique),
+            ("GET", r"/types/typedefs$", self._get_typedefs),
+            ("GET", r"/types/typedefs/headers$", self._get_typedef_headers),
+            ("POST", r"/types/typedefs$", self._post_typedefs),
+            ("PUT", r"/types/typedefs$", self._put_typedefs),
+            ("DELETE", r"/types/typedefs$", self._delete_typedefs),
+            ("GET", r"/types/(?P<category>[a-z]*)def/name/(?P<name>[^/]+)$",
+             self._get_typedef_by_name),
+            ("DELETE", r"/types/typedef/name/(?P<name>[^/]+)$",
+             self._delete_typedef_by_name),
+            ("GET", r"/glossary$", self._get_glossaries),
+            ("POST", r"/glossary$", self._post_glossary),
+            ("GET", r"/glossary/(?P<guid>[^/]+)(?P<detailed>/detailed)?$",
+             self._get_glossary),
+            ("POST", r"/glossary/term$", self._post_term),
+            ("POST", r"/glossary/terms$", self._post_terms),
+            ("GET", r"/glossary/term/(?P<guid>[^/]+)$", self._get_term),
+            ("POST", r"/glossary/terms/(?P<guid>[^/]+)/assignedEntities$",
+             self._post_assigned_entities),
+            ("GET", r"/lineage/(?P<guid>[^/]+)$", self._get_lineage),
+            ("POST", r"^/catalog/api/search/query$", self._post_search_query),
+            ("POST", r"/search/basic$", self._post_search_basic),
+            ("GET", r"^/collections$", self._list_collections),
+            ("GET", r"^/collections/(?P<name>[^/]+)$", self._get_collection),
+            ("PUT", r"^/collections/(?P<name>[^/]+)$", self._put_collection),
+            ("DELETE", r"^/collections/(?P<name>[^/]+)$", self._delete_collection),
+            ("POST", r"^/catalog/api/collections/(?P<name>[^/]+)/entity/bulk$",
+             self._post_collection_entity_bulk),
+            ("POST", r"^/catalog/api/collections/(?P<name>[^/]+)/entity$",
+             self._post_collection_entity),
+            ("POST", r"^/catalog/api/collections/(?P<name>[^/]+)/entity/moveHere$",
+             self._post_collection_move_here),
+        ]
+
+    def _route(self, method, path, query, body):
+        atlas_path = None
+        for prefix in _ATLAS_PREFIXES:
+            if path.startswith(prefix):
+                atlas_path = path[len(prefix):]
+                break
+
+        for route_method, pattern, handler in self._routes:
+            if route_method != method:
+                continue
+            # Anchored patterns match the full path, the rest the atlas path
+            candidate = path if pattern.startswith("^") else atlas_path
+            if candidate is None:
+                continue
+            match = re.search(pattern, candidate)
+            if match:
+                return handler(query, body, **match.groupdict())
+        raise FakeAtlasError(404, f"No route for {method} {path}", "ATLAS-404-00-000")
+
+    # Entities
+    def _post_entity_bulk(self, query, body):
+        return 200, self.store.upsert_entities(body.get("entities", []))
+
+    def _post_entity(self, query, body):
+        return 200, self.store.upsert_entities([body["entity"]])
+
+    def _get_entity_bulk(self, query, body):
+        guids = query.get("guid", [])
+        entities = [self.store.get_entity(g) for g in guids]
+        return 200, {"entities": entities, "referredEntities": {}}
+
+    def _delete_entity_bulk(self, query, body):
+        return 200, self.store.delete_entities(query.get("guid", []))
+
+    def _classify(self, guids, classifications, update):
+        """
+        Add (or update) classifications of entities. Nothing is changed if
+        any entity is missing or already has (or lacks) a classification.
+        """
+        with self.store.lock:
+            entities = [self.store.entities.get(g) for g in guids]
+            for guid, entity in zip(guids, entities):
+                if entity is None:
+                    raise FakeAtlasError(
+                        404, f"Given instance guid {guid} is invalid/not found",
+                        "ATLAS-404-00-005")
+                names = {c["typeName"] for c in entity.get("classifications") or []}
+                for classification in classifications:
+                    if update and classification["typeName"] not in names:
+                        raise FakeAtlasError(
+                            400, f"Classification {classification['typeName']} is "
+                            f"not associated with entity {guid}", "ATLAS-400-00-06E")
+                    if not update and classification["typeName"] in names:
+                        raise FakeAtlasError(
+                            400, f"Classification {classification['typeName']} is "
+                            f"already associated with entity {guid}", "ATLAS-400-00-01A")
+            for entity in entities:
+                for classification in classifications:
+                    stored = dict(copy.deepcopy(classification),
+                                  entityGuid=entity["guid"], entityStatus="ACTIVE")
+                    kept = [c for c in entity.get("classifications") or []
+                            if c["typeName"] != classification["typeName"]]
+                    entity["classifications"] = kept + [stored]
+        return 204, None
+
+    def _post_bulk_classification(self, query, body):
+        return self._classify(body["entityGuids"], [body["classification"]], update=False)
+
+    def _post_entity_classifications(self, query, body, guid):
+        return self._classify([guid], body, update=False)
+
+    def _put_entity_classifications(self, query, body, guid):
+        return self._classify([guid], body, update=True)
+
+    def _entity_or_404(self, guid):
+        if guid not in self.store.entities:
+            raise FakeAtlasError(
+                404, f"Given instance guid {guid} is invalid/not found",
+                "ATLAS-404-00-005")
+        return self.store.entities[guid]
+
+    def _set_labels(self, query, body, guid):
+        with self.store.lock:
+            self._entity_or_404(guid)["labels"] = list(body or [])
+        return 204, None
+
+    def _add_labels(self, query, body, guid):
+        with self.store.lock:
+            entity = self._entity_or_404(guid)
+            labels = entity.get("labels") or []
+            entity["labels"] = labels + [label for label in body or [] if label not in labels]
+        return 204, None
+
+    def _delete_labels(self, query, body, guid):
+        with self.store.lock:
+            entity = self._entity_or_404(guid)
+            entity["labels"] = [label for label in entity.get("labels") or []
+                                if label not in (body or [])]
+        return 204, None
+
+    def _post_business_metadata(self, query, body, guid):
+        with self.store.lock:
+            entity = self._entity_or_404(guid)
+            overwrite = query.get("isOverwrite", ["False"])[0].lower() == "true"
+            existing = {} if overwrite else entity.get("businessAttributes") or {}
+            for type_name, attributes in body.items():
+                existing.setdefault(type_name, {}).update(attributes)
+            entity["businessAttributes"] = existing
+        return 204, None
+
+    def _delete_business_metadata(self, query, body, guid):
+        with self.store.lock:
+            entity = self._entity_or_404(guid)
+            for type_name, attributes in body.items():
+                existing = (entity.get("businessAttributes") or {}).get(type_name, {})
+                for attribute in attributes:
+                    existing.pop(attribute, None)
+        return 204, None
+
+    def _get_entity_guid(self, query, body, guid):
+        return 200, {"entity": self.store.get_entity(guid), "referredEntities": {}}
+
+    def _delete_entity_guid(self, query, body, guid):
+        return 200, self.store.delete_entities([guid])
+
+    def _unique_guid(self, type_name, qualified_name):
+        guid = self.store.unique_index.get((type_name, qualified_name))
+        if guid is None:
+            raise FakeAtlasError(
+                404, f"Instance {type_name} with unique attribute "
+                f"{{qualifiedName={qualified_name}}} does not exist",
+                "ATLAS-404-00-009")
+        return guid
+
+    def _get_entity_unique(self, query, body, type_name):
+        guid = self._unique_guid(type_name, query["attr:qualifiedName"][0])
+        return 200, {"entity": self.store.get_entity(guid), "referredEntities": {}}
+
+    def _delete_entity_unique(self, query, body, type_name):
+        guid = self._unique_guid(type_name, query["attr:qualifiedName"][0])
+        return 200, self.store.delete_entities([guid])
+
+    def _get_entity_bulk_unique(self, query, body, type_name):
+        entities = []
+        for key, values in query.items():
+            if key.endswith(":qualifiedName"):
+                guid = self.store.unique_index.get((type_name, values[0]))
+                if guid:
+                    entities.append(self.store.get_entity(guid))
+        return 200, {"entities": entities, "referredEntities": {}}
+
+    # Type definitions
+    def _get_typedefs(self, query, body):
+        with self.store.lock:
+            return 200, {category: list(defs.values())
+                         for category, defs in self.store.typedefs.items()}
+
+    def _get_typedef_headers(self, query, body):
+        headers = []
+        with self.store.lock:
+            for category, defs in self.store.typedefs.items():
+                for typedef in defs.values():
+                    headers.append({
+                        "category": typedef.get("category", category[:-4].upper()),
+                        "guid": typedef["guid"],
+                        "name": typedef["name"]
+                    })
+        return 200, headers
+
+    def _write_typedefs(self, body, must_exist):
+        output = {}
+        with self.store.lock:
+            for category, typedefs in (body or {}).items():
+                if category not in self.store.typedefs:
+                    continue
+                output[category] = []
+                for typedef in typedefs:
+                    existing = self.store.typedefs[category].get(typedef["name"])
+                    if must_exist and existing is None:
+                        raise FakeAtlasError(
+                            404, f"Given typename {typedef['name']} was invalid",
+                            "ATLAS-404-00-001")
+                    if not must_exist and existing is not None:
+                        raise FakeAtlasError(
+                            409, f"Given type {typedef['name']} already exists",
+                            "ATLAS-409-00-001")
+                    stored = copy.deepcopy(typedef)
+                    stored["guid"] = existing["guid"] if existing else str(uuid.uuid4())
+                    stored["version"] = existing.get("version", 1) + 1 if existing else 1
+                    self.store.typedefs[category][typedef["name"]] = stored
+                    output[category].append(stored)
+        return 200, output
+
+    def _post_typedefs(self, query, body):
+        return self._write_typedefs(body, must_exist=False)
+
+    def _put_typedefs(self, query, body):
+        return self._write_typedefs(body, must_exist=True)
+
+    def _delete_typedefs(self, query, body):
+        with self.store.lock:
+            for category, typedefs in (body or {}).items():
+                for typedef in typedefs:
+                    self.store.typedefs.get(category, {}).pop(typedef["name"], None)
+        return 204, None
+
+    def _get_typedef_by_name(self, query, body, category, name):
+        with self.store.lock:
+            # /types/typedef/name/{name} searches every category
+            categories = ([_TYPEDEF_CATEGORIES[category]] if category in _TYPEDEF_CATEGORIES
+                          else list(self.store.typedefs.keys()))
+            for c in categories:
+                if name in self.store.typedefs[c]:
+                    return 200, self.store.typedefs[c][name]
+        raise FakeAtlasError(
+            404, f"Given typename {name} was invalid", "ATLAS-404-00-001")
+
+    def _delete_typedef_by_name(self, query, body, name):
+        with self.store.lock:
+            for defs in self.store.typedefs.values():
+                defs.pop(name, None)
+        return 204, None
+
+    # Glossary
+    def _glossary_with_terms(self, glossary, detailed=False):
+        output = copy.deepcopy(glossary)
+        terms = [t for t in self.store.terms.values()
+                 if t["anchor"]["glossaryGuid"] == glossary["guid"]]
+        if detailed:
+            output["termInfo"] = {t["guid"]: t for t in terms}
+        output["terms"] = [{"termGuid": t["guid"], "displayText": t["name"]}
+                           for t in terms]
+        return output
+
+    def _get_glossaries(self, query, body):
+        with self.store.lock:
+            return 200, [self._glossary_with_terms(g)
+                         for g in self.store.glossaries.values()]
+
+    def _post_glossary(self, query, body):
+        with self.store.lock:
+            glossary = copy.deepcopy(body)
+            glossary["guid"] = str(uuid.uuid4())
+            self.store.glossaries[glossary["guid"]] = glossary
+        return 200, glossary
+
+    def _get_glossary(self, query, body, guid, detailed=None):
+        with self.store.lock:
+            if guid not in self.store.glossaries:
+                raise FakeAtlasError(
+                    404, f"Glossary with guid {guid} was not found",
+                    "ATLAS-404-00-005")
+            return 200, self._glossary_with_terms(
+                self.store.glossaries[guid], detailed=bool(detailed))
+
+    def _create_term(self, term):
+        glossary_guid = term.get("anchor", {}).get("glossaryGuid")
+        if glossary_guid not in self.store.glossaries:
+            raise FakeAtlasError(
+                400, "A term requires the anchor of an existing glossary",
+                "ATLAS-400-00-06C")
+        term = copy.deepcopy(term)
+        term["guid"] = str(uuid.uuid4())
+        self.store.terms[term["guid"]] = term
+        return term
+
+    def _post_term(self, query, body):
+        with self.store.lock:
+            return 200, self._create_term(body)
+
+    def _post_terms(self, query, body):
+        with self.store.lock:
+            return 200, [self._create_term(t) for t in body]
+
+    def _get_term(self, query, body, guid):
+        with self.store.lock:
+            if guid not in self.store.terms:
+                raise FakeAtlasError(
+                    404, f"Term with guid {guid} was not found", "ATLAS-404-00-005")
+            return 200, self.store.terms[guid]
+
+    def _post_assigned_entities(self, query, body, guid):
+        with self.store.lock:
+            if guid not in self.store.terms:
+                raise FakeAtlasError(
+                    404, f"Term with guid {guid} was not found", "ATLAS-404-00-005")
+            term = self.store.terms[guid]
+            for reference in body:
+                entity = self.store.entities.get(self.store.resolve(reference))
+                if entity is None:
+                    raise FakeAtlasError(
+                        404, f"Given instance guid {reference.get('guid')} is "
+                        "invalid/not found", "ATLAS-404-00-005")
+                meanings = entity.setdefault("relationshipAttributes", {}).setdefault(
+                    "meanings", [])
+                if any(m["guid"] == guid for m in meanings):
+                    raise FakeAtlasError(
+                        400, f"Term {guid} is already assigned to {entity['guid']}",
+                        "ATLAS-400-00-0A9")
+                meanings.append({"guid": guid, "typeName": "AtlasGlossaryTerm",
+                                 "displayText": term["name"]})
+                term.setdefault("assignedEntities", []).append(
+                    {"guid": entity["guid"], "typeName": entity["typeName"]})
+        return 204, None
+
+    # Lineage
+    def _get_lineage(self, query, body, guid):
+        direction = query.get("direction", ["BOTH"])[0].upper()
+        depth = int(query.get("depth", ["3"])[0])
+        return 200, self.store.lineage(guid, direction, depth)
+
+    # Search
+    @staticmethod
+    def _filter_matches(entity, search_filter):
+        if not search_filter:
+            return True
+        if "and" in search_filter:
+            return all(FakeAtlasServer._filter_matches(entity, f)
+                       for f in search_filter["and"])
+        if "or" in search_filter:
+            return any(FakeAtlasServer._filter_matches(entity, f)
+                       for f in search_filter["or"])
+        for key, value in search_filter.items():
+            if key in ("entityType", "typeName"):
+                if entity["typeName"] != value:
+                    return False
+            elif key in ("collectionId", "collection"):
+                if entity.get("collectionId") != value:
+                    return False
+            elif key == "classification":
+                names = [c.get("typeName") for c in entity.get("classifications") or []]
+                if value not in names:
+                    return False
+            elif key == "includeSubTypes":
+                continue
+            elif entity["attributes"].get(key) != value:
+                return False
+        return True
+
+    def _post_search_query(self, query, body):
+        keywords = (body.get("keywords") or "*").strip().lower()
+        search_filter = body.get("filter")
+        with self.store.lock:
+            matches = []
+            for entity in self.store.entities.values():
+                attributes = entity["attributes"]
+                text = " ".join(str(attributes.get(k) or "")
+                                for k in ["name", "qualifiedName", "description"]).lower()
+                if keywords not in ("*", "") and keywords not in text:
+                    continue
+                if not self._filter_matches(entity, search_filter):
+                    continue
+                matches.append({
+                    "id": entity["guid"],
+                    "name": attributes.get("name"),
+                    "qualifiedName": attributes.get("qualifiedName"),
+                    "entityType": entity["typeName"],
+                    "description": attributes.get("description"),
+                    "collectionId": entity.get("collectionId"),
+                    "classification": [c.get("typeName") for c in entity.get("classifications") or []],
+                    "@search.score": 1.0
+                })
+        offset = body.get("offset", 0)
+        limit = body.get("limit", 50)
+        output = {"@search.count": len(matches),
+                  "value": matches[offset:offset + limit]}
+        if body.get("facets"):
+            output["@search.facets"] = self._facets(matches, body["facets"])
+        return 200, output
+
+    @staticmethod
+    def _facets(matches, facets):
+        output = {}
+        for facet in facets:
+            name = facet["facet"]
+            counts = {}
+            for match in matches:
+                values = match.get(name)
+                for value in values if isinstance(values, list) else [values]:
+                    if value is not None:
+                        counts[value] = counts.get(value, 0) + 1
+            output[name] = [{"value": v, "count": c} for v, c in sorted(
+                counts.items(), key=lambda item: (-item[1], str(item[0])))]
+        return output
+
+    def _post_search_basic(self, query, body):
+        type_name = body.get("typeName")
+        with self.store.lock:
+            matches = [self.store.header(e) for e in self.store.entities.values()
+                       if type_name in (None, "_ALL_ENTITY_TYPES") or e["typeName"] == type_name]
+        offset = body.get("offset", 0)
+        limit = body.get("limit", 100)
+        return 200, {"queryType": "BASIC", "entities": matches[offset:offset + limit]}
+
+    # Collections
+    def _list_collections(self, query, body):
+        with self.store.lock:
+            values = list(self.store.collections.values())
+        return 200, {"value": values, "count": len(values)}
+
+    def _get_collection(self, query, body, name):
+        with self.store.lock:
+            if name not in self.store.collections:
+                raise FakeAtlasError(404, f"Collection {name} was not found")
+            return 200, self.store.collections[name]
+
+    def _put_collection(self, query, body, name):
+        with self.store.lock:
+            collection = dict(body or {})
+            collection["name"] = name
+            collection.setdefault("friendlyName", name)
+            self.store.collections[name] = collection
+        return 200, collection
+
+    def _delete_collection(self, query, body, name):
+        with self.store.lock:
+            self.store.collections.pop(name, None)
+        return 204, None
+
+    def _require_collection(self, name):
+        if name not in self.store.collections:
+            raise FakeAtlasError(404, f"Collection {name} was not found")
+
+    def _post_collection_entity_bulk(self, query, body, name):
+        self._require_collection(name)
+        return 200, self.store.upsert_entities(body.get("entities", []), collection_id=name)
+
+    def _post_collection_entity(self, query, body, name):
+        self._require_collection(name)
+        return 200, self.store.upsert_entities([body["entity"]], collection_id=name)
+
+    def _post_collection_move_here(self, query, body, name):
+        self._require_collection(name)
+        moved = []
+        with self.store.lock:
+            for guid in body.get("entityGuids", []):
+                entity = self.store.entities.get(guid)
+                if entity is not None:
+                    entity["collectionId"] = name
+                    moved.append(self.store.header(entity))
+        return 200, {"mutatedEntities": {"UPDATE": moved}}
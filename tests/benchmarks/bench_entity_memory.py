@@ -0,0 +1,97 @@
+"""
+Measure the memory and serialization cost of AtlasEntity for a large schema
+of column entities, compared with the previous layout where every entity
+held its own AtlasUnInit object for each unset optional field.
+
+Run from the root of the repository:
+
+    python tests/benchmarks/bench_entity_memory.py --entities 200000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from pyapacheatlas.core.entity import AtlasEntity, AtlasProcess, _OPTIONAL_FIELDS  # noqa: E402
+from pyapacheatlas.core.util import AtlasUnInit  # noqa: E402
+
+
+class _InstanceUnInit(AtlasUnInit):
+    """An AtlasUnInit that is not shared, as it was before."""
+
+    def __new__(cls):
+        return object.__new__(cls)
+
+
+def _set_unset_fields(entity):
+    for field in _OPTIONAL_FIELDS:
+        if field not in vars(entity):
+            setattr(entity, field, _InstanceUnInit())
+
+
+class _LegacyEntity(AtlasEntity):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _set_unset_fields(self)
+
+
+class _LegacyProcess(AtlasProcess):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _set_unset_fields(self)
+
+
+def build(entity_class, process_class, num_entities):
+    """
+    Create columns that point to one table plus one process per hundred
+    columns.
+    """
+    table = entity_class("table", "hive_table", "db.table", guid=-1)
+    reference = table.to_json(minimum=True)
+    entities = [table]
+    for i in range(num_entities):
+        entities.append(entity_class(
+            f"col{i}", "hive_column", f"db.table#col{i}", guid=-2 - i,
+            attributes={"type": "string"},
+            relationshipAttributes={"table": reference}
+        ))
+        if i % 100 == 0:
+            entities.append(process_class(
+                f"proc{i}", "Process", f"proc{i}", guid=-10000000 - i,
+                inputs=[reference], outputs=[reference]))
+    return entities
+
+
+def measure(entity_class, process_class, num_entities):
+    tracemalloc.start()
+    start = time.perf_counter()
+    entities = build(entity_class, process_class, num_entities)
+    build_time = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return entities, memory, build_time
+
+
+def main(num_entities):
+    _, legacy_memory, legacy_build = measure(
+        _LegacyEntity, _LegacyProcess, num_entities)
+    print(f"{'Per entity AtlasUnInit':>24}: {legacy_memory / num_entities:8.0f} "
+          f"bytes/entity build {legacy_build:6.2f}s")
+
+    entities, memory, build_time = measure(AtlasEntity, AtlasProcess, num_entities)
+    start = time.perf_counter()
+    [e.to_json() for e in entities]
+    to_json_time = time.perf_counter() - start
+    print(f"{'AtlasEntity':>24}: {memory / num_entities:8.0f} bytes/entity "
+          f"build {build_time:6.2f}s to_json {to_json_time:6.2f}s")
+    print(f"Memory reduction: {legacy_memory / memory:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=200000)
+    args = parser.parse_args()
+    main(args.entities)
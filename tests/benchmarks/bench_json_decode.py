@@ -0,0 +1,107 @@
+"""
+Benchmark decoding large entity and lineage responses with each installed
+json codec, both eagerly and lazily (only the guid is read).
+
+Run from the root of the repository:
+
+    python tests/benchmarks/bench_json_decode.py --entities 5000 --repeat 5
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from pyapacheatlas.core.codec import _CODECS, get_codec  # noqa: E402
+from pyapacheatlas.core.util import AtlasResponse  # noqa: E402
+
+
+def generate_entity_response(num_entities):
+    """
+    Create the body of a get_entity call for tables with ten columns each.
+    """
+    entities = []
+    for i in range(num_entities):
+        entities.append({
+            "typeName": "hive_table",
+            "guid": f"00000000-0000-0000-0000-{i:012d}",
+            "status": "ACTIVE",
+            "attributes": {
+                "qualifiedName": f"db.table{i}@primary",
+                "name": f"table{i}",
+                "description": "A generated table " * 5,
+                "createTime": 1600000000000 + i,
+                "columns": [
+                    {"guid": f"col-{i}-{c}", "typeName": "hive_column",
+                     "uniqueAttributes": {"qualifiedName": f"db.table{i}.c{c}@primary"}}
+                    for c in range(10)
+                ]
+            },
+            "classifications": [{"typeName": "PII", "propagate": False}],
+        })
+    return {"entities": entities, "referredEntities": {}}
+
+
+def generate_lineage_response(num_entities):
+    """
+    Create the body of a get_entity_lineage call with a chain of processes.
+    """
+    guid_map = {
+        f"guid-{i}": {"typeName": "Process" if i % 2 else "DataSet",
+                      "guid": f"guid-{i}",
+                      "attributes": {"qualifiedName": f"qn{i}", "name": f"n{i}"},
+                      "displayText": f"n{i}"}
+        for i in range(num_entities)
+    }
+    relations = [{"fromEntityId": f"guid-{i}", "toEntityId": f"guid-{i+1}",
+                  "relationshipId": f"rel-{i}"} for i in range(num_entities - 1)]
+    return {"baseEntityGuid": "guid-0", "lineageDirection": "BOTH",
+            "guidEntityMap": guid_map, "relations": relations}
+
+
+def _make_response(content):
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    response.request = requests.Request("GET", "http://localhost").prepare()
+    return response
+
+
+def _time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(num_entities, repeat):
+    payloads = {
+        "entity": json.dumps(generate_entity_response(num_entities)).encode("utf-8"),
+        "lineage": json.dumps(generate_lineage_response(num_entities)).encode("utf-8"),
+    }
+    for name in _CODECS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+        for payload_name, content in payloads.items():
+            response = _make_response(content)
+            eager = _time(lambda: AtlasResponse(response, codec=codec).body, repeat)
+            lazy = _time(lambda: AtlasResponse(response, codec=codec, lazy=True).status_code, repeat)
+            print(f"{name:>7} {payload_name:>8} {len(content)/1e6:6.1f}MB "
+                  f"eager {eager*1000:8.1f}ms lazy unread {lazy*1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--entities", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.entities, args.repeat)
@@ -0,0 +1,56 @@
+"""
+Benchmark the update lineage parser on a large, generated update sheet.
+
+Run from the root of the repository:
+
+    python tests/benchmarks/bench_update_lineage.py --rows 200000 --processes 2000
+
+The rows are produced by a generator so the parser is exercised the same way
+as when streaming a read only Excel sheet.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+from pyapacheatlas.readers.reader import Reader, ReaderConfiguration  # noqa: E402
+
+
+def generate_update_rows(num_rows, num_processes):
+    """
+    Yield update lineage rows spread evenly across `num_processes`. Every
+    row adds a new input and the first row of each process sets its output.
+    """
+    for i in range(num_rows):
+        proc = i % num_processes
+        yield {
+            "Target typeName": "demo_table" if i < num_processes else None,
+            "Target qualifiedName": f"target{proc}" if i < num_processes else None,
+            "Source typeName": "demo_table",
+            "Source qualifiedName": f"source{proc}_{i}",
+            "Process name": f"proc{proc}",
+            "Process qualifiedName": f"procqual{proc}",
+            "Process typeName": "Process"
+        }
+
+
+def main(num_rows, num_processes):
+    reader = Reader(ReaderConfiguration())
+    start = time.perf_counter()
+    results = reader.parse_update_lineage(
+        generate_update_rows(num_rows, num_processes))
+    elapsed = time.perf_counter() - start
+
+    num_inputs = sum(len(p["attributes"]["inputs"]) for p in results)
+    print(f"rows={num_rows} processes={len(results)} inputs={num_inputs} "
+          f"seconds={elapsed:.3f} rows_per_second={num_rows / elapsed:,.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--processes", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.rows, args.processes)
@@ -0,0 +1,178 @@
+"""
+Synthetic catalogs for the benchmarks. A catalog has `num_tables` tables
+with `num_columns` columns each and `lineage_density` processes per table,
+each reading from one or more upstream tables.
+"""
+import random
+
+from pyapacheatlas.core import AtlasEntity, AtlasProcess
+
+TABLE_TYPE = "bench_table"
+COLUMN_TYPE = "bench_column"
+PROCESS_TYPE = "bench_process"
+COLUMN_LINEAGE_TYPE = "bench_column_lineage"
+
+
+def generate_typedefs():
+    """
+    The entity and relationship type defs that the synthetic catalog uses.
+    """
+    return {
+        "entityDefs": [
+            {"name": TABLE_TYPE, "superTypes": ["DataSet"], "attributeDefs": [
+                {"name": "owner_team", "typeName": "string", "isOptional": True}],
+             "relationshipAttributeDefs": [
+                {"relationshipTypeName": "bench_table_columns", "name": "columns",
+                 "typeName": f"array<{COLUMN_TYPE}>"}]},
+            {"name": COLUMN_TYPE, "superTypes": ["DataSet"], "attributeDefs": [
+                {"name": "data_type", "typeName": "string", "isOptional": True}],
+             "relationshipAttributeDefs": [
+                {"relationshipTypeName": "bench_table_columns", "name": "table",
+                 "typeName": TABLE_TYPE}]},
+            {"name": PROCESS_TYPE, "superTypes": ["Process"], "attributeDefs": [],
+             "relationshipAttributeDefs": [
+                {"relationshipTypeName": "bench_process_column_lineage",
+                 "name": "columnLineages",
+                 "typeName": f"array<{COLUMN_LINEAGE_TYPE}>"}]},
+            {"name": COLUMN_LINEAGE_TYPE, "superTypes": ["Process"],
+             "attributeDefs": [], "relationshipAttributeDefs": []},
+            {"name": "DataSet", "superTypes": [], "attributeDefs": [
+                {"name": "name", "typeName": "string", "isOptional": False},
+                {"name": "qualifiedName", "typeName": "string", "isOptional": False},
+                {"name": "description", "typeName": "string", "isOptional": True}]},
+            {"name": "Process", "superTypes": [], "attributeDefs": [
+                {"name": "name", "typeName": "string", "isOptional": False},
+                {"name": "qualifiedName", "typeName": "string", "isOptional": False},
+                {"name": "inputs", "typeName": "array<DataSet>", "isOptional": True},
+                {"name": "outputs", "typeName": "array<DataSet>", "isOptional": True}]},
+        ],
+        "relationshipDefs": [
+            {"name": "bench_table_columns",
+             "endDef1": {"type": TABLE_TYPE, "name": "columns"},
+             "endDef2": {"type": COLUMN_TYPE, "name": "table"}},
+            {"name": "bench_process_column_lineage",
+             "endDef1": {"type": COLUMN_LINEAGE_TYPE, "name": "query"},
+             "endDef2": {"type": PROCESS_TYPE, "name": "columnLineages"}},
+        ]
+    }
+
+
+def _table_name(i):
+    return f"db.schema.table{i}"
+
+
+def _lineage_pairs(num_tables, lineage_density, seed):
+    """
+    Yield (process index, source table index, target table index) where each
+    target table is written by `lineage_density` processes from earlier tables.
+    """
+    rng = random.Random(seed)
+    process = 0
+    for target in range(1, num_tables):
+        for _ in range(lineage_density):
+            yield process, rng.randrange(0, target), target
+            process += 1
+
+
+def generate_entities(num_tables, num_columns, lineage_density=1, seed=0):
+    """
+    Create tables, columns, and table processes as AtlasEntity objects.
+
+    :return: A list of tables and columns followed by the processes.
+    :rtype: list(:class:`~pyapacheatlas.core.entity.AtlasEntity`)
+    """
+    guid = -1
+    tables, entities = [], []
+    for i in range(num_tables):
+        table = AtlasEntity(f"table{i}", TABLE_TYPE, _table_name(i), guid=guid,
+                            attributes={"owner_team": f"team{i % 7}"})
+        guid -= 1
+        tables.append(table)
+        entities.append(table)
+        for c in range(num_columns):
+            entities.append(AtlasEntity(
+                f"col{c}", COLUMN_TYPE, f"{_table_name(i)}#col{c}", guid=guid,
+                attributes={"data_type": "string"},
+                relationshipAttributes={"table": table.to_json(minimum=True)}))
+            guid -= 1
+
+    for p, source, target in _lineage_pairs(num_tables, lineage_density, seed):
+        entities.append(AtlasProcess(
+            f"proc{p}", PROCESS_TYPE, f"proc{p}", guid=guid,
+            inputs=[tables[source]], outputs=[tables[target]]))
+        guid -= 1
+    return entities
+
+
+def generate_bulk_rows(num_tables, num_columns):
+    """
+    Rows in the BulkEntities template for tables and their columns.
+    """
+    for i in range(num_tables):
+        yield {
+            "typeName": TABLE_TYPE, "name": f"table{i}",
+            "qualifiedName": _table_name(i), "owner_team": f"team{i % 7}",
+            "classifications": "PII;Confidential" if i % 10 == 0 else None,
+            "[Relationship] columns": None
+        }
+        for c in range(num_columns):
+            yield {
+                "typeName": COLUMN_TYPE, "name": f"col{c}",
+                "qualifiedName": f"{_table_name(i)}#col{c}", "data_type": "string",
+                "classifications": None,
+                "[Relationship] table": _table_name(i)
+            }
+
+
+def generate_table_lineage_rows(num_tables, lineage_density=1, seed=0):
+    """
+    Rows in the TablesLineage template.
+    """
+    for p, source, target in _lineage_pairs(num_tables, lineage_density, seed):
+        yield {
+            "Target table": _table_name(target), "Target type": TABLE_TYPE,
+            "Source table": _table_name(source), "Source type": TABLE_TYPE,
+            "Process name": f"proc{p}", "Process type": PROCESS_TYPE
+        }
+
+
+def generate_column_lineage_rows(num_tables, num_columns, lineage_density=1, seed=0):
+    """
+    Rows in the FineGrainColumnLineage template mapping each column of the
+    source table to the same column of the target table.
+    """
+    for p, source, target in _lineage_pairs(num_tables, lineage_density, seed):
+        for c in range(num_columns):
+            yield {
+                "Target table": _table_name(target), "Target column": f"col{c}",
+                "Source table": _table_name(source), "Source column": f"col{c}",
+                "transformation": None
+            }
+
+
+def generate_update_lineage_rows(num_tables, lineage_density=1, seed=0):
+    """
+    Rows in the UpdateLineage template.
+    """
+    for p, source, target in _lineage_pairs(num_tables, lineage_density, seed):
+        yield {
+            "Target typeName": TABLE_TYPE, "Target qualifiedName": _table_name(target),
+            "Source typeName": TABLE_TYPE, "Source qualifiedName": _table_name(source),
+            "Process name": f"proc{p}", "Process qualifiedName": f"proc{p}",
+            "Process typeName": PROCESS_TYPE
+        }
+
+
+def generate_worksheet(rows):
+    """
+    Write rows into an openpyxl worksheet with a header row.
+    """
+    from openpyxl import Workbook
+    rows = list(rows)
+    wb = Workbook()
+    ws = wb.active
+    headers = list(rows[0].keys())
+    ws.append(headers)
+    for row in rows:
+        ws.append([row.get(h) for h in headers])
+    return ws
@@ -0,0 +1,247 @@
+"""
+Benchmark the library's hot paths on a synthetic catalog of N tables with
+M columns each and a lineage density of processes per table.
+
+Run from the root of the repository:
+
+    python tests/benchmarks/run_benchmarks.py --tables 1000 --columns 20
+
+Track results over time by appending each run to a history file and compare
+against a saved baseline to catch regressions before a release:
+
+    python tests/benchmarks/run_benchmarks.py --save baseline.json
+    python tests/benchmarks/run_benchmarks.py --compare baseline.json \\
+        --history benchmark_history.jsonl --max-regression 0.2
+
+The compare step exits with a non-zero status if any benchmark is more than
+`--max-regression` slower than the baseline.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+
+import generators  # noqa: E402
+from pyapacheatlas import __version__  # noqa: E402
+from pyapacheatlas.core import AtlasEntity  # noqa: E402
+from pyapacheatlas.core.codec import dumps_entities  # noqa: E402
+from pyapacheatlas.core.util import batch_dependent_entities  # noqa: E402
+from pyapacheatlas.core.whatif import WhatIfValidator  # noqa: E402
+from pyapacheatlas.readers.excel import ExcelReader  # noqa: E402
+from pyapacheatlas.readers.reader import Reader, ReaderConfiguration  # noqa: E402
+from pyapacheatlas.testing import FakeAtlasServer  # noqa: E402
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """
+    Register a setup function that receives the run's arguments and returns
+    the function to time.
+    """
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("batch_dependent_entities")
+def bench_batch_dependent_entities(args):
+    entities = [e.to_json() for e in generators.generate_entities(
+        args.tables, args.columns, args.density)]
+    return lambda: batch_dependent_entities(entities, batch_size=max(args.columns + 1, 1000))
+
+
+@benchmark("AtlasEntity.to_json")
+def bench_entity_to_json(args):
+    entities = generators.generate_entities(args.tables, args.columns, args.density)
+    return lambda: [e.to_json() for e in entities]
+
+
+@benchmark("dumps_entities (json)")
+def bench_dumps_entities(args):
+    entities = generators.generate_entities(args.tables, args.columns, args.density)
+    return lambda: dumps_entities(entities, codec="json")
+
+
+@benchmark("dumps_entities (auto)")
+def bench_dumps_entities_auto(args):
+    entities = generators.generate_entities(args.tables, args.columns, args.density)
+    return lambda: dumps_entities(entities, codec="auto")
+
+
+@benchmark("AtlasEntity.from_json")
+def bench_entity_from_json(args):
+    entities = [e.to_json() for e in generators.generate_entities(
+        args.tables, args.columns, args.density)]
+    return lambda: [AtlasEntity.from_json(e) for e in entities]
+
+
+@benchmark("AtlasProcess construction")
+def bench_process_construction(args):
+    return lambda: generators.generate_entities(args.tables, 0, args.density)
+
+
+@benchmark("Reader.parse_bulk_entities")
+def bench_parse_bulk_entities(args):
+    reader = Reader(ReaderConfiguration())
+    rows = list(generators.generate_bulk_rows(args.tables, args.columns))
+    return lambda: reader.parse_bulk_entities(rows)
+
+
+@benchmark("LineageMixIn.parse_table_lineage")
+def bench_parse_table_lineage(args):
+    reader = Reader(ReaderConfiguration())
+    rows = list(generators.generate_table_lineage_rows(args.tables, args.density))
+    return lambda: reader.parse_table_lineage(rows)
+
+
+@benchmark("LineageMixIn.parse_finegrain_column_lineage")
+def bench_parse_finegrain_column_lineage(args):
+    reader = Reader(ReaderConfiguration())
+    table_rows = list(generators.generate_table_lineage_rows(args.tables, args.density))
+    column_rows = list(generators.generate_column_lineage_rows(
+        args.tables, args.columns, args.density))
+    typedefs = generators.generate_typedefs()
+
+    def run():
+        tables = reader.parse_table_lineage(table_rows)
+        return reader.parse_finegrain_column_lineage(column_rows, tables, typedefs)
+    return run
+
+
+@benchmark("LineageMixIn.parse_update_lineage")
+def bench_parse_update_lineage(args):
+    reader = Reader(ReaderConfiguration())
+    rows = list(generators.generate_update_lineage_rows(args.tables, args.density))
+    return lambda: reader.parse_update_lineage(rows)
+
+
+@benchmark("ExcelReader._parse_spreadsheet")
+def bench_parse_spreadsheet(args):
+    worksheet = generators.generate_worksheet(
+        generators.generate_bulk_rows(args.tables, args.columns))
+    return lambda: ExcelReader._parse_spreadsheet(worksheet)
+
+
+@benchmark("WhatIfValidator.validate_entities")
+def bench_validate_entities(args):
+    validator = WhatIfValidator(type_defs=generators.generate_typedefs())
+    entities = [e.to_json() for e in generators.generate_entities(
+        args.tables, args.columns, args.density)]
+    return lambda: validator.validate_entities(entities)
+
+
+@benchmark("upload_entities (fake server)")
+def bench_upload_entities(args):
+    server = FakeAtlasServer().start()
+    client = server.atlas_client()
+    entities = generators.generate_entities(args.tables, args.columns, args.density)
+
+    def run():
+        server.store.__init__()
+        return client.upload_entities(entities, batch_size=1000)
+    run.cleanup = server.stop
+    return run
+
+
+def _time(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), sorted(timings)[len(timings) // 2]
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+            cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    results = {}
+    selected = [n for n in BENCHMARKS if not args.only or any(o in n for o in args.only)]
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for name in selected:
+            func = BENCHMARKS[name](args)
+            try:
+                best, median = _time(func, args.repeat)
+            finally:
+                if hasattr(func, "cleanup"):
+                    func.cleanup()
+            results[name] = {"best": best, "median": median}
+            print(f"{name:<48} best {best*1000:10.1f}ms  median {median*1000:10.1f}ms")
+    return results
+
+
+def compare(results, baseline, max_regression):
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["best"] / baseline[name]["best"]
+        flag = ""
+        if ratio > 1 + max_regression:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<48} {ratio:6.2f}x baseline{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tables", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--density", type=int, default=1,
+                        help="The number of processes writing to each table.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*",
+                        help="Only run benchmarks whose name contains one of these.")
+    parser.add_argument("--save", help="Write the results to a json file.")
+    parser.add_argument("--compare", help="A json file of baseline results.")
+    parser.add_argument("--max-regression", type=float, default=0.2)
+    parser.add_argument("--history", help="Append the results to a json lines file.")
+    args = parser.parse_args()
+
+    results = run(args)
+    record = {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "version": __version__,
+        "python": platform.python_version(),
+        "parameters": {"tables": args.tables, "columns": args.columns,
+                       "density": args.density, "repeat": args.repeat},
+        "results": results
+    }
+    if args.save:
+        with open(args.save, "w") as fp:
+            json.dump(record, fp, indent=2)
+    if args.history:
+        with open(args.history, "a") as fp:
+            fp.write(json.dumps(record) + "\n")
+    if args.compare:
+        with open(args.compare) as fp:
+            baseline = json.load(fp)
+        if baseline.get("parameters") != record["parameters"]:
+            print("Warning: the baseline was run with different parameters.")
+        regressions = compare(results, baseline["results"], args.max_regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
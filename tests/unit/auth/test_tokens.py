@@ -0,0 +1,177 @@
+from collections import namedtuple
+import os
+import threading
+import time
+
+from pyapacheatlas.auth.azcredential import AzCredentialWrapper
+from pyapacheatlas.auth.tokens import AccessToken, FileTokenCache, TokenManager
+
+
+def test_token_manager_single_flight():
+    calls = []
+
+    def fetch_token(resource):
+        calls.append(resource)
+        time.sleep(0.1)
+        return f"{resource}-{len(calls)}", time.time() + 3600
+
+    manager = TokenManager(fetch_token, background_refresh=False)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(
+            manager.get_token("catalog").token))
+        for _ in range(20)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert(calls == ["catalog"])
+    assert(set(results) == set(["catalog-1"]))
+
+    # A forced refresh fetches a new token
+    assert(manager.refresh("catalog").token == "catalog-2")
+
+
+def test_token_manager_refreshes_within_margin():
+    calls = []
+
+    def fetch_token(resource):
+        calls.append(resource)
+        # The first token is already within the margin of expiring
+        return f"token{len(calls)}", time.time() + (10 if len(calls) == 1 else 3600)
+
+    manager = TokenManager(fetch_token, refresh_margin=60,
+                           background_refresh=False)
+    assert(manager.get_token("catalog").token == "token1")
+    assert(manager.get_token("catalog").token == "token2")
+    assert(manager.get_token("catalog").token == "token2")
+
+
+def test_token_manager_background_refresh():
+    calls = []
+    refreshed = threading.Event()
+
+    def fetch_token(resource):
+        calls.append(resource)
+        if len(calls) > 1:
+            refreshed.set()
+        return f"token{len(calls)}", time.time() + 2
+
+    manager = TokenManager(fetch_token, refresh_margin=0)
+    try:
+        assert(manager.get_token("catalog").token == "token1")
+        assert(manager.get_token("catalog").token == "token1")
+        # The token is in use so it is refreshed halfway through its
+        # lifetime without waiting for a request
+        assert(refreshed.wait(5))
+        assert(manager.cached_token("catalog").token != "token1")
+    finally:
+        manager.close()
+
+
+def test_token_manager_background_refresh_stops_when_idle():
+    calls = []
+
+    def fetch_token(resource):
+        calls.append(resource)
+        return f"token{len(calls)}", time.time() + 1
+
+    manager = TokenManager(fetch_token, refresh_margin=0)
+    try:
+        manager.get_token("catalog")
+        manager.get_token("catalog")
+        thread = manager._thread
+        # Refreshed once because the token was requested after it was
+        # fetched, then dropped and the thread stops since it is idle
+        thread.join(5)
+        assert(not thread.is_alive())
+        assert(calls == ["catalog", "catalog"])
+        assert(manager._thread is None)
+
+        # The next request fetches a token and starts a new thread
+        assert(manager.get_token("catalog").token == "token3")
+        assert(manager._thread is not None)
+    finally:
+        manager.close()
+    assert(manager._thread is None)
+
+
+def test_auth_close_stops_background_refresh():
+    Token = namedtuple("Token", ["token", "expires_on"])
+
+    class FakeCredential():
+        def get_token(self, scope):
+            return Token(scope, int(time.time()) + 3600)
+
+    with AzCredentialWrapper(FakeCredential()) as auth:
+        auth.get_authentication_headers()
+        thread = auth.token_manager._thread
+        assert(thread.is_alive())
+    assert(not thread.is_alive())
+    # Tokens are still fetched on the request path after closing
+    assert(auth.get_graph_authentication_headers()["Authorization"])
+
+
+def test_azcredential_shares_manager_between_audiences():
+    Token = namedtuple("Token", ["token", "expires_on"])
+
+    class FakeCredential():
+        def __init__(self):
+            self.scopes = []
+
+        def get_token(self, scope):
+            self.scopes.append(scope)
+            return Token(scope, int(time.time()) + 3600)
+
+    credential = FakeCredential()
+    auth = AzCredentialWrapper(credential, background_refresh=False)
+    for _ in range(3):
+        catalog = auth.get_authentication_headers()
+        graph = auth.get_graph_authentication_headers()
+
+    assert(len(credential.scopes) == 2)
+    assert(catalog["Authorization"] ==
+           "Bearer 73c2949e-da2d-457a-9607-fcc665198967/.default")
+    assert(graph["Authorization"] ==
+           "Bearer https://graph.microsoft.com/.default")
+    assert(auth.access_token == "73c2949e-da2d-457a-9607-fcc665198967/.default")
+
+
+def test_file_token_cache_shared_between_managers():
+    temp_path = "./temp_token_cache.json"
+    cache = FileTokenCache(temp_path)
+    calls = []
+
+    def fetch_token(resource):
+        calls.append(resource)
+        return f"token{len(calls)}", int(time.time()) + 3600
+
+    def key(resource):
+        return FileTokenCache.make_key("tenant", "client", resource)
+
+    try:
+        first = TokenManager(fetch_token, background_refresh=False,
+                             token_cache=cache, cache_key=key)
+        assert(first.get_token("catalog").token == "token1")
+
+        # A second "process" reads the token from disk instead of fetching
+        second = TokenManager(fetch_token, background_refresh=False,
+                              token_cache=FileTokenCache(temp_path),
+                              cache_key=key)
+        assert(second.get_token("catalog").token == "token1")
+        assert(calls == ["catalog"])
+
+        # A forced refresh skips the cache and updates it for others
+        assert(second.refresh("catalog").token == "token2")
+        assert(cache.get(key("catalog")).token == "token2")
+        assert(cache.get(key("other")) is None)
+
+        # Expired tokens are not returned
+        cache.set(key("expired"), AccessToken("old", time.time() - 1))
+        assert(cache.get(key("expired")) is None)
+    finally:
+        for path in [temp_path, temp_path + ".lock"]:
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,85 @@
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def test_update_entities_labels(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = upload_tables(client, 3, labels=["a"], businessAttributes={"ops": {"code": "1"}})
+        bulk_posts = server.request_count("POST", "/entity/bulk")
+
+        rows = client.update_entities_labels({
+            guids["db.t0"]: ["b"],
+            ("hive_table", "db.t1"): ["a", "c"],
+            "missing": ["x"]
+        }, chunk_size=2)
+
+        assert(server.request_count("POST", "/entity/bulk") == bulk_posts + 1)
+        assert([(r["guid"], r["status"], r["method"]) for r in rows] == [
+            (guids["db.t0"], "updated", "bulk"),
+            (guids["db.t1"], "updated", "bulk"),
+            (None, "not_found", None)])
+        assert(server.store.entities[guids["db.t0"]]["labels"] == ["a", "b"])
+        assert(server.store.entities[guids["db.t1"]]["labels"] == ["a", "c"])
+        assert(server.store.entities[guids["db.t2"]]["labels"] == ["a"])
+
+        client.delete_entities_labels({guids["db.t0"]: ["a"]})
+        assert(server.store.entities[guids["db.t0"]]["labels"] == ["b"])
+
+        # A failed bulk request falls back to one request per entity
+        server.inject(500, count=1, route="/entity/bulk", method="POST")
+        rows = client.update_entities_labels(
+            [({"guid": guids["db.t2"]}, ["z"])], force_update=True, max_retries=0)
+        assert(rows[0]["status"] == "updated" and rows[0]["method"] == "entity")
+        assert(server.store.entities[guids["db.t2"]]["labels"] == ["z"])
+
+
+def test_update_entities_businessMetadata(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = upload_tables(client, 2, labels=["a"], businessAttributes={"ops": {"code": "1"}})
+
+        client.update_entities_businessMetadata(
+            {guids["db.t0"]: {"ops": {"level": "high"}}, guids["db.t1"]: {"ops": {"level": "low"}}})
+        assert(server.store.entities[guids["db.t0"]]["businessAttributes"] ==
+               {"ops": {"code": "1", "level": "high"}})
+
+        rows = client.delete_entities_businessMetadata(
+            {("hive_table", "db.t1"): {"ops": {"code": ""}}}, fold=False)
+        assert(rows[0]["method"] == "entity")
+        assert(server.store.entities[guids["db.t1"]]["businessAttributes"] ==
+               {"ops": {"level": "low"}})
+
+
+def test_update_entities_tags(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.purview_client()
+        guids = upload_tables(client, 2, labels=["a"], businessAttributes={"ops": {"code": "1"}})
+
+        rows = client.update_entities_tags(
+            {guid: ["gold"] for guid in guids.values()}, fold=False, max_workers=2)
+        assert(all(r["status"] == "updated" for r in rows))
+        assert(server.request_count("PUT", "/labels") == 2)
+        client.delete_entities_tags({guids["db.t0"]: ["a", "gold"]})
+        assert(server.store.entities[guids["db.t0"]]["labels"] == [])
+
+
+def test_update_entities_labels_isolates_lookup_failures(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = upload_tables(client, 2, labels=["a"], businessAttributes={"ops": {"code": "1"}})
+
+        server.inject(404, route="/entity/bulk/uniqueAttribute/")
+        rows = client.update_entities_labels({
+            guids["db.t0"]: ["b"], ("hive_table", "db.t1"): ["b"]}, max_retries=0)
+        assert([r["status"] for r in rows] == ["updated", "not_found"])
+
+        server.inject(500, route="/entity/bulk/uniqueAttribute/")
+        rows = client.update_entities_labels(
+            {("hive_table", "db.t1"): ["b"]}, max_retries=0)
+        assert(rows[0]["status"] == "failed" and rows[0]["error"])
+        assert(server.store.entities[guids["db.t1"]]["labels"] == ["a"])
+
+        server.inject(500, route="/entity/bulk", method="GET")
+        rows = client.update_entities_labels({guids["db.t0"]: ["c"]}, max_retries=0)
+        assert(rows[0]["status"] == "failed" and "500" in rows[0]["error"])
+        assert(server.store.entities[guids["db.t0"]]["labels"] == ["a", "b"])
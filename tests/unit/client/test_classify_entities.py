@@ -0,0 +1,56 @@
+from pyapacheatlas.core.entity import AtlasClassification
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def test_classify_entities(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = upload_tables(client, 6)
+        client.classify_entity(guids["db.t0"], [{"typeName": "PII", "attributes": {"level": 1}}])
+        posts = server.request_count("POST", "/classifications")
+
+        results = client.classify_entities(
+            [(guids[f"db.t{i}"], [AtlasClassification("PII")]) for i in range(5)]
+            + [(guids["db.t5"], [{"typeName": "Sensitive"}]), ("missing", [{"typeName": "PII"}])],
+            chunk_size=2)
+
+        assert(sorted(results["adds"]) == sorted(guids[f"db.t{i}"] for i in range(1, 6)))
+        assert(results["skipped"] == {guids["db.t0"]: ["PII"]})
+        assert(results["updates"] == {})
+        assert(list(results["errors"]) == ["missing"])
+        # Two bulk requests for t1-t4 and one request for t5
+        assert(server.request_count("POST", "/entity/bulk/classification") == 2)
+        assert(server.request_count("POST", "/classifications") == posts + 1)
+
+        results = client.classify_entities(
+            {guids["db.t0"]: {"typeName": "PII", "attributes": {"level": 2}}},
+            force_update=True)
+        assert(results["updates"] == {guids["db.t0"]: ["PII"]})
+        assert(server.store.entities[guids["db.t0"]]["classifications"][0]["attributes"] == {"level": 2})
+
+
+def test_classify_entities_isolates_failures(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = sorted(upload_tables(client, 3).values())
+        # Classified after the existing classifications were read
+        server.inject(500, count=1, route="/entity/bulk/classification")
+
+        results = client.classify_entities({g: [{"typeName": "PII"}] for g in guids})
+        assert(sorted(results["adds"]) == guids)
+        assert(results["errors"] == {})
+        assert(all(e["classifications"][0]["typeName"] == "PII"
+                   for e in server.store.entities.values()))
+
+
+def test_classify_entities_reports_read_errors(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        guids = upload_tables(client, 1)
+        server.inject(500, route="/entity/bulk", method="GET")
+
+        results = client.classify_entities(
+            {guids["db.t0"]: [{"typeName": "PII"}]}, max_retries=0)
+        assert(results["adds"] == {})
+        assert(results["errors"][guids["db.t0"]] != ["The entity was not found."])
+        assert("500" in results["errors"][guids["db.t0"]][0])
@@ -0,0 +1,40 @@
+import copy
+
+import pytest
+
+
+def _upload_tables(client, count, columns=0, **fields):
+    """
+    Upload hive_table entities t0, t1, ... with qualified names db.t0,
+    db.t1, ... and `columns` hive_column entities per table (db.t0.c0, ...)
+    that point to their table. Extra fields (e.g. labels or
+    classifications) are added to every table.
+
+    :return: The guid of each uploaded entity by qualified name.
+    :rtype: dict(str, str)
+    """
+    entities = []
+    for t in range(count):
+        table_guid = str(-(t * (columns + 1) + 1))
+        table = copy.deepcopy(fields)
+        table.update({"typeName": "hive_table", "guid": table_guid,
+                      "attributes": {"name": f"t{t}", "qualifiedName": f"db.t{t}"}})
+        entities.append(table)
+        for c in range(columns):
+            entities.append({
+                "typeName": "hive_column", "guid": str(-(t * (columns + 1) + c + 2)),
+                "attributes": {"name": f"c{c}", "qualifiedName": f"db.t{t}.c{c}"},
+                "relationshipAttributes": {
+                    "table": {"guid": table_guid, "typeName": "hive_table"}}
+            })
+    assignments = client.upload_entities(entities)["guidAssignments"]
+    return {e["attributes"]["qualifiedName"]: assignments[e["guid"]] for e in entities}
+
+
+@pytest.fixture
+def upload_tables():
+    """
+    A function that uploads tables (and optionally their columns) with a
+    client and returns their guids by qualified name.
+    """
+    return _upload_tables
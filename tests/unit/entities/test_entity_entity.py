@@ -50,6 +50,20 @@ def test_explicit_add_nulls():
     assert(ae.customAttributes is None)
     assert(ae.relationshipAttributes is not None)
 
+def test_unset_fields_not_stored():
+    ae = AtlasEntity(name="a", typeName="b", qualified_name="c", guid=-1,
+                     status="ACTIVE")
+    assert("customAttributes" not in vars(ae))
+    assert(isinstance(ae.customAttributes, AtlasUnInit))
+    assert(set(ae.to_json().keys()) == set(
+        ["typeName", "guid", "attributes", "status"]))
+
+    ae.customAttributes = {"a": "b"}
+    assert(ae.to_json()["customAttributes"] == {"a": "b"})
+    ae.customAttributes = AtlasUnInit()
+    assert("customAttributes" not in ae.to_json())
+    assert(isinstance(AtlasEntity("x", "y", "z").customAttributes, AtlasUnInit))
+
 def test_add_classifications():
     ae = AtlasEntity(name="a", typeName="b", qualified_name="c", guid=-1)
     ae.addClassification("a","b", AtlasClassification("c"))
@@ -0,0 +1,97 @@
+import json
+
+from pyapacheatlas.core.client import AtlasClient
+from pyapacheatlas.core.entity import AtlasEntity, RawAtlasEntity
+from pyapacheatlas.core.util import batch_dependent_entities
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def _column_json(guid, table_guid):
+    return {
+        "typeName": "hive_column",
+        "guid": guid,
+        "attributes": {"name": f"col{guid}", "qualifiedName": f"db.table.col{guid}"},
+        "relationshipAttributes": {
+            "table": {"guid": table_guid, "typeName": "hive_table",
+                      "relationshipGuid": "rel-123", "displayText": "table"}
+        },
+        "classifications": [{"typeName": "PII", "entityGuid": guid}],
+        "createTime": 1600000000000,
+        "version": 3
+    }
+
+
+def test_raw_entity_edits_in_place():
+    response = {"entities": [_column_json("old-col", "old-table")]}
+    column = RawAtlasEntity.from_response(response)[0]
+
+    column.qualifiedName = "db.table.renamed"
+    column.attributes["data_type"] = "string"
+    replaced = column.remap_guids({"old-col": "-1", "old-table": "-2"})
+    column.strip_system_fields()
+
+    original = response["entities"][0]
+    assert(replaced == 3)
+    assert(column.to_json() is original)
+    assert(original["guid"] == "-1")
+    assert(original["attributes"]["qualifiedName"] == "db.table.renamed")
+    assert(original["attributes"]["data_type"] == "string")
+    assert(original["relationshipAttributes"]["table"] == {
+        "guid": "-2", "typeName": "hive_table"})
+    assert(original["classifications"][0]["entityGuid"] == "-1")
+    assert("createTime" not in original and "version" not in original)
+    assert(column.to_json(minimum=True) == {
+        "typeName": "hive_column", "guid": "-1",
+        "qualifiedName": "db.table.renamed"})
+
+    table = AtlasEntity("table", "hive_table", "db.table", guid="-3")
+    column.addRelationship(table=table, siblings=[RawAtlasEntity(_column_json("-4", "-3"))])
+    assert(original["relationshipAttributes"]["table"] == table.to_json(minimum=True))
+    assert(original["relationshipAttributes"]["siblings"][0]["guid"] == "-4")
+
+
+def test_raw_entity_upload_and_batching():
+    table = {"typeName": "hive_table", "guid": "-1",
+             "attributes": {"name": "table", "qualifiedName": "db.table"}}
+    entities = [RawAtlasEntity(table)] + [
+        RawAtlasEntity(_column_json(str(-i), "-1")) for i in range(2, 6)] + [
+        RawAtlasEntity({"typeName": "hive_table", "guid": "-6",
+                        "attributes": {"name": "t2", "qualifiedName": "db.t2"}})]
+    for entity in entities:
+        entity.strip_system_fields()
+
+    batches = batch_dependent_entities(entities, batch_size=5)
+    assert(sorted(len(b) for b in batches) == [1, 5])
+
+    payload = AtlasClient._prepare_entity_upload(entities)
+    assert(payload["entities"][0] is table)
+    assert(json.loads(json.dumps(payload))["entities"][0] == table)
+
+    with FakeAtlasServer() as server:
+        client = server.atlas_client()
+        results = client.upload_entities(entities, batch_size=5)
+        assert(len(server.store.entities) == 6)
+        single = client.upload_entities(RawAtlasEntity(
+            {"typeName": "hive_db", "guid": "-9",
+             "attributes": {"name": "db", "qualifiedName": "db"}}))
+    assert(all("guidAssignments" in r for r in results))
+    assert("-9" in single["guidAssignments"])
+
+
+def test_raw_entity_reads_do_not_edit_and_structs_are_remapped():
+    process = {"typeName": "Process", "guid": "old-process"}
+    view = RawAtlasEntity(process)
+    assert(view.qualifiedName is None and view.relationshipAttributes == {})
+    assert(process == {"typeName": "Process", "guid": "old-process"})
+    view.name = "p"
+    assert(process["attributes"] == {"name": "p"})
+
+    # Object ids nested in struct values (e.g. a column mapping)
+    process["attributes"]["mapping"] = {
+        "typeName": "mapping_struct",
+        "attributes": {"source": {"guid": "old-a"}, "sinks": [{"guid": "old-b"}]}}
+    assert(view.referenced_guids() == {"old-a", "old-b"})
+    assert(view.remap_guids({"old-a": "-1", "old-process": "-2"}) == 2)
+    assert(view.remove_references({"old-b"}) == 1)
+    assert(process["attributes"]["mapping"]["attributes"] == {
+        "source": {"guid": "-1"}, "sinks": []})
@@ -594,3 +594,71 @@ def test_excel_column_mapping():
         
     finally:
         remove_workbook(temp_filepath)
+
+
+def test_excel_iter_spreadsheet_read_only():
+    temp_filepath = "./temp_test_excel_iter_spreadsheet.xlsx"
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "BulkEntities"
+    ws.append(["typeName", "name", "qualifiedName", "description"])
+    ws.append(["demoType", "abc", "qn_abc", "some desc"])
+    # The trailing empty cell is left off in a read only worksheet
+    ws.append(["demoType", "def", "qn_def"])
+    wb.save(temp_filepath)
+    wb.close()
+
+    try:
+        wb = load_workbook(temp_filepath, read_only=True)
+        rows = ExcelReader._iter_spreadsheet(wb["BulkEntities"])
+        assert(not isinstance(rows, list))
+        results = list(rows)
+        wb.close()
+
+        assert(results == [
+            {"typeName": "demoType", "name": "abc",
+                "qualifiedName": "qn_abc", "description": "some desc"},
+            {"typeName": "demoType", "name": "def",
+                "qualifiedName": "qn_def", "description": None}
+        ])
+    finally:
+        remove_workbook(temp_filepath)
+
+
+def test_excel_parse_workbook():
+    temp_filepath = "./temp_test_excel_parse_workbook.xlsx"
+    ec = ExcelConfiguration()
+    reader = ExcelReader(ec)
+
+    setup_workbook(temp_filepath, "BulkEntities", 3, [
+        ["demoType", "entityNameABC", "qualifiedNameofEntityNameABC"],
+        ["demoType", "entityNameGHI", "qualifiedNameofEntityNameGHI"]
+    ])
+    setup_workbook(temp_filepath, "EntityDefs", 7, [
+        ["demoType", "attrib1", "Some desc", "True", "False", None, "string"]
+    ])
+    setup_workbook(temp_filepath, "UpdateLineage", 7, [
+        ["demoTarget", "demoTargetQN", "demoSource", "demoSourceQN",
+         "proc01", "procQN01", "Process"]
+    ])
+    setup_workbook(temp_filepath, "ColumnMapping", 7, [
+        ["demoSourceQN", "A1", "demoTargetQN", "B1", "procQN01", "Process", "proc01"]
+    ])
+
+    try:
+        results = reader.parse_workbook(temp_filepath)
+
+        assert(set(results.keys()) == set(["typedefs", "entities", "lineage"]))
+        assert(len(results["typedefs"]["entityDefs"]) == 1)
+        assert(results["typedefs"]["classificationDefs"] == [])
+        assert(len(results["entities"]) == 2)
+        assert(len(results["lineage"]) == 1)
+        assert("columnMapping" in results["lineage"][0]["attributes"])
+        assert(results["lineage"][0]["attributes"]["inputs"][0]["uniqueAttributes"]["qualifiedName"] == "demoSourceQN")
+
+        only_bulk = reader.parse_workbook(temp_filepath, sheets=["BulkEntities"])
+        assert(only_bulk["typedefs"] == {})
+        assert(len(only_bulk["entities"]) == 2)
+        assert(only_bulk["lineage"] == [])
+    finally:
+        remove_workbook(temp_filepath)
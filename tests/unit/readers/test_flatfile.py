@@ -0,0 +1,83 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from pyapacheatlas.readers.flatfile import (
+    CsvConfiguration, CsvReader, JsonLinesConfiguration, JsonLinesReader
+)
+
+
+def test_csv_bulk_entities_gzip():
+    temp_path = "./temp_bulkentities.csv.gz"
+    content = (
+        "typeName, name , qualifiedName,description,[Relationship] table\n"
+        "demo_table,tbl,tbl_qn,,\n"
+        "demo_column,col,col_qn,a column,tbl_qn\n"
+    )
+    with gzip.open(temp_path, "wt", encoding="utf-8") as fp:
+        fp.write(content)
+
+    reader = CsvReader(CsvConfiguration())
+    try:
+        results = reader.parse_bulk_entities(temp_path)
+    finally:
+        os.remove(temp_path)
+
+    entities = results["entities"]
+    assert(len(entities) == 2)
+    assert(entities[0]["attributes"]["name"] == "tbl")
+    # Empty cells behave like empty excel cells
+    assert("description" not in entities[0]["attributes"])
+    assert(entities[1]["attributes"]["description"] == "a column")
+    assert(entities[1]["relationshipAttributes"]["table"]["guid"] ==
+           entities[0]["guid"])
+
+
+def test_csv_update_lineage_custom_delimiter():
+    temp_path = "./temp_updatelineage.csv"
+    rows = [
+        ["Target typeName", "Target qualifiedName", "Source typeName",
+         "Source qualifiedName", "Process name", "Process qualifiedName",
+         "Process typeName"],
+        ["demo_table", "tgt", "demo_table", "src", "proc", "proc_qn", "Process"],
+        ["", "", "demo_table", "src2", "proc", "proc_qn", "Process"],
+    ]
+    with open(temp_path, "w", encoding="utf-8") as fp:
+        fp.write("\n".join("|".join(r) for r in rows))
+
+    reader = CsvReader(CsvConfiguration(delimiter="|"))
+    try:
+        results = reader.parse_update_lineage(temp_path)
+    finally:
+        os.remove(temp_path)
+
+    assert(len(results) == 1)
+    assert(len(results[0]["attributes"]["inputs"]) == 2)
+    assert(len(results[0]["attributes"]["outputs"]) == 1)
+
+
+def test_jsonlines_table_lineage_and_errors():
+    temp_path = "./temp_tableslineage.jsonl"
+    rows = [
+        {"Target table": "table1", "Target type": "demo_table",
+         "Source table": "table0", "Source type": "demo_table",
+         "Process name": "proc01", "Process type": "demo_process"},
+    ]
+    with open(temp_path, "w", encoding="utf-8") as fp:
+        fp.write("\n".join(json.dumps(r) for r in rows) + "\n\n")
+
+    reader = JsonLinesReader(JsonLinesConfiguration())
+    try:
+        results = reader.parse_table_lineage(temp_path)
+        assert(len(results) == 3)
+        assert(set(e.attributes["name"] for e in results) ==
+               set(["table0", "table1", "proc01"]))
+
+        with open(temp_path, "a", encoding="utf-8") as fp:
+            fp.write("{not json}\n")
+        with pytest.raises(ValueError):
+            reader.parse_table_lineage(temp_path)
+    finally:
+        os.remove(temp_path)
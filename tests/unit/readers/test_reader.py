@@ -473,3 +473,43 @@ def test_parse_bulk_entities_with_custom_attributes():
     assert(ae1["customAttributes"]["foo"] == "bar")
 
     assert("customAttributes" not in ae2)
+
+
+def test_parse_bulk_entities_in_parallel_matches_serial():
+    json_rows = []
+    for i in range(20):
+        json_rows.append(
+            {"typeName": "demo_table", "name": f"tbl{i}", "qualifiedName": f"tbl{i}",
+             "[Relationship] table": None, "[custom] team": "abc",
+             "[Business][biz] attr": "val", "experts": "a;b:info"})
+        json_rows.append(
+            {"typeName": "demo_column", "name": f"col{i}", "qualifiedName": f"col{i}",
+             # Reference tables defined in earlier chunks
+             "[Relationship] table": f"tbl{i // 2}", "[custom] team": None,
+             "[Business][biz] attr": None, "experts": None})
+    # A later row with the same qualifiedName wins but keeps its position
+    json_rows.append(
+        {"typeName": "demo_table", "name": "tbl0_updated", "qualifiedName": "tbl0",
+         "[Relationship] table": None, "[custom] team": None,
+         "[Business][biz] attr": None, "experts": None})
+    # And later references point to the most recent definition
+    json_rows.append(
+        {"typeName": "demo_column", "name": "colZ", "qualifiedName": "colZ",
+         "[Relationship] table": "tbl0", "[custom] team": None,
+         "[Business][biz] attr": None, "experts": None})
+
+    def dummy_func(x): return x + "_abc"
+
+    serial = Reader(ReaderConfiguration()).parse_bulk_entities(
+        json_rows, contacts_func=dummy_func)
+    parallel = Reader(ReaderConfiguration()).parse_bulk_entities(
+        json_rows, contacts_func=dummy_func, processes=2, chunk_size=3)
+
+    assert(serial == parallel)
+    entities = parallel["entities"]
+    assert(len(entities) == 41)
+    assert(entities[0]["attributes"]["name"] == "tbl0_updated")
+    assert(entities[0]["guid"] == "-1041")
+    assert(entities[-1]["relationshipAttributes"]["table"]["guid"] == "-1041")
+    assert(entities[2]["contacts"]["Expert"] == [
+        {"id": "a_abc"}, {"id": "b_abc", "info": "info"}])
@@ -470,3 +470,35 @@ def test_parse_update_lineage_multi_row_with_na_last():
     outputs = results[0]["attributes"]["outputs"]
     assert(len(outputs) == 0)
     assert(len(inputs) == 2)
+
+
+def test_parse_update_lineage_generator_with_na_inputs():
+
+    reader = Reader(READER_CONFIG)
+
+    def row(source, target):
+        return {
+            "Target typeName": "demo_table" if target else None,
+            "Target qualifiedName": target,
+            "Source typeName": "demo_table2" if source else None,
+            "Source qualifiedName": source,
+            "Process name": "proc01", "Process qualifiedName": "procqual01",
+            "Process typeName": "Process2"
+        }
+
+    json_rows = (r for r in [
+        row("demosource", "demotarget"),
+        row("N/A", None),
+        row("demosource2", None),
+        row("demosource2", "demotarget"),
+    ])
+
+    with pytest.warns(UserWarning):
+        results = reader.parse_update_lineage(json_rows)
+    assert(len(results) == 1)
+    inputs = results[0]["attributes"]["inputs"]
+    outputs = results[0]["attributes"]["outputs"]
+    # The N/A resets the inputs and later rows add to the reset list
+    assert([x["uniqueAttributes"]["qualifiedName"]
+           for x in inputs] == ["demosource2"])
+    assert(len(outputs) == 1)
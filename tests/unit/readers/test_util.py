@@ -189,3 +189,40 @@ def test_columns_matching_pattern_eliminate():
     results = columns_matching_pattern(row, "source", does_not_match=["source req"])
     assert(len(results)==2)
     assert(set(results) == set(["attrib1", "data_type"]))
+
+
+def test_index_entities_by_attribute():
+    atlas_entities = setup_batch_entities()
+    duplicate = AtlasEntity(
+        name="demoentity", typeName="other_table",
+        qualified_name="demoentity_dupe", guid=-2000)
+    atlas_entities.append(duplicate)
+
+    results = index_entities_by_attribute("name", atlas_entities)
+
+    assert(results["demoentity"] is first_entity_matching_attribute(
+        "name", "demoentity", atlas_entities))
+    assert(results["demoentity"].typeName == "demo_table")
+
+
+def test_index_processes_by_io():
+    atlas_entities = setup_batch_entities()
+    in_qn = atlas_entities[0].qualifiedName
+    out_qn = atlas_entities[1].qualifiedName
+
+    results = index_processes_by_io(atlas_entities)
+
+    for key in [(in_qn, out_qn), (None, out_qn), ("*", out_qn), (in_qn, None)]:
+        assert(results[key] is first_process_containing_io(
+            key[0], key[1], atlas_entities))
+    assert((out_qn, in_qn) not in results)
+
+
+def test_index_relationships_by_end_def():
+    results = index_relationships_by_end_def(RELATIONSHIP_TYPE_DEFS)
+
+    expected = first_relationship_that_matches(
+        "endDef2", "demo_process", "columnLineages", RELATIONSHIP_TYPE_DEFS)
+    assert(results[("endDef2", "demo_process", "columnLineages")] is expected)
+    assert(results[("endDef1", "demo_table", "columns")]["name"] == "demo_table_columns")
+    assert(len(results) == 4)
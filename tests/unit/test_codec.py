@@ -0,0 +1,123 @@
+import gzip
+import json
+
+import pytest
+import requests
+
+from pyapacheatlas.core.client import AtlasClient, PurviewClient
+from pyapacheatlas.core.codec import JsonCodec, dumps_entities, get_codec
+from pyapacheatlas.core.entity import AtlasEntity, AtlasProcess
+from pyapacheatlas.core.util import AtlasResponse
+
+
+def _make_response(content, status_code=200):
+    response = requests.Response()
+    response._content = content
+    response.status_code = status_code
+    response.request = requests.Request("GET", "http://localhost").prepare()
+    return response
+
+
+def test_get_codec():
+    assert(get_codec().name == "json")
+    assert(get_codec(None).name == "json")
+    assert(get_codec("auto").name in ["orjson", "ujson", "json"])
+
+    custom = JsonCodec("custom", lambda obj, default=None: b"{}", lambda raw: {})
+    assert(get_codec(custom) is custom)
+
+    with pytest.raises(ValueError):
+        get_codec("not_a_codec")
+
+
+def test_codec_round_trip():
+    body = {"entities": [{"typeName": "hive_table", "attributes": {
+        "name": "tést", "position": 1}}]}
+    for name in ["json", "auto"]:
+        codec = get_codec(name)
+        encoded = codec.dumps(body)
+        assert(isinstance(encoded, bytes))
+        assert(codec.loads(encoded) == body)
+
+
+def test_atlas_response_lazy_body():
+    resp = AtlasResponse(_make_response(b'{"guid": "abc"}'), lazy=True)
+    assert(resp.raw == b'{"guid": "abc"}')
+    assert(resp.body == {"guid": "abc"})
+    assert(resp.raw is None)
+
+    eager = AtlasResponse(_make_response(b'{"guid": "abc"}'))
+    assert(eager.raw is None)
+    assert(eager.body == {"guid": "abc"})
+
+    empty = AtlasResponse(_make_response(b"", status_code=204), lazy=True)
+    assert(empty.body is None)
+
+
+def test_atlas_response_invalid_json():
+    with pytest.raises(ValueError):
+        AtlasResponse(_make_response(b"not json"))
+
+    lazy = AtlasResponse(_make_response(b"not json"), lazy=True)
+    with pytest.raises(ValueError):
+        lazy.body
+
+
+def test_client_args_reach_sub_clients():
+    client = PurviewClient("DEMO", json_codec="auto", lazy_responses=True)
+    for sub_client in [client, client.glossary, client.collections, client.discovery]:
+        assert(sub_client._json_codec.name == get_codec("auto").name)
+        assert(sub_client._lazy_responses)
+
+    default = AtlasClient("http://localhost/api/atlas/v2")
+    assert(default._json_codec.name == "json")
+    assert(not default.glossary._lazy_responses)
+
+
+def test_compress_request_body():
+    body = {"entities": [{"typeName": "hive_table", "attributes": {
+        "qualifiedName": f"db.table{i}@primary"}} for i in range(500)]}
+
+    client = AtlasClient("http://localhost/api/atlas/v2",
+                         compress_requests=True, compression_level=9)
+    headers = {}
+    data = client._compress_body(client._encode_json(body, headers), headers)
+    assert(headers["Content-Encoding"] == "gzip")
+    assert(headers["Content-Type"] == "application/json")
+    assert(json.loads(gzip.decompress(data)) == body)
+    assert(client.glossary._compress_requests)
+
+    small_headers = {}
+    small = client._compress_body(b'{"guid": "abc"}', small_headers)
+    assert(small == b'{"guid": "abc"}')
+    assert("Content-Encoding" not in small_headers)
+
+    default = AtlasClient("http://localhost/api/atlas/v2")
+    default_headers = {}
+    encoded = default._encode_json(body, default_headers)
+    assert(default._compress_body(encoded, default_headers) is encoded)
+    assert("Content-Encoding" not in default_headers)
+
+
+def test_dumps_entities():
+    table = AtlasEntity("table", "hive_table", "db.table@primary", guid=-1,
+                        classifications=["PII"])
+    column = AtlasEntity("col", "hive_column", "db.table.col@primary", guid=-2,
+                         relationshipAttributes={"table": table.to_json(minimum=True)})
+    proc = AtlasProcess("proc", "Process", "proc@primary", guid=-3,
+                        inputs=[table], outputs=[])
+    raw = {"typeName": "hive_db", "guid": -4, "attributes": {"name": "db"}}
+    batch = [table, column, proc, raw]
+    expected = AtlasClient._prepare_entity_upload(batch)
+
+    for name in ["json", "auto"]:
+        encoded = dumps_entities(batch, codec=name)
+        assert(json.loads(encoded) == expected)
+
+    client = AtlasClient("http://localhost/api/atlas/v2", json_codec="auto")
+    payload = AtlasClient._prepare_entity_upload(batch, to_json=False)
+    assert(payload["entities"][0] is table)
+    assert(json.loads(client._encode_json(payload, {})) == expected)
+
+    with pytest.raises(TypeError):
+        dumps_entities([object()])
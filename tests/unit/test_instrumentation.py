@@ -0,0 +1,146 @@
+import io
+import json
+
+import pytest
+import requests
+
+from pyapacheatlas.core.client import AtlasClient, PurviewClient
+from pyapacheatlas.core.instrumentation import (
+    JsonLinesExporter, LatencyHistogram, RequestEvent, RequestHook,
+    template_route
+)
+from pyapacheatlas.core.util import _with_retries
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def test_template_route():
+    endpoint = "https://demo.purview.azure.com/catalog/api/atlas/v2"
+    assert(template_route(endpoint + "/entity/bulk", endpoint) == "/entity/bulk")
+    assert(template_route(
+        endpoint + "/lineage/9d6c0e2a-3c9f-4f57-8b7e-0a3f6c1d2e4f?direction=BOTH",
+        endpoint) == "/lineage/{guid}")
+    assert(template_route(
+        endpoint + "/entity/uniqueAttribute/type/hive_table", endpoint
+    ) == "/entity/uniqueAttribute/type/{typeName}")
+    assert(template_route(
+        endpoint + "/types/typedef/name/my_type", endpoint
+    ) == "/types/typedef/name/{name}")
+    assert(template_route("http://localhost/entity/guid/-100") == "/entity/guid/{guid}")
+    assert(template_route(endpoint + "/glossary/terms", endpoint) == "/glossary/terms")
+    assert(template_route(endpoint + "/glossary/categories", endpoint) == "/glossary/categories")
+    assert(template_route(
+        endpoint + "/glossary/9d6c0e2a-3c9f-4f57-8b7e-0a3f6c1d2e4f/terms", endpoint
+    ) == "/glossary/{guid}/terms")
+
+
+def _event(method, route, status_code, latency):
+    event = RequestEvent(method, "http://localhost" + route, route, bytes_sent=10)
+    event.status_code = status_code
+    event.bytes_received = 20
+    event.latency = latency
+    return event
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for i in range(99):
+        histogram.after_response(_event("GET", "/entity/guid/{guid}", 200, 0.02))
+    histogram.after_response(_event("GET", "/entity/guid/{guid}", 429, 3.0))
+    histogram.after_response(_event("POST", "/entity/bulk", 200, 0.3))
+
+    summary = histogram.summary()
+    entity = summary["GET /entity/guid/{guid}"]
+    assert(entity["count"] == 100)
+    assert(entity["errors"] == 1)
+    assert(entity["throttled"] == 1)
+    assert(entity["bytes_received"] == 2000)
+    assert(entity["p50"] == 0.025)
+    assert(entity["max"] == 3.0)
+    assert(entity["status_codes"] == {200: 99, 429: 1})
+    assert(summary["POST /entity/bulk"]["p99"] == 0.3)
+
+    histogram.reset()
+    assert(histogram.summary() == {})
+
+
+def test_json_lines_exporter():
+    stream = io.StringIO()
+    exporter = JsonLinesExporter(stream=stream)
+    exporter.after_response(_event("POST", "/entity/bulk", 200, 0.1))
+    exporter.after_response(_event("GET", "/lineage/{guid}", 404, 0.2))
+
+    lines = [json.loads(l) for l in stream.getvalue().splitlines()]
+    assert([l["route"] for l in lines] == ["/entity/bulk", "/lineage/{guid}"])
+    assert(lines[1]["status_code"] == 404)
+
+    with pytest.raises(ValueError):
+        JsonLinesExporter()
+
+
+class RecordingHook(RequestHook):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def before_request(self, event):
+        self.calls.append(("before", event.route))
+
+    def after_response(self, event):
+        self.calls.append(("after", event))
+
+
+def test_hooks_called_on_failed_request():
+    hook = RecordingHook()
+    # Nothing listens on port 1 so the request fails to connect
+    client = AtlasClient("http://127.0.0.1:1/api/atlas/v2", hooks=[hook])
+    assert(client.glossary.hooks == [hook])
+
+    with pytest.raises(requests.ConnectionError):
+        client.get_entity(guid="9d6c0e2a-3c9f-4f57-8b7e-0a3f6c1d2e4f")
+
+    assert(hook.calls[0] == ("before", "/entity/bulk"))
+    event = hook.calls[1][1]
+    assert(event.method == "GET")
+    assert(event.status_code is None)
+    assert(isinstance(event.error, requests.ConnectionError))
+    assert(event.latency is not None)
+
+
+class FailingHook(RequestHook):
+    def before_request(self, event):
+        raise RuntimeError("before")
+
+    def after_response(self, event):
+        raise RuntimeError("after")
+
+
+def test_failing_hooks_do_not_change_the_request():
+    hook = RecordingHook()
+    with FakeAtlasServer() as server:
+        client = server.atlas_client(hooks=[FailingHook(), hook])
+        assert("entityDefs" in client.get_all_typedefs())
+    assert([call for call, _ in hook.calls] == ["before", "after"])
+
+    # The connection error is raised rather than the hook's error
+    client = AtlasClient("http://127.0.0.1:1/api/atlas/v2", hooks=[FailingHook()])
+    with pytest.raises(requests.ConnectionError):
+        client.get_entity(guid="9d6c0e2a-3c9f-4f57-8b7e-0a3f6c1d2e4f")
+
+
+def test_hooks_reach_purview_sub_clients():
+    hook = RecordingHook()
+    client = PurviewClient("DEMO", hooks=[hook])
+    for sub_client in [client, client.glossary, client.collections, client.discovery]:
+        assert(sub_client.hooks == [hook])
+
+
+def test_retries_are_counted():
+    hook = RecordingHook()
+    with FakeAtlasServer() as server:
+        client = server.atlas_client(hooks=[hook])
+        server.inject(503, count=2, route="/types/typedefs")
+        _with_retries(client.get_all_typedefs, backoff=0)
+
+    events = [event for call, event in hook.calls if call == "after"]
+    assert([e.retries for e in events] == [0, 1, 2])
+    assert([e.status_code for e in events] == [503, 503, 200])
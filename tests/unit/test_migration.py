@@ -0,0 +1,150 @@
+import os
+import tempfile
+
+import pytest
+
+from pyapacheatlas.core.migration import CatalogMigration, iter_entity_guids
+from pyapacheatlas.core.util import AtlasException, _with_retries
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def _load_catalog(client, upload_tables, num_tables=6, num_columns=3):
+    """
+    Tables with columns that point to their table and processes between
+    neighboring tables.
+    """
+    tables = upload_tables(client, num_tables, columns=num_columns)
+    processes = [{
+        "typeName": "Process", "guid": str(-(1000 + t)),
+        "attributes": {
+            "name": f"p{t}", "qualifiedName": f"p{t}",
+            "inputs": [{"guid": tables[f"db.t{t}"], "typeName": "hive_table"}],
+            "outputs": [{"guid": tables[f"db.t{t + 1}"], "typeName": "hive_table"}]}
+    } for t in range(num_tables - 1)]
+    client.upload_entities(processes)
+
+
+def _load_glossary(server, terms):
+    server.store.glossaries["glossary-guid"] = {
+        "guid": "glossary-guid", "name": "Glossary", "qualifiedName": "Glossary"}
+    server.purview_client().glossary.upload_terms([
+        {"name": term, "anchor": {"glossaryGuid": "glossary-guid"}} for term in terms])
+    return {t["name"]: guid for guid, t in server.store.terms.items()}
+
+
+def _references_by_name(store):
+    """
+    The relationships of a catalog as qualified names so two catalogs can
+    be compared regardless of their guids.
+    """
+    names = {g: e["attributes"]["qualifiedName"] for g, e in store.entities.items()}
+    output = set()
+    for entity in store.entities.values():
+        qualified_name = entity["attributes"]["qualifiedName"]
+        table = entity.get("relationshipAttributes", {}).get("table")
+        if table:
+            output.add((qualified_name, "table", names[table["guid"]]))
+        for key in ["inputs", "outputs"]:
+            for ref in entity["attributes"].get(key) or []:
+                output.add((qualified_name, key, names[ref["guid"]]))
+        for meaning in entity.get("relationshipAttributes", {}).get("meanings") or []:
+            output.add((qualified_name, "meanings", store.terms[meaning["guid"]]["name"]))
+    return output
+
+
+def test_iter_entity_guids(upload_tables):
+    with FakeAtlasServer() as server:
+        client = server.purview_client()
+        _load_catalog(client, upload_tables)
+        for i, entity in enumerate(server.store.entities.values()):
+            entity["collectionId"] = f"collection{i % 3}"
+
+        guids = list(iter_entity_guids(client, page_size=4, max_results=6))
+        assert(sorted(guids) == sorted(server.store.entities))
+
+        atlas_guids = list(iter_entity_guids(
+            server.atlas_client(), type_names=["hive_table", "Process"], page_size=4))
+        assert(len(atlas_guids) == 11)
+
+
+def test_with_retries_skips_client_errors():
+    def failing(status_code):
+        calls.append(status_code)
+        error = AtlasException("failed")
+        error.status_code = status_code
+        raise error
+
+    for status_code, attempts in [(404, 1), (400, 1), (429, 3), (500, 3)]:
+        calls = []
+        with pytest.raises(AtlasException):
+            _with_retries(lambda: failing(status_code), max_retries=2, backoff=0)
+        assert(len(calls) == attempts)
+
+
+def test_catalog_migration(upload_tables):
+    with FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source.purview_client(), upload_tables)
+        source_terms = _load_glossary(source, ["term0", "term1"])
+        # term1 does not exist in the target so its assignment is dropped
+        _load_glossary(target, ["term0"])
+        tables = [g for g, e in source.store.entities.items() if e["typeName"] == "hive_table"]
+        for term in source_terms.values():
+            source.purview_client().glossary.assignTerm([{"guid": tables[0]}], termGuid=term)
+
+        migration = CatalogMigration(
+            source.purview_client(), target.atlas_client(),
+            window_size=7, batch_size=3, max_workers=3, page_size=5)
+        stats = migration.run()
+
+        assert(len(target.store.entities) == len(source.store.entities) == 29)
+        assert(stats.written == 29 and stats.failed == 0)
+        assert(stats.deferred > 0 and stats.fixed == stats.deferred)
+        assert(stats.unresolved_references == 1)
+        assert(_references_by_name(target.store) ==
+               _references_by_name(source.store) - {("db.t0", "meanings", "term1")})
+        assert(not set(source.store.entities) & set(target.store.entities))
+
+
+def test_catalog_migration_resumes(upload_tables):
+    with tempfile.TemporaryDirectory() as folder:
+        state_path = os.path.join(folder, "migration.db")
+        with FakeAtlasServer() as source, FakeAtlasServer() as target:
+            _load_catalog(source.purview_client(), upload_tables)
+            target.inject(500, count=4, route="/entity/bulk")
+
+            first = CatalogMigration(
+                source.purview_client(), target.atlas_client(),
+                state_path=state_path, batch_size=4, max_workers=2, max_retries=0)
+            first_stats = first.run()
+            first.state.close()
+            assert(first_stats.failed > 0)
+
+            second = CatalogMigration(
+                source.purview_client(), target.atlas_client(),
+                state_path=state_path, batch_size=4, max_workers=2, max_retries=0)
+            second_stats = second.run()
+            second.state.close()
+
+            assert(second_stats.skipped == first_stats.written)
+            assert(second_stats.failed == 0)
+            assert(len(target.store.entities) == 29)
+            assert(_references_by_name(target.store) == _references_by_name(source.store))
+
+
+def test_catalog_migration_ignores_deleted_source_entities(upload_tables):
+    with FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source.purview_client(), upload_tables)
+        guids = list(source.store.entities)
+        # An entity deleted from the source after it was enumerated
+        guids.insert(3, "deleted-guid")
+
+        migration = CatalogMigration(
+            source.purview_client(), target.atlas_client(),
+            window_size=7, batch_size=3, max_workers=3)
+        stats = migration.run(guids)
+
+        assert(stats.missing == 1 and stats.failed == 0)
+        assert(stats.written == 29)
+        assert(stats.deferred > 0 and stats.fixed == stats.deferred)
+        assert(migration.state.deferred_count == 0)
+        assert(_references_by_name(target.store) == _references_by_name(source.store))
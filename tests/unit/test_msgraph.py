@@ -0,0 +1,124 @@
+import os
+import re
+from urllib.parse import unquote
+
+from pyapacheatlas.core.msgraph import ContactsResolver, MsGraphClient
+from pyapacheatlas.readers.reader import Reader, ReaderConfiguration
+
+
+def _fake_graph(users, throttle_once=None):
+    """
+    An MsGraphClient whose batch answers `$filter` in clauses from the
+    users, throttling the requests for the throttle_once values once.
+    """
+    throttle_once = set(throttle_once or [])
+    batches = []
+
+    def fake_batch(graph_requests, api_version="v1.0"):
+        assert(len(graph_requests) <= 20)
+        batches.append(graph_requests)
+        responses = {}
+        for req in graph_requests:
+            field, values = re.match(
+                r"/users\?\$filter=(\w+) in \((.*)\)&", unquote(req["url"])).groups()
+            values = [v.strip("'").lower() for v in values.split(",")]
+            assert(len(values) <= 15)
+            if throttle_once.intersection(values):
+                throttle_once.difference_update(values)
+                responses[req["id"]] = {"id": req["id"], "status": 429,
+                                        "headers": {"Retry-After": "0"}}
+                continue
+            responses[req["id"]] = {"id": req["id"], "status": 200, "body": {
+                "value": [u for u in users if u[field].lower() in values]}}
+        return responses
+
+    client = MsGraphClient(None)
+    client.batch = fake_batch
+    return client, batches
+
+
+def test_contacts_resolver_caches_on_disk():
+    temp_path = "./temp_contacts_cache.json"
+    users = [{"id": f"oid{i}", "userPrincipalName": f"user{i}", "mail": f"mail{i}"}
+             for i in range(45)]
+    graph, batches = _fake_graph(users, throttle_once=["user3"])
+    resolver = ContactsResolver(graph, cache_path=temp_path)
+
+    try:
+        results = resolver.resolve_many(
+            [f"user{i}" for i in range(45)] + ["user0"])
+        assert(results == {f"user{i}": f"oid{i}" for i in range(45)})
+        # 45 contacts are one batch of three chunks plus one retry of the
+        # throttled chunk
+        assert(len(batches) == 2)
+
+        # Cached in memory and on disk
+        assert(resolver("user10") == "oid10")
+        assert(len(batches) == 2)
+        reloaded = ContactsResolver(_fake_graph([])[0], cache_path=temp_path)
+        assert(reloaded.resolve_many(["user1", "user2"]) ==
+               {"user1": "oid1", "user2": "oid2"})
+
+        # Misses are returned as None rather than raised
+        assert(resolver.resolve_many(["user1", "unknown"]) ==
+               {"user1": "oid1", "unknown": None})
+        assert(resolver.unresolved == set(["unknown"]))
+    finally:
+        os.remove(temp_path)
+
+
+def test_reader_resolves_distinct_contacts_once():
+    json_rows = [
+        {"typeName": "demoType", "name": f"entity{i}",
+         "qualifiedName": f"entity{i}", "experts": "user0;user1:info",
+         "owners": "user2"}
+        for i in range(10)
+    ]
+    graph, batches = _fake_graph([
+        {"id": f"oid{i}", "userPrincipalName": f"user{i}", "mail": f"mail{i}"}
+        for i in range(2)])
+    resolver = ContactsResolver(graph)
+
+    results = Reader(ReaderConfiguration()).parse_bulk_entities(
+        json_rows, contacts_func=resolver)
+
+    assert(len(batches) == 1)
+    assert(resolver.unresolved == set(["user2"]))
+    for entity in results["entities"]:
+        assert(entity["contacts"] == {
+            "Expert": [{"id": "oid0"}, {"id": "oid1", "info": "info"}],
+            "Owner": []})
+
+    calls = []
+
+    def counting_func(contact):
+        calls.append(contact)
+        return contact + "_abc"
+
+    Reader(ReaderConfiguration()).parse_bulk_entities(
+        json_rows, contacts_func=counting_func)
+    assert(sorted(calls) == ["user0", "user1", "user2"])
+
+
+def test_msgraph_resolve_many_in_filters_and_negative_cache():
+    users = [{"id": f"oid{i}", "userPrincipalName": f"User{i}@contoso.com",
+              "mail": f"mail{i}@contoso.com"} for i in range(200)]
+    client, batches = _fake_graph(users)
+
+    identities = ([f"user{i}@contoso.com" for i in range(100)] +
+                  [f"mail{i}@contoso.com" for i in range(100, 150)] +
+                  ["missing@contoso.com", "user0@contoso.com"])
+    results = client.resolve_many(identities)
+
+    assert(len(results) == 151)
+    assert(results["user0@contoso.com"] == "oid0")
+    assert(results["mail120@contoso.com"] == "oid120")
+    assert(results["missing@contoso.com"] is None)
+    assert(client.unresolved == set(["missing@contoso.com"]))
+    # 151 identities are 11 chunks of 15, two requests each, in two batches
+    assert(len(batches) == 2)
+
+    # Hits and misses are both served from the cache
+    assert(client.resolve_many(["USER5@contoso.com", "missing@contoso.com"]) ==
+           {"USER5@contoso.com": "oid5", "missing@contoso.com": None})
+    assert(len(batches) == 2)
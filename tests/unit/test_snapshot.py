@@ -0,0 +1,165 @@
+import os
+import tempfile
+
+import pytest
+
+from pyapacheatlas.core.snapshot import iter_json_lines, read_manifest
+from pyapacheatlas.core.util import AtlasException
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+def _load_catalog(server, client, upload_tables):
+    client.upload_typedefs(
+        entityDefs=[{"name": "hive_table", "superTypes": ["DataSet"], "attributeDefs": []}],
+        classificationDefs=[{"name": "PII", "attributeDefs": []}])
+    guids = upload_tables(client, 5, columns=2, classifications=[{"typeName": "PII"}])
+    server.store.glossaries["glossary-guid"] = {
+        "guid": "glossary-guid", "name": "Glossary", "qualifiedName": "Glossary"}
+    client.glossary.upload_terms([
+        {"name": f"term{i}", "anchor": {"glossaryGuid": "glossary-guid"}}
+        for i in range(3)])
+    term_guid = next(iter(server.store.terms))
+    client.glossary.assignTerm(
+        [{"guid": guids["db.t0"]}, {"guid": guids["db.t1"]}], termGuid=term_guid)
+
+
+def _catalog_by_name(store):
+    """
+    The entities of a catalog with their table, classifications, and terms
+    by name so two catalogs can be compared regardless of their guids.
+    """
+    names = {g: e["attributes"]["qualifiedName"] for g, e in store.entities.items()}
+    output = {}
+    for entity in store.entities.values():
+        relationships = entity.get("relationshipAttributes") or {}
+        table = relationships.get("table")
+        output[names[entity["guid"]]] = (
+            names[table["guid"]] if table else None,
+            sorted(c["typeName"] for c in entity.get("classifications") or []),
+            sorted(store.terms[m["guid"]]["name"] for m in relationships.get("meanings") or [])
+        )
+    return output
+
+
+def test_export_snapshot(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, FakeAtlasServer() as server:
+        client = server.purview_client()
+        _load_catalog(server, client, upload_tables)
+
+        with pytest.raises(ValueError):
+            read_manifest(folder)
+
+        manifest = client.export_snapshot(folder, shard_size=4, fetch_size=3)
+        assert(read_manifest(folder) == manifest)
+        assert(manifest["entities"]["count"] == 15)
+        assert(manifest["entities"]["type_counts"] == {"hive_table": 5, "hive_column": 10})
+        assert([s["count"] for s in manifest["entities"]["shards"]] == [4, 4, 4, 3])
+        assert(manifest["typedefs"]["counts"]["classificationDefs"] == 1)
+        assert(manifest["terms"]["count"] == 3)
+
+        exported = {}
+        for shard in manifest["entities"]["shards"]:
+            for entity in iter_json_lines(os.path.join(folder, shard["file"])):
+                exported[entity["guid"]] = entity
+        assert(exported == server.store.entities)
+
+        terms = list(iter_json_lines(os.path.join(folder, manifest["terms"]["file"])))
+        assert(sorted(t["name"] for t in terms) == ["term0", "term1", "term2"])
+
+
+def test_import_snapshot(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, \
+            FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source, source.purview_client(), upload_tables)
+        source.purview_client().export_snapshot(folder, shard_size=4)
+
+        client = target.purview_client()
+        client.upload_typedefs(entityDefs=[
+            {"name": "hive_table", "superTypes": ["DataSet"], "attributeDefs": []}])
+        stats = client.import_snapshot(folder, batch_size=2, window_size=3)
+
+        assert(stats.typedefs == 1 and stats.terms == 3)
+        assert(stats.written == 15 and stats.failed == 0)
+        assert(stats.deferred > 0 and stats.fixed == stats.deferred)
+        assert(stats.classified == 5 and stats.assigned_terms == 2)
+        assert("PII" in target.store.typedefs["classificationDefs"])
+        assert(_catalog_by_name(target.store) == _catalog_by_name(source.store))
+
+
+def test_import_snapshot_resumes(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, \
+            FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source, source.purview_client(), upload_tables)
+        source.purview_client().export_snapshot(folder, shard_size=4)
+        state_path = os.path.join(folder, "import.db")
+
+        target.inject(500, count=2, route="/entity/bulk")
+        first = target.purview_client().import_snapshot(
+            folder, state_path=state_path, batch_size=2, max_retries=0)
+        assert(first.failed > 0)
+
+        second = target.purview_client().import_snapshot(
+            folder, state_path=state_path, batch_size=2, max_retries=0)
+        assert(second.failed == 0 and second.unapplied == 0)
+        assert(second.skipped_shards > 0 and second.typedefs == 0)
+        assert(first.written + second.written == 15)
+        assert(_catalog_by_name(target.store) == _catalog_by_name(source.store))
+
+
+def test_import_snapshot_repeats_unapplied_shards(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, \
+            FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source, source.purview_client(), upload_tables)
+        source.purview_client().export_snapshot(folder, shard_size=4)
+        state_path = os.path.join(folder, "import.db")
+
+        target.inject(500, count=1000, route="/classification", method="POST")
+        first = target.purview_client().import_snapshot(
+            folder, state_path=state_path, max_retries=0)
+        assert(first.unapplied == 5 and first.classified == 0)
+        target.clear_faults()
+
+        second = target.purview_client().import_snapshot(
+            folder, state_path=state_path, max_retries=0)
+        assert(second.unapplied == 0 and second.classified == 5)
+        # Term assignments were complete so only the classifications repeat
+        assert(second.assigned_terms == 0)
+        assert(_catalog_by_name(target.store) == _catalog_by_name(source.store))
+
+
+def test_export_snapshot_records_missing_entities(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, \
+            FakeAtlasServer() as source, FakeAtlasServer() as target:
+        client = source.purview_client()
+        _load_catalog(source, client, upload_tables)
+
+        # One chunk of three entities is throttled and not retried one by one
+        source.inject(429, route="/entity/bulk", method="GET", retry_after=0)
+        requests_before = source.request_count("GET", "/entity/bulk")
+        manifest = client.export_snapshot(folder, fetch_size=3, max_retries=0)
+        assert(source.request_count("GET", "/entity/bulk") == requests_before + 5)
+        assert(manifest["entities"]["count"] == 12)
+        assert(manifest["entities"]["missing"] == 3 and manifest["entities"]["deleted"] == 0)
+        assert(len(manifest["entities"]["missing_guids"]) == 3)
+
+        with pytest.warns(UserWarning, match="missing 3 entities"):
+            target.purview_client().import_snapshot(folder)
+
+
+def test_import_snapshot_stops_on_target_read_errors(upload_tables):
+    with tempfile.TemporaryDirectory() as folder, \
+            FakeAtlasServer() as source, FakeAtlasServer() as target:
+        _load_catalog(source, source.purview_client(), upload_tables)
+        source.purview_client().export_snapshot(folder, shard_size=20)
+        state_path = os.path.join(folder, "import.db")
+
+        # Existing classifications are read from the target after the entities
+        target.inject(500, route="/entity/bulk", method="GET")
+        with pytest.raises(AtlasException):
+            target.purview_client().import_snapshot(
+                folder, state_path=state_path, max_retries=0)
+
+        stats = target.purview_client().import_snapshot(
+            folder, state_path=state_path, max_retries=0)
+        assert(stats.unapplied == 0 and stats.classified == 5)
+        assert(_catalog_by_name(target.store) == _catalog_by_name(source.store))
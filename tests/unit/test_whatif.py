@@ -1,6 +1,8 @@
+import pytest
 
 from pyapacheatlas.scaffolding import column_lineage_scaffold
 from pyapacheatlas.core import AtlasEntity
+from pyapacheatlas.core.util import AtlasException
 from pyapacheatlas.core.whatif import WhatIfValidator
 
 whatif = WhatIfValidator(column_lineage_scaffold("demo"))
@@ -72,13 +74,15 @@ def test_would_it_overwrite():
 def test_whatif_validation():
 
     expected = {
-        "counts":{"TypeDoesNotExist":1, "UsingInvalidAttributes":1, "MissingRequiredAttributes":1},
+        "counts":{"TypeDoesNotExist":1, "UsingInvalidAttributes":1, "MissingRequiredAttributes":1,
+            "UsingInvalidRelationshipAttributes":0, "InvalidEnumValues":0},
         "total":3,
         "values":{
             "TypeDoesNotExist":[-101], 
             "UsingInvalidAttributes":{-100:{"foo"}}, 
-            "MissingRequiredAttributes":{-98:{"req_attrib"}
-            }
+            "MissingRequiredAttributes":{-98:{"req_attrib"}},
+            "UsingInvalidRelationshipAttributes":{},
+            "InvalidEnumValues":{}
         }
     }
 
@@ -106,4 +110,169 @@ def test_whatif_validation():
     results = local_what_if.validate_entities(entities)
     
     assert(set(local_what_if.entity_required_fields["demo_table"]) == set(["req_attrib","name", "qualifiedName"]))
-    assert(results == expected)
\ No newline at end of file
+    assert(results == expected)
+
+def test_inherited_attributes():
+    type_defs = {"entityDefs":[
+        {'category': 'ENTITY', 'name': 'base_table', 'superTypes': ['DataSet'],
+        'attributeDefs': [{"name":"base_req","isOptional":False}, {"name":"base_opt","isOptional":True}]},
+        {'category': 'ENTITY', 'name': 'mid_table', 'superTypes': ['base_table'],
+        'attributeDefs': [{"name":"mid_opt","isOptional":True}]},
+        {'category': 'ENTITY', 'name': 'child_table', 'superTypes': ['mid_table'],
+        'attributeDefs': []}
+    ]}
+
+    local_what_if = WhatIfValidator(type_defs)
+
+    entities = [
+        AtlasEntity("dummy1", "child_table", "dummy1", -99, attributes = {"base_req":"1", "mid_opt":"2", "description":"abc"}).to_json(),
+        AtlasEntity("dummy2", "child_table", "dummy2", -100, attributes = {"base_opt":"1", "foo":"bar"}).to_json()
+    ]
+
+    invalid = [local_what_if.entity_has_invalid_attributes(e) for e in entities]
+    missing = [local_what_if.entity_missing_attributes(e) for e in entities]
+
+    assert(invalid == [False, {"foo"}])
+    assert(missing == [False, {"base_req"}])
+
+
+def test_invalid_relationship_attributes_and_enums():
+    type_defs = {
+        "entityDefs":[
+            {'category': 'ENTITY', 'name': 'root_type', 'superTypes': [],
+            'attributeDefs': [{"name":"name","isOptional":False},
+                {"name":"status","typeName":"demo_status","isOptional":True}],
+            'relationshipAttributeDefs': [{"name":"meanings"}]},
+            {'category': 'ENTITY', 'name': 'demo_table', 'superTypes': ['root_type'],
+            'attributeDefs': []},
+            {'category': 'ENTITY', 'name': 'partial_table', 'superTypes': ['DataSet'],
+            'attributeDefs': []}
+        ],
+        "relationshipDefs":[
+            {"name":"demo_table_columns", "endDef1":{"type":"demo_table", "name":"columns"},
+            "endDef2":{"type":"demo_column", "name":"table"}}
+        ],
+        "enumDefs":[
+            {"name":"demo_status", "elementDefs":[{"value":"ACTIVE", "ordinal":0}, {"value":"RETIRED", "ordinal":1}]}
+        ]
+    }
+
+    local_what_if = WhatIfValidator(type_defs)
+
+    valid = AtlasEntity("dummy1", "demo_table", "dummy1", -99,
+        attributes={"status":"ACTIVE"}, relationshipAttributes={"columns":[], "meanings":[]}).to_json()
+    invalid = AtlasEntity("dummy2", "demo_table", "dummy2", -100,
+        attributes={"status":"UNKNOWN"}, relationshipAttributes={"foo":{}}).to_json()
+    # The DataSet super type is not defined so relationships can't be checked
+    partial = AtlasEntity("dummy3", "partial_table", "dummy3", -101,
+        relationshipAttributes={"foo":{}}).to_json()
+
+    assert(local_what_if.entity_has_invalid_relationship_attributes(valid) == False)
+    assert(local_what_if.entity_has_invalid_relationship_attributes(invalid) == {"foo"})
+    assert(local_what_if.entity_has_invalid_relationship_attributes(partial) == False)
+    assert(local_what_if.entity_has_invalid_enum_values(valid) == False)
+    assert(local_what_if.entity_has_invalid_enum_values(invalid) == {"status":["UNKNOWN"]})
+
+    results = local_what_if.validate_entities(iter([valid, invalid, partial]))
+
+    assert(results["total"] == 2)
+    assert(results["values"]["UsingInvalidRelationshipAttributes"] == {-100:{"foo"}})
+    assert(results["values"]["InvalidEnumValues"] == {-100:{"status":["UNKNOWN"]}})
+
+
+def test_whatif_validation_multiprocess():
+    demo_table_type = {"entityDefs":[{'category': 'ENTITY', 'name': 'demo_table', 
+    'attributeDefs': [{"name":"req_attrib","isOptional":False}], 
+    'relationshipAttributeDefs': [], 'superTypes': ['DataSet']}]}
+
+    entities = [
+        AtlasEntity(f"dummy{i}", "demo_table", f"dummy{i}", -1*i,
+            attributes = {} if i % 2 else {"req_attrib":"1"}).to_json()
+        for i in range(1, 51)
+    ]
+
+    local_what_if = WhatIfValidator(demo_table_type)
+
+    single = local_what_if.validate_entities(entities)
+    multi = local_what_if.validate_entities(entities, processes=2, chunk_size=7)
+
+    assert(single == multi)
+    assert(multi["counts"]["MissingRequiredAttributes"] == 25)
+
+
+def _atlas_error(status_code, message):
+    error = AtlasException(message)
+    error.status_code = status_code
+    return error
+
+
+class _FakeClient():
+    """
+    Answers the type def and entity lookups used by WhatIfValidator.from_client.
+    """
+    def __init__(self, typedefs, entities):
+        self.typedefs = typedefs
+        self.entities = entities
+        self.typedef_calls = []
+        self.entity_calls = []
+
+    def get_typedef(self, name=None, **kwargs):
+        self.typedef_calls.append(name)
+        if name == "throttled":
+            raise _atlas_error(429, "ATLAS-429-00-001")
+        if name not in self.typedefs:
+            raise _atlas_error(404, "ATLAS-404-00-001")
+        return self.typedefs[name]
+
+    def get_entity(self, qualifiedName=None, typeName=None, **kwargs):
+        self.entity_calls.append(list(qualifiedName))
+        found = [e for e in self.entities if e["typeName"] == typeName and
+            e["attributes"]["qualifiedName"] in qualifiedName]
+        if len(found) != len(qualifiedName):
+            raise _atlas_error(404, "ATLAS-404-00-009")
+        return {"entities": found}
+
+
+def test_whatif_from_client():
+    typedefs = {
+        "Referenceable": {"category": "ENTITY", "name": "Referenceable", "superTypes": [],
+            "attributeDefs": [{"name": "qualifiedName", "typeName": "string", "isOptional": False}]},
+        "DataSet": {"category": "ENTITY", "name": "DataSet", "superTypes": ["Referenceable"],
+            "attributeDefs": [{"name": "name", "typeName": "string", "isOptional": False}]},
+        "demo_table": {"category": "ENTITY", "name": "demo_table", "superTypes": ["DataSet"],
+            "attributeDefs": [{"name": "status", "typeName": "demo_status", "isOptional": True},
+                {"name": "db", "typeName": "demo_db", "isOptional": True}]},
+        "demo_status": {"category": "ENUM", "name": "demo_status",
+            "elementDefs": [{"value": "ACTIVE", "ordinal": 0}]},
+        "demo_db": {"category": "ENTITY", "name": "demo_db", "superTypes": ["DataSet"]}
+    }
+    existing = [
+        AtlasEntity("exists", "demo_table", "exists", "abc-123").to_json()
+    ]
+    client = _FakeClient(typedefs, existing)
+
+    entities = [
+        AtlasEntity("exists", "demo_table", "exists", -1, attributes={"status": "ACTIVE"}),
+        AtlasEntity("new", "demo_table", "new", -2, attributes={"status": "NOPE"}).to_json(),
+        AtlasEntity("missing", "not_a_type", "missing", -3).to_json()
+    ]
+
+    local_what_if = WhatIfValidator.from_client(client, entities, batch_size=10)
+
+    assert(set(e["name"] for e in local_what_if.entity_defs) == set(["demo_table", "DataSet", "Referenceable"]))
+    assert(set(local_what_if.entity_valid_fields["demo_table"]) == set(["qualifiedName", "name", "status", "db"]))
+    assert(local_what_if.existing_entities == set(["exists"]))
+    # The failed batch is split to find the one existing entity
+    assert(client.entity_calls == [["exists", "new"], ["exists"], ["new"]])
+    # Entity typed attributes are only checked for enums, not walked
+    assert(client.typedef_calls.count("demo_db") == 1)
+
+    results = local_what_if.validate_entities(
+        [e if isinstance(e, dict) else e.to_json() for e in entities])
+    assert(results["values"]["TypeDoesNotExist"] == [-3])
+    assert(results["values"]["InvalidEnumValues"] == {-2: {"status": ["NOPE"]}})
+
+    # Only a missing type or entity is treated as a miss
+    with pytest.raises(AtlasException):
+        WhatIfValidator.from_client(
+            client, [AtlasEntity("t", "throttled", "t", -4).to_json()])
@@ -0,0 +1,91 @@
+import pytest
+import requests
+
+from pyapacheatlas.core import AtlasEntity, AtlasProcess, EntityTypeDef
+from pyapacheatlas.core.instrumentation import LatencyHistogram
+from pyapacheatlas.core.util import AtlasException
+from pyapacheatlas.testing import FakeAtlasServer
+
+
+@pytest.fixture
+def server():
+    with FakeAtlasServer(seed=0) as fake:
+        yield fake
+
+
+def _upload_lineage(client):
+    source = AtlasEntity("source", "DataSet", "fake://source", guid=-1)
+    target = AtlasEntity("target", "DataSet", "fake://target", guid=-2)
+    process = AtlasProcess("proc", "Process", "fake://proc",
+                           inputs=[source], outputs=[target], guid=-3)
+    return client.upload_entities([source, target, process])
+
+
+def test_entities_and_lineage(server):
+    client = server.atlas_client()
+    results = _upload_lineage(client)
+    assert(len(results["mutatedEntities"]["CREATE"]) == 3)
+    source_guid = results["guidAssignments"]["-1"]
+
+    entity = client.get_entity(qualifiedName="fake://target", typeName="DataSet")
+    assert(entity["entities"][0]["attributes"]["name"] == "target")
+
+    lineage = client.get_entity_lineage(source_guid, direction="OUTPUT")
+    assert(len(lineage["guidEntityMap"]) == 3)
+    assert({"fromEntityId": source_guid, "toEntityId": results["guidAssignments"]["-3"]}
+           in lineage["relations"])
+
+    # Uploading again updates the existing entities
+    again = _upload_lineage(client)
+    assert(len(again["mutatedEntities"]["UPDATE"]) == 3)
+    assert(again["guidAssignments"]["-1"] == source_guid)
+
+    client.delete_entity(guid=source_guid)
+    with pytest.raises(AtlasException):
+        client.get_entity(source_guid)
+
+
+def test_typedefs_glossary_search_and_collections(server):
+    client = server.purview_client()
+    client.upload_typedefs(entityDefs=[EntityTypeDef("fake_table")])
+    updated = client.upload_typedefs(
+        entityDefs=[EntityTypeDef("fake_table")], force_update=True)
+    assert(updated["entityDefs"][0]["version"] == 2)
+    assert(client.get_typedef(name="fake_table")["name"] == "fake_table")
+
+    server.store.glossaries["g1"] = {"guid": "g1", "name": "Glossary"}
+    assert(client.glossary.get_glossary()["guid"] == "g1")
+
+    client.collections.create_or_update_collection("sales", "Sales", "root")
+    client.collections.upload_entities(
+        [AtlasEntity("orders", "DataSet", "fake://orders", guid=-1)], "sales")
+    results = list(client.discovery.search_entities(
+        "orders", search_filter={"collectionId": "sales"}))
+    assert([r["qualifiedName"] for r in results] == ["fake://orders"])
+    assert([c["name"] for c in client.collections.list_collections()] == ["sales"])
+
+
+def test_fault_injection(server):
+    histogram = LatencyHistogram()
+    client = server.atlas_client(hooks=[histogram], compress_requests=True,
+                                 compression_threshold=0)
+    server.inject(429, count=2, route="/entity/bulk", retry_after=7)
+
+    for _ in range(2):
+        with pytest.raises(requests.RequestException):
+            _upload_lineage(client)
+    # The gzip compressed upload is accepted once the faults are used up
+    _upload_lineage(client)
+
+    stats = histogram.summary()["POST /entity/bulk"]
+    assert(stats["throttled"] == 2)
+    assert(stats["status_codes"] == {429: 2, 200: 1})
+    assert(server.request_count("POST", "/entity/bulk") == 3)
+
+    server.inject(503)
+    response = requests.get(server.atlas_endpoint + "/types/typedefs")
+    assert(response.status_code == 503)
+
+    server.inject(429, retry_after=7)
+    response = requests.get(server.atlas_endpoint + "/types/typedefs")
+    assert(response.headers["Retry-After"] == "7")